@@ -1,6 +1,10 @@
 # Epistemic Audit Engine - Core Configuration
 # Strict Constants - Do NOT modify without Regression Testing
 
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
 # --- Alignment Thresholds ---
 ALIGN_THRESH_SIM_HIGH = 0.85
 ALIGN_THRESH_SIM_MED = 0.75
@@ -62,3 +66,12 @@ ENABLE_WEAK_ACCUMULATION = True        # Multiple weak supports upgrade to UNCER
 COREF_CONFIDENCE_DISCOUNT = 0.9        # Applied to coreference-resolved entities
 COREF_MIN_CONFIDENCE = 0.70            # Minimum confidence for coreference source
 COREF_DOMINANCE_GAP = 0.3              # Required frequency gap for dominance
+
+# --- Wikidata HTTP Cache / Retries ---
+# Persistent cache for wbgetentities responses; only used when requests-cache is installed
+ENABLE_WIKIDATA_HTTP_CACHE = True
+# Absolute, so every working directory and worker process shares one file
+WIKIDATA_HTTP_CACHE_NAME = str(PROJECT_ROOT / "wikidata_cache")  # SQLite file: wikidata_cache.sqlite
+WIKIDATA_HTTP_CACHE_EXPIRE_S = 86400
+WIKIDATA_HTTP_RETRIES = 3             # Retries on 5xx responses; connect errors retry once, read timeouts never
+WIKIDATA_HTTP_BACKOFF_S = 0.3         # urllib3 exponential backoff factor
@@ -6,13 +6,18 @@ import threading
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 try:
     import fcntl  # type: ignore
 except Exception:  # pragma: no cover - non-POSIX fallback
     fcntl = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -58,6 +63,33 @@ def _sha256_text(value: str) -> str:
     return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
 
+def _orjson_default(value: Any) -> Any:
+    # Match json.dumps(default=str): float subclasses (numpy float64) stay numbers
+    if isinstance(value, float):
+        return float(value)
+    return str(value)
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_APPEND_NEWLINE
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+def _encode_record_line(record: Dict[str, Any]) -> bytes:
+    """One JSONL line (UTF-8, newline-terminated) for an audit record."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(record, default=_orjson_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles them
+            pass
+    return (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
 def build_audit_record(
     input_text: str,
     mode: Optional[str],
@@ -88,13 +120,21 @@ def build_audit_record(
 
 
 class AuditRunLogger:
-    def __init__(self, log_path: Path = DEFAULT_LOG_PATH):
+    def __init__(self, log_path: Path = DEFAULT_LOG_PATH, batch_size: int = 1):
         self.log_path = Path(log_path)
+        # batch_size > 1 buffers log_run records and appends them under a single
+        # open/lock/fsync; callers using it must flush() when done.
+        self.batch_size = max(1, int(batch_size))
+        self._pending: List[Dict[str, Any]] = []
 
     def append_record(self, record: Dict[str, Any]) -> None:
+        self.append_records([record])
+
+    def append_records(self, records: Iterable[Dict[str, Any]]) -> None:
+        encoded = b"".join(_encode_record_line(record) for record in records)
+        if not encoded:
+            return
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
-        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
-        encoded = line.encode("utf-8")
 
         with _APPEND_LOCK:
             with open(self.log_path, "ab") as handle:
@@ -122,6 +162,20 @@ class AuditRunLogger:
                 result=result,
                 extra_metadata=extra_metadata,
             )
-            self.append_record(record)
+            if self.batch_size == 1:
+                self.append_record(record)
+                return
+            self._pending.append(record)
+            if len(self._pending) >= self.batch_size:
+                self.flush()
         except Exception:
             logger.exception("Failed to append audit run log.")
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        try:
+            self.append_records(pending)
+        except Exception:
+            logger.exception("Failed to append %d buffered audit run logs.", len(pending))
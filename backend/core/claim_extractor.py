@@ -20,6 +20,7 @@ class ClaimExtractor:
         self.TEMPORAL_SPECIFICITY_REGEX = r"\b(1\d{3}|20\d{2})\b|January|February|March|April|May|June|July|August|September|October|November|December"
         self.WEAK_MODALS = {"could", "might", "may", "seem", "appear"}
         self.STRONG_MODALS = {"was", "is", "are", "were", "will", "must", "definitely"}
+        self._temporal_specificity_re = re.compile(self.TEMPORAL_SPECIFICITY_REGEX)
         
         # Phase 1 Epistemic Hardening
         self.EVALUATIVE_ADJECTIVES = {
@@ -777,26 +778,27 @@ class ClaimExtractor:
         Computes hedging, absolutism, specificity, and modal strength.
         """
         text_lower = sentence_text.lower()
+        # Whitespace tokens, split once; the marker sets below are matched against it
+        words = set(text_lower.split())
         
         # 1. Hedging
-        hedging_count = sum(1 for term in self.HEDGING_TERMS if term in text_lower.split())
+        hedging_count = len(self.HEDGING_TERMS & words)
         hedging_score = min(1.0, hedging_count * 0.5) # Simple heuristic mapping
         
         # 2. Absolutism
-        absolutism_count = sum(1 for term in self.ABSOLUTISM_TERMS if term in text_lower.split())
+        absolutism_count = len(self.ABSOLUTISM_TERMS & words)
         absolutism_score = min(1.0, absolutism_count * 0.5)
         
         # 3. Temporal Specificity
-        # Check for dates
-        matches = re.findall(self.TEMPORAL_SPECIFICITY_REGEX, sentence_text)
-        temporal_score = 1.0 if matches else 0.0
+        # Check for dates (existence only, so stop at the first match)
+        temporal_score = 1.0 if self._temporal_specificity_re.search(sentence_text) else 0.0
         if "recently" in text_lower or "long ago" in text_lower:
             temporal_score = 0.2
             
         # 4. Modal Strength
         # Check verbs in the sentence
         modal_score = 1.0 # Default strong
-        if any(w in text_lower.split() for w in self.WEAK_MODALS):
+        if not self.WEAK_MODALS.isdisjoint(words):
             modal_score = 0.5
         
         return {
@@ -1,13 +1,14 @@
 from typing import Dict, Any, List, Set, Optional
 import re
 import logging
-import uuid
 from .nli_engine import NLIEngine
 from .hallucination_detector import HallucinationDetector
 from .alignment_scorer import AlignmentScorer
 from .hallucination_attributor import HallucinationAttributor
 from .property_mapper import PropertyMapper
 from .wikidata_retriever import WikidataRetriever
+from .evidence_ids import evidence_uuid
+from .entity_context import RESOLVED_STATUSES
 
 logger = logging.getLogger(__name__)
 
@@ -458,7 +459,7 @@ class ClaimVerifier:
 
             # 2. Asserted & Resolved Check
             is_asserted = claim.get("epistemic_status", "ASSERTED") == "ASSERTED"
-            is_resolved = claim.get("subject_entity", {}).get("resolution_status") in ["RESOLVED", "RESOLVED_SOFT", "RESOLVED_COREF"]
+            is_resolved = claim.get("subject_entity", {}).get("resolution_status") in RESOLVED_STATUSES
 
             if target_prop and is_asserted and is_resolved:
                 # 3. Scan Wikidata Evidence for Property Match
@@ -952,7 +953,7 @@ class ClaimVerifier:
         positive_properties: Set[str],
     ) -> Optional[Dict[str, Any]]:
         resolution_status = claim.get("subject_entity", {}).get("resolution_status")
-        if resolution_status not in {"RESOLVED", "RESOLVED_SOFT", "RESOLVED_COREF"}:
+        if resolution_status not in RESOLVED_STATUSES:
             return None
 
         prop = evidence_item.get("property")
@@ -1234,8 +1235,7 @@ class ClaimVerifier:
         entity_id = evidence_item.get("entity_id", "")
         prop = evidence_item.get("property", "")
         value = evidence_item.get("value", "")
-        unique_str = f"WIKIDATA:{entity_id}:{prop}:{value}"
-        return str(uuid.uuid5(uuid.NAMESPACE_OID, unique_str))
+        return evidence_uuid(f"WIKIDATA:{entity_id}:{prop}:{value}")
         
     def _temporal_compatible(self, claim_val: str, ev_val: str) -> bool:
         """
@@ -28,12 +28,22 @@ Usage:
         # Use result.entity_id, result.canonical_name, etc.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple
+from collections import Counter
 from dataclasses import dataclass, field
+from types import MappingProxyType
 import re
+import sys
 
 
-@dataclass
+# Statuses that count as a resolved entity (RESOLVED_COREF since v1.4)
+RESOLVED_STATUSES = frozenset({"RESOLVED", "RESOLVED_SOFT", "RESOLVED_COREF"})
+
+# Resolution statuses eligible for document-level tracking
+_REGISTERABLE_STATUSES = frozenset({"RESOLVED", "RESOLVED_SOFT"})
+
+
+@dataclass(slots=True)
 class EntityMention:
     """
     Represents a single mention of a named entity in the document.
@@ -46,7 +56,7 @@ class EntityMention:
     sources: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class CorefResolution:
     """
     Result of coreference resolution with full audit trail.
@@ -112,6 +122,14 @@ class EntityContext:
         ],
     }
 
+    # Flattened phrase -> entity type index. Keys are interned so lookups with
+    # pre-interned text compare by identity before falling back to equality.
+    _PATTERN_INDEX: Dict[str, str] = {
+        sys.intern(pattern): sys.intern(entity_type)
+        for entity_type, patterns in GENERIC_PATTERNS.items()
+        for pattern in patterns
+    }
+
     PRONOUN_ENTITY_TYPES: Dict[str, Optional[str]] = {
         "it": None,
         "its": None,
@@ -135,20 +153,34 @@ class EntityContext:
     # If gap < threshold, resolution is considered ambiguous
     DOMINANCE_GAP_THRESHOLD = 0.3  # 30% frequency advantage required
 
+    # Maximum number of memoized resolution outcomes per registration version
+    RESOLVE_CACHE_SIZE = 64
+
     def __init__(self):
         """Initialize empty entity context."""
         # Entities indexed by type for quick lookup
         self.entities_by_type: Dict[str, List[EntityMention]] = {}
 
+        # Most recent mention of each unique entity, per type
+        self._type_stats: Dict[str, Dict[str, EntityMention]] = {}
+
         # Ordered list of all mentions for recency tracking
         self.mention_sequence: List[EntityMention] = []
 
         # Frequency counter for each unique entity
-        self.entity_frequency: Dict[str, int] = {}  # entity_id -> count
+        self.entity_frequency: Counter[str] = Counter()  # entity_id -> count
 
         # Resolution log for debugging and audit
         self.resolution_log: List[Dict[str, Any]] = []
 
+        # Read-only snapshot of resolution_log, rebuilt only after new entries
+        self._resolution_log_view: Optional[Tuple[Dict[str, Any], ...]] = None
+
+        # Bumped on every registration; keys the resolution memo below
+        self._version = 0
+        self._resolve_cache: Dict[Tuple[str, int], tuple] = {}
+        self._resolve_cache_version = 0
+
     def register_entity(self, entity_data: Dict[str, Any], sentence_idx: int) -> None:
         """
         Register a successfully resolved named entity.
@@ -161,33 +193,62 @@ class EntityContext:
             Only entities with resolution_status RESOLVED or RESOLVED_SOFT
             should be registered. UNRESOLVED entities are not tracked.
         """
-        resolution_status = entity_data.get("resolution_status", "")
-        if resolution_status not in ["RESOLVED", "RESOLVED_SOFT"]:
-            return  # Don't track unresolved entities
-
-        entity_id = entity_data.get("entity_id", "")
-        if not entity_id:
-            return
-
-        mention = EntityMention(
-            entity_id=entity_id,
-            canonical_name=entity_data.get("canonical_name", ""),
-            entity_type=entity_data.get("entity_type", "UNKNOWN"),
-            sentence_idx=sentence_idx,
-            confidence=entity_data.get("confidence", 0.0),
-            sources=entity_data.get("sources", {}),
-        )
+        self.register_entities((entity_data,), (sentence_idx,))
+
+    def register_entities(
+        self, batch: Sequence[Dict[str, Any]], sentence_indices: Sequence[int]
+    ) -> None:
+        """
+        Register several entities in one pass, in order.
 
-        # Add to type index
-        if mention.entity_type not in self.entities_by_type:
-            self.entities_by_type[mention.entity_type] = []
-        self.entities_by_type[mention.entity_type].append(mention)
+        Equivalent to calling register_entity for each (entity, index) pair,
+        with the index structures bound once for the whole batch.
 
-        # Add to sequence
-        self.mention_sequence.append(mention)
+        Args:
+            batch: Entity dictionaries from EntityLinker
+            sentence_indices: Sentence index for each entity in batch
+        """
+        entities_by_type = self.entities_by_type
+        type_stats = self._type_stats
+        mention_sequence = self.mention_sequence
+        entity_frequency = self.entity_frequency
+        registered = 0
+
+        for entity_data, sentence_idx in zip(batch, sentence_indices):
+            resolution_status = entity_data.get("resolution_status", "")
+            if resolution_status not in _REGISTERABLE_STATUSES:
+                continue  # Don't track unresolved entities
+
+            entity_id = entity_data.get("entity_id", "")
+            if not entity_id:
+                continue
+
+            entity_type = entity_data.get("entity_type", "UNKNOWN")
+            mention = EntityMention(
+                entity_id=entity_id,
+                canonical_name=entity_data.get("canonical_name", ""),
+                entity_type=entity_type,
+                sentence_idx=sentence_idx,
+                confidence=entity_data.get("confidence", 0.0),
+                sources=entity_data.get("sources", {}),
+            )
+
+            # Add to type index
+            entities_by_type.setdefault(entity_type, []).append(mention)
+            latest = type_stats.setdefault(entity_type, {})
+            current = latest.get(entity_id)
+            if current is None or sentence_idx > current.sentence_idx:
+                latest[entity_id] = mention
 
-        # Update frequency
-        self.entity_frequency[entity_id] = self.entity_frequency.get(entity_id, 0) + 1
+            # Add to sequence
+            mention_sequence.append(mention)
+
+            # Update frequency
+            entity_frequency[entity_id] += 1
+            registered += 1
+
+        if registered:
+            self._version += 1
 
     def resolve_generic(
         self, text: str, context_type: str = "SUBJECT"
@@ -209,48 +270,93 @@ class EntityContext:
             This method is intentionally conservative. It will return None
             rather than make a potentially incorrect resolution.
         """
-        text_lower = text.lower().strip()
+        return self._resolve_normalized(text, text.lower().strip())
 
+    def resolve_generic_interned(
+        self, interned_text: str, context_type: str = "SUBJECT"
+    ) -> Optional[CorefResolution]:
+        """
+        Fast path of resolve_generic for callers that already hold normalized text.
+
+        Args:
+            interned_text: Lowercased, stripped text, ideally passed through
+                sys.intern() once at extraction time
+            context_type: Either "SUBJECT" or "OBJECT" (unused in current impl)
+
+        Returns:
+            Same as resolve_generic. The resolution log records the
+            normalized text as the input.
+        """
+        return self._resolve_normalized(interned_text, interned_text)
+
+    def _resolve_normalized(self, text: str, text_lower: str) -> Optional[CorefResolution]:
+        """
+        Shared body of resolve_generic / resolve_generic_interned.
+
+        Outcomes are memoized per (text_lower, registration version), so a
+        repeated phrase with no new registrations in between skips the
+        dominance computation. Every attempt is still logged.
+        """
+        cache_key = (text_lower, self._version)
+        outcome = self._resolve_cache.get(cache_key)
+        if outcome is None:
+            if self._resolve_cache_version != self._version:
+                # New registrations invalidate every cached outcome
+                self._resolve_cache.clear()
+                self._resolve_cache_version = self._version
+            elif len(self._resolve_cache) >= self.RESOLVE_CACHE_SIZE:
+                # FIFO eviction (dicts preserve insertion order)
+                del self._resolve_cache[next(iter(self._resolve_cache))]
+            outcome = self._compute_resolution(text_lower)
+            self._resolve_cache[cache_key] = outcome
+
+        resolution, entity_id, method, reason = outcome
+        self._log_resolution(text, entity_id, method, reason)
+        return resolution
+
+    def _compute_resolution(self, text_lower: str) -> tuple:
+        """
+        Resolve normalized text without logging.
+
+        Returns:
+            (CorefResolution or None, logged entity_id, method: str, reason: str)
+        """
         pronoun_resolution = self._resolve_pronoun_reference(text_lower)
         if pronoun_resolution:
-            self._log_resolution(text, pronoun_resolution.entity_id, pronoun_resolution.resolution_method, pronoun_resolution.decision_reason)
-            return pronoun_resolution
+            return (
+                pronoun_resolution, pronoun_resolution.entity_id,
+                pronoun_resolution.resolution_method, pronoun_resolution.decision_reason,
+            )
 
         # 1. Match against generic patterns
-        matched_type = None
-        for entity_type, patterns in self.GENERIC_PATTERNS.items():
-            if text_lower in patterns:
-                matched_type = entity_type
-                break
+        matched_type = self._PATTERN_INDEX.get(text_lower)
 
         if not matched_type:
             nominal_resolution = self._resolve_nominal_reference(text_lower)
             if nominal_resolution:
-                self._log_resolution(text, nominal_resolution.entity_id, nominal_resolution.resolution_method, nominal_resolution.decision_reason)
-                return nominal_resolution
-            self._log_resolution(text, None, "NO_PATTERN_MATCH", "Text not in generic patterns")
-            return None
+                return (
+                    nominal_resolution, nominal_resolution.entity_id,
+                    nominal_resolution.resolution_method, nominal_resolution.decision_reason,
+                )
+            return None, None, "NO_PATTERN_MATCH", "Text not in generic patterns"
 
         # 2. Get entities of this type
         candidates = self.entities_by_type.get(matched_type, [])
         if not candidates:
-            self._log_resolution(text, None, "NO_CANDIDATES", f"No {matched_type} entities registered")
-            return None
+            return None, None, "NO_CANDIDATES", f"No {matched_type} entities registered"
 
         # 3. Find dominant entity
         dominant, method, reason = self._find_dominant_entity(candidates, matched_type)
 
         if not dominant:
-            self._log_resolution(text, None, "AMBIGUOUS", reason)
-            return None
+            return None, None, "AMBIGUOUS", reason
 
         # 4. Check confidence threshold
         if dominant.confidence < self.MIN_RESOLUTION_CONFIDENCE:
-            self._log_resolution(
-                text, dominant.entity_id, "LOW_CONFIDENCE",
+            return (
+                None, dominant.entity_id, "LOW_CONFIDENCE",
                 f"Entity confidence {dominant.confidence:.2f} < threshold {self.MIN_RESOLUTION_CONFIDENCE}"
             )
-            return None
 
         # 5. Success - create resolution
         resolution = CorefResolution(
@@ -263,9 +369,7 @@ class EntityContext:
             decision_reason=reason,
             source_mention=dominant,
         )
-
-        self._log_resolution(text, dominant.entity_id, method, reason)
-        return resolution
+        return resolution, dominant.entity_id, method, reason
 
     def _resolve_pronoun_reference(self, text_lower: str) -> Optional[CorefResolution]:
         pronoun_key = text_lower
@@ -363,19 +467,22 @@ class EntityContext:
         if not candidates:
             return None, "NO_CANDIDATES", "No candidates available"
 
-        # Get unique entities by ID
-        unique_entities: Dict[str, EntityMention] = {}
-        for mention in candidates:
-            if mention.entity_id not in unique_entities:
-                unique_entities[mention.entity_id] = mention
-            else:
+        if candidates is self.entities_by_type.get(entity_type):
+            # Whole type index: register_entity already tracks the most
+            # recent mention per entity, in first-seen order
+            unique_entities = self._type_stats[entity_type]
+        else:
+            # Get unique entities by ID
+            unique_entities = {}
+            for mention in candidates:
                 # Keep the most recent mention
-                if mention.sentence_idx > unique_entities[mention.entity_id].sentence_idx:
+                current = unique_entities.get(mention.entity_id)
+                if current is None or mention.sentence_idx > current.sentence_idx:
                     unique_entities[mention.entity_id] = mention
 
         # Case 1: Singleton
         if len(unique_entities) == 1:
-            entity = list(unique_entities.values())[0]
+            entity = next(iter(unique_entities.values()))
             return (
                 entity,
                 "DOMINANT_SINGLETON",
@@ -383,14 +490,13 @@ class EntityContext:
             )
 
         # Case 2: Multiple entities - check frequency dominance
-        freq_list = [
-            (eid, self.entity_frequency.get(eid, 0), mention)
-            for eid, mention in unique_entities.items()
-        ]
-        freq_list.sort(key=lambda x: x[1], reverse=True)
+        # most_common keeps first-seen order among equal counts
+        top_two = Counter(
+            {eid: self.entity_frequency[eid] for eid in unique_entities}
+        ).most_common(2)
 
-        top_freq = freq_list[0][1]
-        second_freq = freq_list[1][1] if len(freq_list) > 1 else 0
+        top_freq = top_two[0][1]
+        second_freq = top_two[1][1] if len(top_two) > 1 else 0
 
         # Calculate dominance gap
         if top_freq > 0:
@@ -399,7 +505,7 @@ class EntityContext:
             gap = 0
 
         if gap >= self.DOMINANCE_GAP_THRESHOLD:
-            dominant = freq_list[0][2]
+            dominant = unique_entities[top_two[0][0]]
             return (
                 dominant,
                 "DOMINANT_FREQUENCY",
@@ -411,7 +517,7 @@ class EntityContext:
         most_recent = max(candidates, key=lambda m: m.sentence_idx)
 
         # Check if the most recent entity is one of the top-frequency candidates
-        top_entity_ids = {freq_list[0][0], freq_list[1][0]} if len(freq_list) > 1 else {freq_list[0][0]}
+        top_entity_ids = {eid for eid, _ in top_two}
 
         if most_recent.entity_id in top_entity_ids:
             return (
@@ -439,10 +545,18 @@ class EntityContext:
             "reason": reason,
             "success": entity_id is not None,
         })
+        self._resolution_log_view = None
 
-    def get_resolution_log(self) -> List[Dict[str, Any]]:
-        """Return the resolution log for debugging."""
-        return self.resolution_log.copy()
+    def get_resolution_log(self) -> Tuple[Dict[str, Any], ...]:
+        """
+        Return the resolution log for debugging.
+
+        The returned tuple is cached until the next resolution attempt, so
+        repeated reads do not copy the log.
+        """
+        if self._resolution_log_view is None:
+            self._resolution_log_view = tuple(self.resolution_log)
+        return self._resolution_log_view
 
     def get_entity_summary(self) -> Dict[str, Any]:
         """Return summary of tracked entities for debugging."""
@@ -453,12 +567,16 @@ class EntityContext:
                 etype: len(mentions)
                 for etype, mentions in self.entities_by_type.items()
             },
-            "entity_frequencies": self.entity_frequency.copy(),
+            "entity_frequencies": MappingProxyType(self.entity_frequency),
         }
 
     def clear(self) -> None:
         """Clear all tracked entities. Call between documents."""
         self.entities_by_type.clear()
+        self._type_stats.clear()
         self.mention_sequence.clear()
         self.entity_frequency.clear()
         self.resolution_log.clear()
+        self._resolution_log_view = None
+        self._version += 1
+        self._resolve_cache.clear()
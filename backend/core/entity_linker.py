@@ -8,6 +8,20 @@ from .entity_models import ResolvedEntity, EntityCandidate
 if TYPE_CHECKING:
     from .entity_context import EntityContext
 
+# Generic reference phrases and pronouns recognized by _is_generic_reference
+_GENERIC_REFERENCE_PATTERNS = frozenset({
+    # ORG patterns
+    "the company", "the firm", "the corporation", "the organization",
+    "the business", "the enterprise", "the tech giant", "the startup",
+    # PERSON patterns
+    "the founder", "the ceo", "the executive", "the entrepreneur",
+    # LOC patterns
+    "the city", "the country", "the state", "the region",
+})
+_GENERIC_REFERENCE_PRONOUNS = frozenset({
+    "it", "its", "they", "their", "them", "he", "him", "his", "she", "her",
+})
+
 class EntityLinker:
     def __init__(self):
         self.WIKIDATA_API_URL = "https://www.wikidata.org/w/api.php"
@@ -470,18 +484,7 @@ class EntityLinker:
         like "the company" that are unlikely to have Wikidata entries.
         """
         text_lower = text.lower().strip()
-        generic_patterns = [
-            # ORG patterns
-            "the company", "the firm", "the corporation", "the organization",
-            "the business", "the enterprise", "the tech giant", "the startup",
-            # PERSON patterns
-            "the founder", "the ceo", "the executive", "the entrepreneur",
-            # LOC patterns
-            "the city", "the country", "the state", "the region",
-        ]
-        if text_lower in generic_patterns:
-            return True
-        if text_lower in {"it", "its", "they", "their", "them", "he", "him", "his", "she", "her"}:
+        if text_lower in _GENERIC_REFERENCE_PATTERNS or text_lower in _GENERIC_REFERENCE_PRONOUNS:
             return True
         if text_lower.startswith("its ") or text_lower.startswith("their "):
             return True
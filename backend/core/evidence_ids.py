@@ -0,0 +1,20 @@
+import hashlib
+import uuid
+
+# uuid5 is SHA-1 over namespace bytes + name; the namespace prefix never changes
+_OID_NAMESPACE_BYTES = uuid.NAMESPACE_OID.bytes
+
+
+def evidence_uuid(unique_str: str) -> str:
+    """
+    Deterministic evidence ID, identical to str(uuid.uuid5(uuid.NAMESPACE_OID, unique_str)).
+
+    Evidence IDs are persisted in audit runs and cross-referenced by the
+    verifier, so the value must not change; this only skips the UUID object
+    round trip.
+    """
+    digest = bytearray(hashlib.sha1(_OID_NAMESPACE_BYTES + unique_str.encode("utf-8")).digest()[:16])
+    digest[6] = (digest[6] & 0x0F) | 0x50  # version 5
+    digest[8] = (digest[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = digest.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
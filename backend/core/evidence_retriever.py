@@ -1,10 +1,10 @@
 import requests
 import time
-import uuid
-import spacy
 import re
 import logging
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .entity_context import EntityContext
@@ -14,27 +14,40 @@ from .wikipedia_passage_retrieval import WikipediaPassageRetriever
 from .grokipedia_client import GrokipediaClient
 from .primary_document_retriever import PrimaryDocumentRetriever
 from .wikidata_retriever import WikidataRetriever
+from .evidence_ids import evidence_uuid
+from .entity_context import RESOLVED_STATUSES
 from config.core_config import EVIDENCE_MODALITY_TEXTUAL, EVIDENCE_MODALITY_STRUCTURED
 
 logger = logging.getLogger(__name__)
 
+# Predicates whose evidence lives on the object entity (e.g. "founded": query the company)
+_OBJECT_CENTRIC_RE = re.compile(
+    "founded|invented|created|discovered|directed|wrote|authored|released"
+    "|launched|manufactured|developed|acquired|bought|purchased",
+    re.IGNORECASE
+)
+
 class EvidenceRetriever:
+    # Claims retrieved concurrently; retrieval is bound by HTTP latency
+    RETRIEVAL_WORKERS = 8
+
     def __init__(self):
         self.mapper = PropertyMapper()
         self.passage_retriever = WikipediaPassageRetriever()
         self.grok_client = GrokipediaClient()
         self.primary_retriever = PrimaryDocumentRetriever()
         self.wikidata_retriever = WikidataRetriever()
+        # Created once so worker threads, and the per-thread HTTP sessions the
+        # retrievers keep, survive across audits and reuse their connections
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.RETRIEVAL_WORKERS, thread_name_prefix="evidence-retrieval"
+        )
         
         self.WIKIDATA_API_URL = "https://www.wikidata.org/w/api.php"
         self.session = requests.Session()
         self.session.headers.update({
              "User-Agent": "EpistemicAuditEngine/1.0 (Research Project)"
         })
-        try:
-             self.nlp = spacy.load("en_core_web_sm")
-        except:
-             self.nlp = None
         
         self.entity_cache = {}
         self.predicate_property_hints = {
@@ -75,19 +88,36 @@ class EvidenceRetriever:
         # Phase 1: Tier 1 Retrieval (Primary) which may pre-solve queries
         primary_ev_map = self.primary_retriever.retrieve_evidence(input_data.get("claims", []))
         
-        output_claims = []
-        for claim in input_data.get("claims", []):
+        claims = input_data.get("claims", [])
+        if not claims:
+            return {"claims": []}
+
+        # Batch-fetch every Wikidata entity the claims will query up front
+        self.wikidata_retriever.request_timeout_s = float(performance.get("wikidata_timeout_s") or 5.0)
+        queries = {}
+        for claim in claims:
+            try:
+                query_qid, p_ids = self._wikidata_query(claim, performance)
+            except Exception:
+                continue
+            if query_qid and p_ids:
+                queries.setdefault(query_qid, set()).update(p_ids)
+        self.wikidata_retriever.prefetch_entities(queries)
+
+        def process(claim: Dict[str, Any]) -> Dict[str, Any]:
             try:
                 cid = claim.get("claim_id")
                 p_docs = primary_ev_map.get(cid, [])
                 
-                processed_claim = self._process_claim(claim, p_docs, performance=performance)
-                output_claims.append(processed_claim)
+                return self._process_claim(claim, p_docs, performance=performance)
             except Exception as e:
                 logger.exception("Evidence retrieval failed for claim_id=%s", claim.get("claim_id"))
                 # Fallback empty structure
                 claim["evidence"] = {"wikidata": [], "wikipedia": [], "grokipedia": [], "primary_document": []}
-                output_claims.append(claim)
+                return claim
+
+        # Claims are independent; map() keeps output in input order
+        output_claims = list(self._executor.map(process, claims))
                 
         return {"claims": output_claims}
 
@@ -107,6 +137,24 @@ class EvidenceRetriever:
         self.wikidata_retriever.request_timeout_s = wikidata_timeout_s
         self.passage_retriever.request_timeout_s = wikipedia_timeout_s
         
+        # Nothing to anchor retrieval on: every tier below would be a no-op
+        if (subj_ent.get("resolution_status") not in RESOLVED_STATUSES
+                and not (obj_ent and obj_ent.get("resolution_status") in RESOLVED_STATUSES)):
+            claim["evidence"] = {
+                "primary_document": primary_docs,
+                "wikidata": [],
+                "wikipedia": [],
+                "grokipedia": []
+            }
+            claim["evidence_status"] = {
+                "primary_document": "FOUND" if primary_docs else "ABSENT",
+                "wikidata": "SKIPPED",
+                "wikipedia": "SKIPPED",
+                "grokipedia": "SKIPPED",
+                "anchor_status": "REJECTED"
+            }
+            return claim
+
         wikidata_ev = []
         wikipedia_ev = []
         grokipedia_ev = []
@@ -119,22 +167,9 @@ class EvidenceRetriever:
         }
         
         # 1. Wikidata Retrieval (Tier 1)
-        direction = self._get_query_direction(predicate)
-        query_qid = None
-        
-        # Accept RESOLVED, RESOLVED_SOFT, and RESOLVED_COREF (v1.4) for evidence retrieval
-        valid_statuses = ["RESOLVED", "RESOLVED_SOFT", "RESOLVED_COREF"]
-
-        if direction == "OBJECT" and obj_ent and obj_ent.get("resolution_status") in valid_statuses:
-            query_qid = obj_ent.get("entity_id")
-        elif subj_ent.get("resolution_status") in valid_statuses:
-            query_qid = subj_ent.get("entity_id")
+        query_qid, p_ids = self._wikidata_query(claim, performance)
 
         if query_qid:
-            p_ids = self._resolve_wikidata_properties(predicate, claim.get("claim_text", ""))
-            property_limit = int(performance.get("wikidata_property_limit") or 0)
-            if property_limit > 0:
-                p_ids = p_ids[:property_limit]
             if p_ids:
                 matches = self.wikidata_retriever.retrieve_structured_evidence(query_qid, p_ids, claim)
                 if matches:
@@ -224,11 +259,10 @@ class EvidenceRetriever:
                 status["grokipedia"] = "ABSENT" if subj_ent.get("source_status", {}).get("grokipedia") == "ABSENT" else "SKIPPED"
 
         # Anchor Validation (v1.4: include RESOLVED_COREF)
-        valid_statuses = ["RESOLVED", "RESOLVED_SOFT", "RESOLVED_COREF"]
-        subj_ok = subj_ent.get("resolution_status") in valid_statuses
+        subj_ok = subj_ent.get("resolution_status") in RESOLVED_STATUSES
         obj_ok = True
         if obj_ent:
-            obj_ok = obj_ent.get("resolution_status") in valid_statuses
+            obj_ok = obj_ent.get("resolution_status") in RESOLVED_STATUSES
             
         if subj_ok and obj_ok:
             status["anchor_status"] = "ACCEPTED"
@@ -243,6 +277,32 @@ class EvidenceRetriever:
         
         return claim
 
+    def _wikidata_query(
+        self,
+        claim: Dict[str, Any],
+        performance: Dict[str, Any]
+    ) -> Tuple[Optional[str], List[str]]:
+        """Return the (entity QID, property IDs) a claim's Wikidata lookup will use."""
+        subj_ent = claim.get("subject_entity", {})
+        obj_ent = claim.get("object_entity", {})
+        predicate = claim.get("predicate", "").lower()
+        direction = self._get_query_direction(predicate)
+        query_qid = None
+
+        if direction == "OBJECT" and obj_ent and obj_ent.get("resolution_status") in RESOLVED_STATUSES:
+            query_qid = obj_ent.get("entity_id")
+        elif subj_ent.get("resolution_status") in RESOLVED_STATUSES:
+            query_qid = subj_ent.get("entity_id")
+
+        if not query_qid:
+            return None, []
+
+        p_ids = self._resolve_wikidata_properties(predicate, claim.get("claim_text", ""))
+        property_limit = int(performance.get("wikidata_property_limit") or 0)
+        if property_limit > 0:
+            p_ids = p_ids[:property_limit]
+        return query_qid, p_ids
+
     def _build_wikipedia_query(
         self,
         claim: Dict[str, Any],
@@ -295,16 +355,10 @@ class EvidenceRetriever:
             for token in (" located in ", " situated in ", " headquartered ", " based in ", " is in ", " are in ", " was in ", " were in ")
         )
 
-    def _get_query_direction(self, predicate: str) -> str:
-        p = predicate.lower()
-        object_centric = [
-            "founded", "invented", "created", "discovered", "directed",
-            "wrote", "authored", "released", "launched", "manufactured",
-            "developed", "acquired", "bought", "purchased"
-        ]
-        if any(k in p for k in object_centric):
-            return "OBJECT"
-        return "SUBJECT"
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _get_query_direction(predicate: str) -> str:
+        return "OBJECT" if _OBJECT_CENTRIC_RE.search(predicate) else "SUBJECT"
 
     def _ensure_primary_evidence_id(self, evidence: Dict[str, Any]) -> Dict[str, Any]:
         if evidence.get("evidence_id"):
@@ -321,5 +375,4 @@ class EvidenceRetriever:
         return evidence
 
     def _generate_evidence_id(self, source: str, content: str) -> str:
-        unique_str = f"{source}:{content}"
-        return str(uuid.uuid5(uuid.NAMESPACE_OID, unique_str))
+        return evidence_uuid(f"{source}:{content}")
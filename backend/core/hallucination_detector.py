@@ -1,6 +1,62 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterable
 import re
 
+
+def _literal_union(terms: Iterable[str]) -> "re.Pattern[str]":
+    """One alternation over literal keywords; .search() answers any(t in text for t in terms)."""
+    return re.compile("|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True)))
+
+
+# P170 (creator), P176 (manufacturer), P178 (developer)
+# REMOVED P112 (founder) as it apples to Orgs, not Artifacts.
+_CREATOR_PROPS = frozenset({"P170", "P176", "P178"})
+
+# v1.6: verified through structured evidence, not number matching
+_CANONICAL_BIOGRAPHICAL_PREDICATES = ("born", "died", "birth", "death", "founded", "established")
+
+# Numeric intent cues looked up just before a figure in the claim
+_LOWER_BOUND_CUES = ("over", "more than", "above", "at least", "exceeding", "exceeds")
+_UPPER_BOUND_CUES = ("under", "less than", "below", "at most")
+_APPROXIMATE_CUES = ("about", "around", "approximately", "roughly", "approx")
+
+_AUTHORSHIP_PREDICATES = ("designed", "engineered", "built", "implemented", "coded", "programmed", "developed")
+_TECHNICAL_OBJECTS = ("processor", "chip", "hardware", "system", "architecture", "kernel", "quantum", "algorithm", "equation")
+_HIGH_COURTS = ("supreme court", "high court", "scotus")
+
+# Figures (integers, thousands-separated, decimals), claim years and mg doses
+_NUMBER_RE = re.compile(r'\b\d+(?:,\d{3})*(?:\.\d+)?\b')
+_CLAIM_YEAR_RE = re.compile(r'\b(1\d{3}|20\d{2})\b')
+_DOSAGE_MG_RE = re.compile(r'(\d+(?:,\d{3})?)\s*mg')
+
+
+def _is_likely_year(n: str) -> bool:
+    """Check if a 4-digit number is likely a year (1000-2099)."""
+    if len(n) != 4:
+        return False
+    try:
+        year = int(n)
+        return 1000 <= year <= 2099
+    except ValueError:
+        return False
+
+
+def _flatten_evidence(evidence: Dict[str, List[Dict[str, Any]]], include_values: bool) -> str:
+    """Space-joined evidence text, built with one join rather than repeated concatenation."""
+    parts: List[str] = []
+    for src in evidence.values():
+        for item in src:
+            if include_values:
+                parts.append(" " + str(item.get("value", "")))
+            parts.append(" " + item.get("snippet", "") + " " + item.get("sentence", ""))
+    return "".join(parts)
+
+
+# Word-bounded scope targets ("mask" also matches the plural)
+_SCOPE_WORD_PATTERNS = {
+    "all": re.compile(r"\ball\b"),
+    "mask": re.compile(r"\bmask(?:s)?\b"),
+}
+
 class HallucinationDetector:
     """
     Detects specific hallucination patterns as defined in Epistemic Audit Engine v1.1 Phase 8.
@@ -31,19 +87,28 @@ class HallucinationDetector:
         # Extended Universality Markers
         self.UNIVERSAL_MARKERS = {"everyone", "all", "nationwide", "entire population", "mandatory for all", "universal"}
 
+        # Compiled once; each scope check is then a single scan per text
+        self._scope_authority_re = _literal_union(self.SCOPE_AUTHORITIES)
+        self._scope_force_re = _literal_union(self.SCOPE_FORCE_PREDICATES)
+        self._scope_limiter_re = _literal_union(self.SCOPE_LIMITERS)
+        self._universal_marker_re = _literal_union(self.UNIVERSAL_MARKERS)
+
     def detect_structural(self, claim: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Fast pre-filter for structural hallucinations that don't require external evidence.
         Returns the first detected hallucination, or None.
         """
+        c_text = claim.get("claim_text", "").lower()
+        pred = claim.get("predicate", "").lower()
+
         # 1. SCOPE_OVERGENERALIZATION (Critical)
-        scope = self._check_scope_overgeneralization(claim)
+        scope = self._check_scope_overgeneralization(claim, c_text, pred)
         if scope:
             self._enrich(scope)
             return scope
             
         # 2. IMPOSSIBLE_DOSAGE (Critical)
-        dosage = self._check_impossible_dosage(claim)
+        dosage = self._check_impossible_dosage(claim, c_text)
         if dosage:
             self._enrich(dosage)
             return dosage
@@ -55,7 +120,7 @@ class HallucinationDetector:
         # Without evidence proving they DIDN'T do it, we rely on the structural heuristic.
         # The heuristic is strong (high score 0.9).
         # We will treat it as pre-filterable.
-        bleed = self._check_authority_bleed(claim)
+        bleed = self._check_authority_bleed(claim, pred)
         if bleed:
             self._enrich(bleed)
             return bleed
@@ -67,46 +132,52 @@ class HallucinationDetector:
         Returns a list of detected hallucinations.
         """
         flags = []
-        
-        # 1. ENTITY_ROLE_CONFLICT (Phase 5 Hard Refutation)
-        conflict = self._check_entity_role_conflict(claim, evidence)
-        if conflict:
-            self._enrich(conflict)
-            flags.append(conflict)
-            
-        # 2. TEMPORAL_FABRICATION (Phase 6)
-        temp_fab = self._check_temporal_fabrication(claim, evidence)
-        if temp_fab:
-            self._enrich(temp_fab)
-            flags.append(temp_fab)
+        # Lowercased once and shared by every text-based check below
+        c_text = claim.get("claim_text", "").lower()
+        pred = claim.get("predicate", "").lower()
+
+        # Checks 1-2 only ever fire on Wikidata statements; skip both outright
+        # when retrieval produced none (the common case for unresolved anchors).
+        if evidence.get("wikidata"):
+            # 1. ENTITY_ROLE_CONFLICT (Phase 5 Hard Refutation)
+            conflict = self._check_entity_role_conflict(claim, evidence, pred)
+            if conflict:
+                self._enrich(conflict)
+                flags.append(conflict)
+
+            # 2. TEMPORAL_FABRICATION (Phase 6)
+            temp_fab = self._check_temporal_fabrication(claim, evidence)
+            if temp_fab:
+                self._enrich(temp_fab)
+                flags.append(temp_fab)
             
         # 3. UNSUPPORTED_SPECIFICITY (Phase 8)
         # Checks for numbers in claim not present in evidence
-        spec_fab = self._check_unsupported_specificity(claim, evidence)
+        spec_fab = self._check_unsupported_specificity(claim, evidence, c_text, pred)
         if spec_fab:
             self._enrich(spec_fab)
             flags.append(spec_fab)
             
         # 4. AUTHORITY_BLEED (Phase 8/Fix 4)
-        auth_bleed = self._check_authority_bleed(claim)
+        auth_bleed = self._check_authority_bleed(claim, pred)
         if auth_bleed:
              self._enrich(auth_bleed)
              flags.append(auth_bleed)
 
         # 5. COURT_AUTHORITY_MISATTRIBUTION (Stress Test)
-        court = self._check_court_authority(claim, evidence)
+        court = self._check_court_authority(claim, evidence, c_text, pred)
         if court:
              self._enrich(court)
              flags.append(court)
              
         # 6. IMPOSSIBLE_DOSAGE (Stress Test)
-        dosage = self._check_impossible_dosage(claim)
+        dosage = self._check_impossible_dosage(claim, c_text)
         if dosage:
              self._enrich(dosage)
              flags.append(dosage)
 
         # 7. SCOPE_OVERGENERALIZATION (v1.1 Patch)
-        scope = self._check_scope_overgeneralization(claim)
+        scope = self._check_scope_overgeneralization(claim, c_text, pred)
         if scope:
              self._enrich(scope)
              flags.append(scope)
@@ -120,12 +191,15 @@ class HallucinationDetector:
         else:
             h["severity"] = "NON_CRITICAL"
 
-    def _check_entity_role_conflict(self, claim: Dict[str, Any], evidence: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    def _check_entity_role_conflict(
+        self, claim: Dict[str, Any], evidence: Dict[str, List[Dict[str, Any]]], pred: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Detects if a creation claim is attributed to the wrong entity.
         Rule: If Object has a known Creator (P170/P176/P178) that != Subject -> REFUTED.
         """
-        pred = claim.get("predicate", "").lower()
+        if pred is None:
+            pred = claim.get("predicate", "").lower()
         pred_tokens = set(pred.split())
         
         # Check if predicate involves creation
@@ -138,19 +212,15 @@ class HallucinationDetector:
         if pred_tokens.isdisjoint(self.ARTIFACT_CREATION_PREDICATES):
             return None
             
-        subj_ent = claim.get("subject_entity", {})
-        subj_qid = subj_ent.get("entity_id")
-        
-        # Check Wikidata Evidence for Creator Properties
-        # P170 (creator), P176 (manufacturer), P178 (developer)
-        # REMOVED P112 (founder) as it apples to Orgs, not Artifacts.
-        CREATOR_PROPS = {"P170", "P176", "P178"}
+        subj_ent = claim.get("subject_entity")
+        subj_qid = subj_ent.get("entity_id") if subj_ent else None
         
+        # Check Wikidata Evidence for Creator Properties (see _CREATOR_PROPS)
         wikidata_ev = evidence.get("wikidata", [])
         
         for ev in wikidata_ev:
             prop = ev.get("property")
-            if prop in CREATOR_PROPS:
+            if prop in _CREATOR_PROPS:
                 val_qid = ev.get("value") # Expecting QID of actual creator
                 
                 # If the evidence value (Real Creator) is NOT the Claim Subject
@@ -179,7 +249,7 @@ class HallucinationDetector:
             
         # Extract claim year
         c_text = claim.get("claim_text", "")
-        c_years = re.findall(r'\b(1\d{3}|20\d{2})\b', c_text)
+        c_years = _CLAIM_YEAR_RE.findall(c_text)
         if not c_years:
             return None
         c_year = int(c_years[0])
@@ -207,52 +277,41 @@ class HallucinationDetector:
 
         return None
 
-    def _check_unsupported_specificity(self, claim: Dict[str, Any], evidence: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    def _check_unsupported_specificity(
+        self,
+        claim: Dict[str, Any],
+        evidence: Dict[str, List[Dict[str, Any]]],
+        c_text: Optional[str] = None,
+        pred: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Checks for precise numbers in claim that are absent in evidence.
         Now supports Semantic Numeric Intents: LOWER_BOUND, UPPER_BOUND, APPROXIMATE.
         """
-        c_text = claim.get("claim_text", "").lower()
+        if c_text is None:
+            c_text = claim.get("claim_text", "").lower()
 
         # v1.6: Skip specificity check for canonical biographical claims
         # Birth dates/places are verified through structured evidence, not number matching
-        claim_type = claim.get("claim_type", "")
-        predicate = claim.get("predicate", "").lower()
-        CANONICAL_BIOGRAPHICAL_PREDICATES = {"born", "died", "birth", "death", "founded", "established"}
-        if any(p in predicate for p in CANONICAL_BIOGRAPHICAL_PREDICATES):
+        if pred is None:
+            pred = claim.get("predicate", "").lower()
+        if any(p in pred for p in _CANONICAL_BIOGRAPHICAL_PREDICATES):
             return None
 
         # 1. Regex for numbers (simple integers/floats/formatted)
         # Filter out years: any 4-digit number between 1000-2099 (covers historical dates)
-        nums = re.findall(r'\b\d+(?:,\d{3})*(?:\.\d+)?\b', c_text)
-
-        def is_likely_year(n: str) -> bool:
-            """Check if a 4-digit number is likely a year (1000-2099)."""
-            if len(n) != 4:
-                return False
-            try:
-                year = int(n)
-                return 1000 <= year <= 2099
-            except ValueError:
-                return False
-
-        non_year_nums = [n for n in nums if not is_likely_year(n)]
+        nums = _NUMBER_RE.findall(c_text)
+        non_year_nums = [n for n in nums if not _is_likely_year(n)]
         
         if not non_year_nums:
             return None
             
         # 2. Extract Evidence Text
-        all_text = ""
-        for src in evidence.values():
-            for item in src:
-                all_text += " " + str(item.get("value", "")) + " " + item.get("snippet", "") + " " + item.get("sentence", "")
-        all_text_lower = all_text.lower()
+        all_text_lower = _flatten_evidence(evidence, include_values=True).lower()
+        # Evidence figures are the same for every claim figure; parsed on first need
+        ev_values: Optional[List[float]] = None
         
         # 3. Numeric Intent Analysis
-        LOWER_BOUND = {"over", "more than", "above", "at least", "exceeding", "exceeds"}
-        UPPER_BOUND = {"under", "less than", "below", "at most"}
-        APPROXIMATE = {"about", "around", "approximately", "roughly", "approx"}
-        
         for n in non_year_nums:
             # Clean number for value comparison
             try:
@@ -266,14 +325,11 @@ class HallucinationDetector:
             context = c_text[max(0, idx-20):idx] if idx != -1 else ""
             
             intent = "EXACT"
-            if any(k in context for k in LOWER_BOUND): intent = "LOWER"
-            elif any(k in context for k in UPPER_BOUND): intent = "UPPER"
-            elif any(k in context for k in APPROXIMATE): intent = "APPROX"
+            if any(k in context for k in _LOWER_BOUND_CUES): intent = "LOWER"
+            elif any(k in context for k in _UPPER_BOUND_CUES): intent = "UPPER"
+            elif any(k in context for k in _APPROXIMATE_CUES): intent = "APPROX"
             
             # 4. Check against Evidence
-            # We need to extract Numbers from Evidence to compare values!
-            ev_nums = re.findall(r'\b\d+(?:,\d{3})*(?:\.\d+)?\b', all_text_lower)
-            
             satisfied = False
             
             # First: Exact Match Check (Legacy) - Fast Path
@@ -281,13 +337,17 @@ class HallucinationDetector:
             if clean_n_str in all_text_lower or n in all_text_lower:
                 satisfied = True
             else:
+                # We need to extract Numbers from Evidence to compare values!
+                if ev_values is None:
+                    ev_values = []
+                    for en in _NUMBER_RE.findall(all_text_lower):
+                        try:
+                            ev_values.append(float(en.replace(",", "")))
+                        except ValueError:
+                            continue
+
                 # Value Comparison Logic
-                for en in ev_nums:
-                    try:
-                        val_e = float(en.replace(",", ""))
-                    except:
-                        continue
-                        
+                for val_e in ev_values:
                     if intent == "LOWER":
                         # Claim: > X. Evidence: Y. Satisfied if Y >= X.
                         if val_e >= val_c:
@@ -318,23 +378,22 @@ class HallucinationDetector:
                     }
         return None
 
-    def _check_authority_bleed(self, claim: Dict[str, Any]) -> Dict[str, Any]:
+    def _check_authority_bleed(self, claim: Dict[str, Any], pred: Optional[str] = None) -> Dict[str, Any]:
         """
         Detects if authorship is attributed based on influence/leadership rather than technical execution.
         """
         # Subject must be PERSON
-        subj = claim.get("subject_entity", {})
-        if subj.get("entity_type") != "PERSON": return None
+        subj = claim.get("subject_entity")
+        if not subj or subj.get("entity_type") != "PERSON": return None
         
         # Predicate Authorship
-        pred = claim.get("predicate", "").lower()
-        auth_keywords = ["designed", "engineered", "built", "implemented", "coded", "programmed", "developed"]
-        if not any(k in pred for k in auth_keywords): return None
+        if pred is None:
+            pred = claim.get("predicate", "").lower()
+        if not any(k in pred for k in _AUTHORSHIP_PREDICATES): return None
         
         # Object Technical
         obj_txt = claim.get("object", "").lower()
-        tech_keywords = ["processor", "chip", "hardware", "system", "architecture", "kernel", "quantum", "algorithm", "equation"]
-        if not any(k in obj_txt for k in tech_keywords): return None
+        if not any(k in obj_txt for k in _TECHNICAL_OBJECTS): return None
         
         return {
             "hallucination_type": "AUTHORITY_BLEED",
@@ -342,26 +401,30 @@ class HallucinationDetector:
             "score": 0.9
         }
 
-    def _check_court_authority(self, claim: Dict[str, Any], evidence: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    def _check_court_authority(
+        self,
+        claim: Dict[str, Any],
+        evidence: Dict[str, List[Dict[str, Any]]],
+        c_text: Optional[str] = None,
+        pred: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Detects misattribution of court rulings (e.g. Supreme Court vs Lower Court).
         """
         # Subject must be a Court
         subj_txt = claim.get("subject", "").lower() 
-        c_text = claim.get("claim_text", "").lower()
-        subj_ent = claim.get("subject_entity", {})
-        
-        # Keywords for high courts
-        high_courts = ["supreme court", "high court", "scotus"]
+        if c_text is None:
+            c_text = claim.get("claim_text", "").lower()
         
         # Check explicit subject text OR claim text context (e.g. "The Supreme Court ruled...")
-        is_high_court = any(k in subj_txt or k in c_text for k in high_courts)
+        is_high_court = any(k in subj_txt or k in c_text for k in _HIGH_COURTS)
         
         if not is_high_court:
             return None
             
         # Predicate involves ruling
-        pred = claim.get("predicate", "").lower()
+        if pred is None:
+            pred = claim.get("predicate", "").lower()
         if "ruled" not in pred and "decided" not in pred:
             return None
             
@@ -370,11 +433,7 @@ class HallucinationDetector:
         # Logic: If claim says Supreme Court, but evidence says District Court -> Conflict.
         
         # Flatten evidence
-        all_text = ""
-        for src in evidence.values():
-            for item in src:
-                all_text += " " + item.get("snippet", "") + " " + item.get("sentence", "")
-        all_text = all_text.lower()
+        all_text = _flatten_evidence(evidence, include_values=False).lower()
         
         if "district court" in all_text or "federal judge" in all_text or "lower court" in all_text:
             if "supreme court" not in all_text:
@@ -385,17 +444,18 @@ class HallucinationDetector:
                 }
         return None
 
-    def _check_impossible_dosage(self, claim: Dict[str, Any]) -> Dict[str, Any]:
+    def _check_impossible_dosage(self, claim: Dict[str, Any], c_text: Optional[str] = None) -> Dict[str, Any]:
         """
         Detects dangerous medical dosages.
         """
         # Heuristic: "ibuprofen" + > 800mg/dose or > 3200mg/day
-        c_text = claim.get("claim_text", "").lower()
+        if c_text is None:
+            c_text = claim.get("claim_text", "").lower()
         
         if "ibuprofen" in c_text or "advil" in c_text or "motrin" in c_text:
             # Extract dosage stats
             # Look for number + mg
-            mgs = re.findall(r'(\d+(?:,\d{3})?)\s*mg', c_text)
+            mgs = _DOSAGE_MG_RE.findall(c_text)
             for m in mgs:
                 val = int(m.replace(",", ""))
                 # High dose check (800mg is Rx max usually, 1200 is definitely high per dose)
@@ -407,21 +467,24 @@ class HallucinationDetector:
                     }
         return None
 
-    def _check_scope_overgeneralization(self, claim: Dict[str, Any]) -> Dict[str, Any]:
+    def _check_scope_overgeneralization(
+        self, claim: Dict[str, Any], c_text: Optional[str] = None, pred: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Detects structural impossibility of universal mandates (Scope Hallucination).
         """
-        c_text = claim.get("claim_text", "").lower()
+        if c_text is None:
+            c_text = claim.get("claim_text", "").lower()
         subj_txt = claim.get("subject", "").lower()
-        pred_txt = claim.get("predicate", "").lower()
+        pred_txt = pred if pred is not None else claim.get("predicate", "").lower()
         obj_txt = claim.get("object", "").lower()
         
         # 1. Check Authority Subject
-        if not any(a in subj_txt or a in c_text for a in self.SCOPE_AUTHORITIES):
+        if not (self._scope_authority_re.search(subj_txt) or self._scope_authority_re.search(c_text)):
             return None
             
         # 2. Check Force Predicate
-        if not any(p in pred_txt or p in c_text for p in self.SCOPE_FORCE_PREDICATES):
+        if not (self._scope_force_re.search(pred_txt) or self._scope_force_re.search(c_text)):
             return None
             
         # 3. Check Universal Object/Target
@@ -430,10 +493,8 @@ class HallucinationDetector:
         found_target = None
         for o in self.SCOPE_UNIVERSAL_OBJECTS:
              # Check distinct word boundaries for short words like "all"
-             if o in ["all", "mask"]:
-                  # Allow plural for mask
-                  pattern = r'\b' + re.escape(o) + r'(?:s)?\b' if o == "mask" else r'\b' + re.escape(o) + r'\b'
-                  if re.search(pattern, c_text):
+             if o in _SCOPE_WORD_PATTERNS:
+                  if _SCOPE_WORD_PATTERNS[o].search(c_text):
                        found_target = o
                        break
              elif o in obj_txt or o in c_text:
@@ -447,11 +508,11 @@ class HallucinationDetector:
         # to ensure we don't flag "mandated a vaccine requirement for entry" (scoped by context implied).
         # We only refute if it explicitly claims universality.
         if found_target in {"vaccine", "mask"}:
-            if not any(u in c_text for u in self.UNIVERSAL_MARKERS):
+            if not self._universal_marker_re.search(c_text):
                  return None
             
         # 4. Check for Limiters (Absence of)
-        if any(l in c_text for l in self.SCOPE_LIMITERS):
+        if self._scope_limiter_re.search(c_text):
             return None
             
         return {
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 
-@dataclass
+@dataclass(slots=True)
 class HallucinationFlag:
     claim_id: str
     hallucination_type: str # H1-H6
@@ -10,7 +10,7 @@ class HallucinationFlag:
     explanation: str
     supporting_signals: List[str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HallucinationReport:
     overall_risk: str # LOW, MEDIUM, HIGH
     hallucination_score: float
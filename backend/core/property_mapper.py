@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List
 
 class PropertyMapper:
@@ -105,12 +106,16 @@ class PropertyMapper:
             "ipo": ["P414", "P576"],     # stock exchange
         }
 
+        # Predicates repeat heavily across claims; memoize per normalized predicate
+        self._match_properties = lru_cache(maxsize=1024)(self._match_properties)
+
     def get_potential_properties(self, predicate: str) -> List[str]:
         """
         Returns list of P-IDs for a given predicate lemma.
         """
-        pred_lower = predicate.lower().strip()
-        
+        return self._match_properties(predicate.lower().strip())
+
+    def _match_properties(self, pred_lower: str) -> List[str]:
         # Direct match
         if pred_lower in self.PREDICATE_MAP:
             return self.PREDICATE_MAP[pred_lower]
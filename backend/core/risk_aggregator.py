@@ -1,6 +1,16 @@
 from typing import List, Dict, Any
 from .hallucination_models import HallucinationFlag
 
+# Verdicts that participate in the canonical risk equation
+_RISK_VERDICTS = frozenset({
+    "REFUTED",
+    "INSUFFICIENT_EVIDENCE",
+    "UNCERTAIN",
+    "PARTIALLY_SUPPORTED",
+    "SUPPORTED",
+    "SUPPORTED_WEAK",
+})
+
 class RiskAggregator:
     def __init__(self):
         pass
@@ -12,30 +22,22 @@ class RiskAggregator:
         Dampened for small samples.
         """
         # 1. Canonical Claim Set (Meaningful Participation)
-        # Filter for verdicts that impact risk calculus
-        valid_verdicts = {
-            "REFUTED", 
-            "INSUFFICIENT_EVIDENCE", 
-            "UNCERTAIN", 
-            "PARTIALLY_SUPPORTED",
-            "SUPPORTED", 
-            "SUPPORTED_WEAK"
-        }
-        
-        epistemic_claims = [
-            c for c in (claims or [])
-            if c.get("verification", {}).get("verdict") in valid_verdicts
-        ]
+        # Tally verdicts in one pass; only _RISK_VERDICTS impact the risk calculus
+        verdict_counts: Dict[str, int] = {}
+        for c in (claims or []):
+            verdict = c.get("verification", {}).get("verdict")
+            if verdict in _RISK_VERDICTS:
+                verdict_counts[verdict] = verdict_counts.get(verdict, 0) + 1
         
-        T = len(epistemic_claims)
+        T = sum(verdict_counts.values())
         safe_T = max(1, T)
         
         # 2. Counts
-        R_count = sum(1 for c in epistemic_claims if c.get("verification", {}).get("verdict") == "REFUTED")
-        I_count = sum(1 for c in epistemic_claims if c.get("verification", {}).get("verdict") == "INSUFFICIENT_EVIDENCE")
-        partial_count = sum(1 for c in epistemic_claims if c.get("verification", {}).get("verdict") == "PARTIALLY_SUPPORTED")
-        U_count = sum(1 for c in epistemic_claims if c.get("verification", {}).get("verdict") == "UNCERTAIN") + partial_count
-        S_count = sum(1 for c in epistemic_claims if c.get("verification", {}).get("verdict") in ["SUPPORTED", "SUPPORTED_WEAK"]) 
+        R_count = verdict_counts.get("REFUTED", 0)
+        I_count = verdict_counts.get("INSUFFICIENT_EVIDENCE", 0)
+        partial_count = verdict_counts.get("PARTIALLY_SUPPORTED", 0)
+        U_count = verdict_counts.get("UNCERTAIN", 0) + partial_count
+        S_count = verdict_counts.get("SUPPORTED", 0) + verdict_counts.get("SUPPORTED_WEAK", 0)
         
         # 3. Ratios
         r = R_count / safe_T
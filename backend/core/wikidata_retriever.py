@@ -1,7 +1,64 @@
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
-import uuid
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Any, Optional, Set
-from config.core_config import EVIDENCE_MODALITY_STRUCTURED
+from .evidence_ids import evidence_uuid
+from config.core_config import (
+    EVIDENCE_MODALITY_STRUCTURED,
+    ENABLE_WIKIDATA_HTTP_CACHE,
+    WIKIDATA_HTTP_CACHE_NAME,
+    WIKIDATA_HTTP_CACHE_EXPIRE_S,
+    WIKIDATA_HTTP_RETRIES,
+    WIKIDATA_HTTP_BACKOFF_S,
+)
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+# Years as they appear in claim objects and parsed values, and the signed
+# year prefix of Wikidata time values (+1999-01-01T00:00:00Z)
+_YEAR_RE = re.compile(r'\b(\d{4})\b')
+_ISO_YEAR_RE = re.compile(r'([+\-]\d{4})')
+
+
+def _parse_time_value(val: Dict[str, Any]) -> str:
+    # Extract year from ISO format +1999-01-01T00:00:00Z
+    time_str = val.get("time", "")
+    if time_str.startswith("+") or time_str.startswith("-"):
+        m = _ISO_YEAR_RE.search(time_str)
+        if m:
+            return m.group(1).lstrip("+")
+    return time_str
+
+
+# Datavalue type -> parser; unlisted types fall back to str(val)
+_VALUE_PARSERS = {
+    "string": lambda val: val,
+    "wikibase-entityid": lambda val: val.get("id"),
+    "time": _parse_time_value,
+    "quantity": lambda val: str(val.get("amount", "")),
+}
+
+
+def _json_body(resp: requests.Response) -> Any:
+    # Entity payloads are large; orjson parses the raw bytes several times faster
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
 
 class WikidataRetriever:
     """
@@ -10,16 +67,63 @@ class WikidataRetriever:
     declarative sentences for verification.
     """
     
+    # wbgetentities accepts at most 50 ids per request
+    WIKIDATA_BATCH_SIZE = 50
+    # Concurrent wbgetentities batches during prefetch
+    BATCH_FETCH_WORKERS = 4
+
     def __init__(self):
         self.WIKIDATA_API_URL = "https://www.wikidata.org/w/api.php"
-        self.session = requests.Session()
-        self.session.headers.update({
-             "User-Agent": "EpistemicAuditEngine/1.0 (Research Project)"
-        })
+        # Evidence retrieval runs claims on a persistent thread pool; each
+        # thread keeps its own session for the life of the retriever
+        self._local = threading.local()
+        # Created once so batch threads and their sessions are reused across prefetches
+        self._batch_pool = ThreadPoolExecutor(
+            max_workers=self.BATCH_FETCH_WORKERS, thread_name_prefix="wikidata-batch"
+        )
         self.entity_cache = {}
         self.place_containment_cache: Dict[str, Dict[str, List[str]]] = {}
         self.request_timeout_s = 5.0
 
+    @property
+    def session(self) -> requests.Session:
+        """
+        HTTP session for the calling thread (requests.Session is not thread-safe).
+
+        With requests-cache installed, GET responses are persisted to SQLite so
+        repeated entities are served locally across runs. The database runs in
+        WAL mode, as threads and pool processes write it concurrently.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            if requests_cache is not None and ENABLE_WIKIDATA_HTTP_CACHE:
+                session = requests_cache.CachedSession(
+                    WIKIDATA_HTTP_CACHE_NAME,
+                    backend="sqlite",
+                    expire_after=WIKIDATA_HTTP_CACHE_EXPIRE_S,
+                    allowable_methods=("GET",),
+                    wal=True,
+                )
+            else:
+                session = requests.Session()
+            session.headers.update({
+                "User-Agent": "EpistemicAuditEngine/1.0 (Research Project)"
+            })
+            # Retry transient server errors instead of silently dropping the entity;
+            # a read timeout is not retried and a connect failure only once, so a
+            # dead endpoint cannot multiply the caller's request timeout
+            session.mount("https://", HTTPAdapter(max_retries=Retry(
+                total=WIKIDATA_HTTP_RETRIES,
+                connect=1,
+                read=0,
+                status=WIKIDATA_HTTP_RETRIES,
+                backoff_factor=WIKIDATA_HTTP_BACKOFF_S,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=("GET",),
+            )))
+            self._local.session = session
+        return session
+
     def retrieve_structured_evidence(self, q_id: str, p_ids: List[str], claim: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Fetches structured claims from Wikidata for a specific entity and property list.
@@ -36,16 +140,6 @@ class WikidataRetriever:
         if not q_id or not p_ids:
             return []
 
-        # Prepare Props
-        props = "|".join(p_ids)
-        params = {
-            "action": "wbgetentities",
-            "ids": q_id,
-            "props": "claims|labels",
-            "languages": "en",
-            "format": "json"
-        }
-
         found_evidence = []
         try:
             entity = self._get_entity(q_id)
@@ -53,14 +147,16 @@ class WikidataRetriever:
             claims_data = entity.get("claims", {})
             entity_label = entity.get("labels", {}).get("en", {}).get("value", "Entity")
 
+            # Walk p_ids (not claims_data) so evidence keeps the requested property order
             for pid in p_ids:
-                if pid in claims_data:
-                    stmts = claims_data[pid]
-                    for stmt in stmts:
-                        # Pass claim for alignment computation
-                        evidence_item = self._process_statement(stmt, q_id, pid, entity_label, claim)
-                        if evidence_item:
-                            found_evidence.append(evidence_item)
+                stmts = claims_data.get(pid)
+                if not stmts:
+                    continue
+                for stmt in stmts:
+                    # Pass claim for alignment computation
+                    evidence_item = self._process_statement(stmt, q_id, pid, entity_label, claim)
+                    if evidence_item:
+                        found_evidence.append(evidence_item)
 
             return found_evidence
 
@@ -144,6 +240,62 @@ class WikidataRetriever:
         self.place_containment_cache[q_id] = payload
         return payload
 
+    def prefetch_entities(self, queries: Dict[str, Set[str]]) -> None:
+        """
+        Warm entity_cache for upcoming retrieve_structured_evidence calls.
+
+        `queries` maps each QID to the property IDs that will be read from it.
+        The entities are fetched first, then the QID-valued targets of those
+        properties (needed for value labels), each in batched requests.
+        """
+        self._fetch_entities(queries)
+        value_qids = []
+        for q_id, p_ids in queries.items():
+            claims_data = self.entity_cache.get(q_id, {}).get("claims", {})
+            for pid in p_ids:
+                value_qids.extend(self._extract_entity_ids(claims_data.get(pid, [])))
+        self._fetch_entities(value_qids)
+
+    def _fetch_entities(self, q_ids) -> None:
+        """
+        Fetch uncached entities with wbgetentities, WIKIDATA_BATCH_SIZE ids per request.
+
+        Batches are requested concurrently; results are merged into entity_cache
+        on the calling thread in batch order. A failed batch is skipped;
+        _get_entity then fetches those ids one by one.
+        """
+        pending = [q_id for q_id in dict.fromkeys(q_ids) if q_id and q_id not in self.entity_cache]
+        batches = [
+            pending[start:start + self.WIKIDATA_BATCH_SIZE]
+            for start in range(0, len(pending), self.WIKIDATA_BATCH_SIZE)
+        ]
+        if len(batches) > 1:
+            results = list(self._batch_pool.map(self._fetch_entity_batch, batches))
+        else:
+            results = [self._fetch_entity_batch(batch) for batch in batches]
+
+        for batch, entities in zip(batches, results):
+            for q_id in batch:
+                if q_id in entities:
+                    self.entity_cache[q_id] = entities[q_id]
+
+    def _fetch_entity_batch(self, batch: List[str]) -> Dict[str, Any]:
+        params = {
+            "action": "wbgetentities",
+            "ids": "|".join(batch),
+            "props": "claims|labels",
+            "languages": "en",
+            "format": "json"
+        }
+        try:
+            resp = self.session.get(self.WIKIDATA_API_URL, params=params, timeout=self.request_timeout_s)
+            return _json_body(resp).get("entities", {})
+        except Exception:
+            # _get_entity refetches these ids one by one; log so a locked cache
+            # or network failure is not mistaken for missing evidence
+            logger.warning("Wikidata batch fetch failed for %d ids", len(batch), exc_info=True)
+            return {}
+
     def _get_entity(self, q_id: str) -> Dict[str, Any]:
         if q_id in self.entity_cache:
             return self.entity_cache[q_id]
@@ -156,7 +308,7 @@ class WikidataRetriever:
             "format": "json"
         }
         resp = self.session.get(self.WIKIDATA_API_URL, params=params, timeout=self.request_timeout_s)
-        data = resp.json()
+        data = _json_body(resp)
         entity = data.get("entities", {}).get(q_id, {})
         self.entity_cache[q_id] = entity
         return entity
@@ -208,11 +360,10 @@ class WikidataRetriever:
         if not parsed_value:
             return None
 
+        # Entity values parse to their QID; only those need a label lookup
         value_label = ""
-        if val_type == "wikibase-entityid" and isinstance(val, dict):
-            qid = val.get("id")
-            if qid:
-                value_label = self._extract_label(self._get_entity(qid), qid)
+        if val_type == "wikibase-entityid":
+            value_label = self._extract_label(self._get_entity(parsed_value), parsed_value)
 
         # Template Generation
         display_value = value_label or parsed_value
@@ -257,8 +408,6 @@ class WikidataRetriever:
         This alignment enables structured evidence to independently yield SUPPORTED
         verdicts when all relevant fields match, without requiring narrative confirmation.
         """
-        import re
-
         if not claim:
             # Default alignment when no claim context
             return {
@@ -298,8 +447,8 @@ class WikidataRetriever:
             claim_obj_lower = claim_object.lower()
 
             # Temporal comparison: Extract years and compare
-            claim_years = re.findall(r'\b(\d{4})\b', claim_object)
-            value_years = re.findall(r'\b(\d{4})\b', str(value))
+            claim_years = _YEAR_RE.findall(claim_object)
+            value_years = _YEAR_RE.findall(str(value))
 
             if claim_years and value_years:
                 # Check if any claim year matches any evidence year
@@ -322,22 +471,10 @@ class WikidataRetriever:
         }
 
     def _parse_value(self, val: Any, val_type: str) -> Optional[str]:
-        if val_type == "string":
-            return val
-        elif val_type == "wikibase-entityid":
-            return val.get("id")
-        elif val_type == "time":
-            # Extract year from ISO format +1999-01-01T00:00:00Z
-            time_str = val.get("time", "")
-            if time_str.startswith("+") or time_str.startswith("-"):
-                 import re
-                 m = re.search(r'([+\-]\d{4})', time_str)
-                 if m: return m.group(1).lstrip("+")
-            return time_str
-        elif val_type == "quantity":
-            return str(val.get("amount", ""))
-        return str(val)
+        parser = _VALUE_PARSERS.get(val_type)
+        if parser is None:
+            return str(val)
+        return parser(val)
 
     def _generate_evidence_id(self, qid: str, pid: str, val: str) -> str:
-        unique_str = f"WIKIDATA:{qid}:{pid}:{val}"
-        return str(uuid.uuid5(uuid.NAMESPACE_OID, unique_str))
+        return evidence_uuid(f"WIKIDATA:{qid}:{pid}:{val}")
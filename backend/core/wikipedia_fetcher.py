@@ -10,7 +10,8 @@ class WikipediaFetcher:
             "User-Agent": "EpistemicAuditEngine/1.0 (Research Project)"
         })
         try:
-             self.nlp = spacy.load("en_core_web_sm")
+             # Only sentence boundaries (parser) are used
+             self.nlp = spacy.load("en_core_web_sm", exclude=["ner", "lemmatizer"])
         except:
              self.nlp = None
 
@@ -1,12 +1,15 @@
 import logging
 import re
 import copy
+import threading
 from html import unescape
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from urllib.parse import quote, urlparse, parse_qs
 
+import numpy as np
 import requests
 import spacy
+from spacy.attrs import ENT_TYPE
 
 try:
     from bs4 import BeautifulSoup
@@ -22,18 +25,25 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+_LOCATION_ENT_LABELS = ("GPE", "LOC", "FAC")
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9_\-]{2,}")
+_KEYWORD_STOPWORDS = frozenset({
+    "the", "and", "for", "with", "from", "that", "this", "was", "were", "are", "is", "in", "on", "of", "to", "by", "as", "at",
+    "a", "an", "it", "its", "their", "his", "her", "or", "be", "been", "has", "have", "had", "into", "than", "most"
+})
+
 
 class WikipediaPassageRetriever:
     def __init__(self):
         self.API_URL = "https://en.wikipedia.org/w/api.php"
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "EpistemicAuditEngine/1.0 (Research Project)"
-        })
+        # Evidence retrieval runs claims on a persistent thread pool; each
+        # thread keeps its own session for the life of the retriever
+        self._local = threading.local()
         self.request_timeout_s = 8.0
 
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            # Parser for sentence splitting, NER for location checks; lemmas are never read
+            self.nlp = spacy.load("en_core_web_sm", exclude=["lemmatizer"])
         except Exception:
             self.nlp = None
             logger.warning("SpaCy model 'en_core_web_sm' not found. Sentence segmentation will use regex fallback.")
@@ -48,6 +58,18 @@ class WikipediaPassageRetriever:
         self._revision_cache: Dict[str, Optional[int]] = {}
         self._passage_cache: Dict[str, List[Dict[str, Any]]] = {}
 
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session for the calling thread (requests.Session is not thread-safe)."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                "User-Agent": "EpistemicAuditEngine/1.0 (Research Project)"
+            })
+            self._local.session = session
+        return session
+
     def extract_passages(self, wiki_url: str, claim_text: str, max_passages: int = 2) -> List[Dict[str, Any]]:
         """
         Extract high-signal narrative snippets copied directly from Wikipedia parse HTML,
@@ -169,12 +191,11 @@ class WikipediaPassageRetriever:
         return self._extract_with_regex(html)
 
     def _extract_with_bs4(self, html: str) -> List[Dict[str, Any]]:
-        records: List[Dict[str, Any]] = []
+        paragraphs: List[Tuple[Optional[str], str]] = []
         soup = BeautifulSoup(html, "html.parser")
         root = soup.find("div", class_="mw-parser-output") or soup
 
         current_anchor = None
-        paragraph_index = 0
         for child in root.children:
             name = getattr(child, "name", None)
             if not name:
@@ -194,23 +215,13 @@ class WikipediaPassageRetriever:
             if len(paragraph) < 40:
                 continue
 
-            for sentence in self._split_sentences(paragraph):
-                sentence = self._clean_text(sentence)
-                if len(sentence) < 25:
-                    continue
-                records.append({
-                    "sentence": sentence,
-                    "anchor": current_anchor,
-                    "paragraph_index": paragraph_index,
-                })
-            paragraph_index += 1
+            paragraphs.append((current_anchor, paragraph))
 
-        return records
+        return self._records_from_paragraphs(paragraphs)
 
     def _extract_with_regex(self, html: str) -> List[Dict[str, Any]]:
-        records: List[Dict[str, Any]] = []
+        paragraphs: List[Tuple[Optional[str], str]] = []
         current_anchor = None
-        paragraph_index = 0
 
         for match in re.finditer(r"<(h[2-4]|p)\b[^>]*>(.*?)</\1>", html, flags=re.IGNORECASE | re.DOTALL):
             tag_name = (match.group(1) or "").lower()
@@ -226,24 +237,36 @@ class WikipediaPassageRetriever:
             if len(text) < 40:
                 continue
 
-            for sentence in self._split_sentences(text):
+            paragraphs.append((current_anchor, text))
+
+        return self._records_from_paragraphs(paragraphs)
+
+    def _records_from_paragraphs(self, paragraphs: List[Tuple[Optional[str], str]]) -> List[Dict[str, Any]]:
+        records: List[Dict[str, Any]] = []
+        split = self._split_sentences_batch([text for _, text in paragraphs])
+        for paragraph_index, ((anchor, _), sentences) in enumerate(zip(paragraphs, split)):
+            for sentence in sentences:
                 sentence = self._clean_text(sentence)
                 if len(sentence) < 25:
                     continue
                 records.append({
                     "sentence": sentence,
-                    "anchor": current_anchor,
+                    "anchor": anchor,
                     "paragraph_index": paragraph_index,
                 })
-            paragraph_index += 1
-
         return records
 
     def _split_sentences(self, text: str) -> List[str]:
+        return self._split_sentences_batch([text])[0]
+
+    def _split_sentences_batch(self, texts: List[str]) -> List[List[str]]:
+        # One nlp.pipe pass over every paragraph; sentence boundaries come from the parser
         if self.nlp:
-            doc = self.nlp(text)
-            return [s.text.strip() for s in doc.sents if s.text.strip()]
-        return [s.strip() for s in re.split(r"(?<=[.!?])\s+", text) if s.strip()]
+            return [
+                [s.text.strip() for s in doc.sents if s.text.strip()]
+                for doc in self.nlp.pipe(texts, batch_size=64, disable=["ner", "lemmatizer"])
+            ]
+        return [[s.strip() for s in re.split(r"(?<=[.!?])\s+", text) if s.strip()] for text in texts]
 
     def _score_sentences(self, records: List[Dict[str, Any]], claim_text: str) -> List[Dict[str, Any]]:
         features = self._extract_claim_features(claim_text)
@@ -258,6 +281,11 @@ class WikipediaPassageRetriever:
             except Exception as exc:
                 logger.debug("SBERT scoring unavailable: %s", exc)
 
+        location_flags = (
+            self._sentences_have_location_entity([r.get("sentence", "") for r in records])
+            if is_location_claim else []
+        )
+
         scored: List[Dict[str, Any]] = []
         for idx, record in enumerate(records):
             sentence = record.get("sentence", "")
@@ -279,7 +307,7 @@ class WikipediaPassageRetriever:
                 score += 0.04
 
             if is_location_claim:
-                has_location_entity = self._sentence_has_location_entity(sentence)
+                has_location_entity = location_flags[idx]
                 if has_location_entity:
                     score += 0.14
                 if any(token in sentence_lower for token in (" located ", " country ", " city ", " capital ")):
@@ -369,7 +397,9 @@ class WikipediaPassageRetriever:
                     return anchor
 
         features = self._extract_claim_features(f"{claim_text} {sentence}")
-        keywords = set(features["keywords"])
+        keywords = frozenset(features["keywords"])
+        if not keywords:
+            return None
 
         best_anchor = None
         best_overlap = 0
@@ -379,8 +409,8 @@ class WikipediaPassageRetriever:
             if not anchor or not line:
                 continue
 
-            section_tokens = set(re.findall(r"[a-z][a-z0-9_\-]{2,}", line))
-            overlap = len(section_tokens.intersection(keywords))
+            # Intersect straight from the token stream; no per-section set is built
+            overlap = len(keywords.intersection(_TOKEN_RE.findall(line)))
             if overlap > best_overlap:
                 best_overlap = overlap
                 best_anchor = anchor
@@ -403,13 +433,8 @@ class WikipediaPassageRetriever:
         years = re.findall(r"\b(1\d{3}|20\d{2})\b", text)
         numbers = re.findall(r"\b\d+(?:\.\d+)?\b", text)
 
-        stopwords = {
-            "the", "and", "for", "with", "from", "that", "this", "was", "were", "are", "is", "in", "on", "of", "to", "by", "as", "at",
-            "a", "an", "it", "its", "their", "his", "her", "or", "be", "been", "has", "have", "had", "into", "than", "most"
-        }
-
-        tokens = re.findall(r"[a-z][a-z0-9_\-]{2,}", text)
-        keywords = [t for t in tokens if t not in stopwords]
+        tokens = _TOKEN_RE.findall(text)
+        keywords = [t for t in tokens if t not in _KEYWORD_STOPWORDS]
 
         return {
             "keywords": keywords[:20],
@@ -458,13 +483,20 @@ class WikipediaPassageRetriever:
         )
 
     def _sentence_has_location_entity(self, sentence: str) -> bool:
+        return self._sentences_have_location_entity([sentence])[0]
+
+    def _sentences_have_location_entity(self, sentences: List[str]) -> List[bool]:
         if not self.nlp:
-            return False
+            return [False] * len(sentences)
         try:
-            doc = self.nlp(sentence)
+            docs = list(self.nlp.pipe(sentences, batch_size=64, disable=["parser", "lemmatizer"]))
         except Exception:
-            return False
-        return any(ent.label_ in {"GPE", "LOC", "FAC"} for ent in doc.ents)
+            return [False] * len(sentences)
+        # Compare entity-type hashes per token instead of building Span objects
+        location_ids = np.array(
+            [self.nlp.vocab.strings[label] for label in _LOCATION_ENT_LABELS], dtype=np.uint64
+        )
+        return [bool(np.isin(doc.to_array(ENT_TYPE), location_ids).any()) for doc in docs]
 
     def _clip_words(self, sentence: str, max_words: int = 60) -> str:
         words = sentence.split()
@@ -21,11 +21,67 @@ H1-H6 Mapping (aligned with evaluation research):
 """
 
 import re
-from typing import Dict, Any, List, Optional, Set
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, fields
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-@dataclass
+
+# H5 predicate families: surface predicates that assert the same fact
+_H5_PREDICATE_FAMILIES = (
+    (("founded", "established", "created", "started"), "inception"),
+    (("born", "birth"), "birth"),
+    (("died", "death"), "death"),
+)
+
+
+class _MarkerScanner:
+    """
+    Substring search for a fixed marker set.
+
+    With pyahocorasick installed, all markers are found in one pass over the
+    text; otherwise each marker gets its own `in` test. Found markers are
+    reported in the marker set's own iteration order either way.
+    """
+
+    __slots__ = ("markers", "_automaton")
+
+    def __init__(self, markers):
+        self.markers = tuple(markers)
+        self._automaton = None
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for marker in self.markers:
+                self._automaton.add_word(marker, marker)
+            self._automaton.make_automaton()
+
+    def any_in(self, text: str) -> bool:
+        if self._automaton is None:
+            return any(m in text for m in self.markers)
+        for _ in self._automaton.iter(text):
+            return True
+        return False
+
+    def found_in(self, text: str) -> List[str]:
+        if self._automaton is None:
+            return [m for m in self.markers if m in text]
+        hits = {m for _, m in self._automaton.iter(text)}
+        return [m for m in self.markers if m in hits] if hits else []
+
+
+def _normalize_predicate(p: str) -> str:
+    """Normalize predicates for H5 comparison."""
+    p = p.lower().strip()
+    for markers, family in _H5_PREDICATE_FAMILIES:
+        if any(t in p for t in markers):
+            return family
+    return p
+
+
+@dataclass(slots=True)
 class HallucinationAttribution:
     """Rule-backed hallucination attribution."""
     type: str                          # H1-H6
@@ -36,7 +92,11 @@ class HallucinationAttribution:
     thresholds_used: Dict[str, float]  # For reproducibility
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {name: getattr(self, name) for name in _ATTRIBUTION_FIELDS}
+
+
+# Field names in declaration order, resolved once for to_dict()
+_ATTRIBUTION_FIELDS = tuple(f.name for f in fields(HallucinationAttribution))
 
 
 class HallucinationAttributor:
@@ -91,12 +151,15 @@ class HallucinationAttributor:
     }
 
     def __init__(self):
-        self._contradiction_cache: Dict[str, Set[str]] = {}
+        self._assertive_scanner = _MarkerScanner(self.ASSERTIVE_MARKERS)
+        self._certainty_scanner = _MarkerScanner(self.CERTAINTY_MARKERS)
+        self._evaluative_scanner = _MarkerScanner(self.THRESHOLDS["h6_evaluative_terms"])
 
     def attribute_hallucinations(
         self,
         claim: Dict[str, Any],
-        all_claims: Optional[List[Dict[str, Any]]] = None
+        all_claims: Optional[List[Dict[str, Any]]] = None,
+        h5_index: Optional[Dict[Tuple[str, str], List[Dict[str, Any]]]] = None
     ) -> List[HallucinationAttribution]:
         """
         Analyze a claim and return all applicable hallucination attributions.
@@ -104,6 +167,8 @@ class HallucinationAttributor:
         Args:
             claim: Claim with alignment scores, linguistic signals, verification
             all_claims: All claims in document (for H5 cross-claim check)
+            h5_index: build_h5_index(all_claims), built once per document by
+                the caller; built here for this claim alone if omitted
 
         Returns:
             List of HallucinationAttribution objects
@@ -132,7 +197,9 @@ class HallucinationAttributor:
 
         # H5: Internal Contradiction (requires all claims)
         if all_claims:
-            h5 = self._check_h5_contradiction(claim, all_claims)
+            if h5_index is None:
+                h5_index = self.build_h5_index(all_claims)
+            h5 = self._check_h5_contradiction(claim, h5_index)
             if h5:
                 attributions.append(h5)
 
@@ -167,7 +234,7 @@ class HallucinationAttributor:
 
         if absolutism < self.THRESHOLDS["h1_absolutism_min"]:
             # Check for assertive markers in text
-            has_assertive = any(m in claim_text for m in self.ASSERTIVE_MARKERS)
+            has_assertive = self._assertive_scanner.any_in(claim_text)
             if not has_assertive:
                 return None
 
@@ -276,7 +343,7 @@ class HallucinationAttributor:
             return None
 
         # Check certainty markers
-        found_markers = [m for m in self.CERTAINTY_MARKERS if m in claim_text]
+        found_markers = self._certainty_scanner.found_in(claim_text)
 
         # Also check modal_strength
         if modal_strength < self.THRESHOLDS["h3_modal_strength_min"] and not found_markers:
@@ -360,7 +427,7 @@ class HallucinationAttributor:
     def _check_h5_contradiction(
         self,
         claim: Dict[str, Any],
-        all_claims: List[Dict[str, Any]]
+        h5_index: Dict[Tuple[str, str], List[Dict[str, Any]]]
     ) -> Optional[HallucinationAttribution]:
         """
         H5: Internal Contradiction
@@ -380,49 +447,33 @@ class HallucinationAttributor:
         if not subject:
             return None
 
-        # Build signature for comparison
-        def normalize_pred(p):
-            """Normalize predicates for comparison."""
-            p = p.lower().strip()
-            # Temporal predicates
-            if any(t in p for t in ["founded", "established", "created", "started"]):
-                return "inception"
-            if any(t in p for t in ["born", "birth"]):
-                return "birth"
-            if any(t in p for t in ["died", "death"]):
-                return "death"
-            return p
-
-        claim_pred = normalize_pred(predicate)
-
-        # Find contradicting claims
+        claim_pred = _normalize_predicate(predicate)
+
+        # Find contradicting claims: only claims with the same subject and
+        # predicate type can conflict, so scan just that group
         contradictions = []
-        for other in all_claims:
+        for other in h5_index.get((subject, claim_pred), ()):
             if other.get("claim_id") == claim_id:
                 continue
 
-            other_subject = other.get("subject_entity", {}).get("entity_id", "")
-            other_pred = normalize_pred(other.get("predicate", ""))
             other_obj = other.get("object", "")
             other_obj_entity = other.get("object_entity", {}).get("entity_id", "")
 
-            # Same subject and predicate type
-            if other_subject == subject and other_pred == claim_pred:
-                # Different objects = potential contradiction
-                if obj_entity and other_obj_entity:
-                    if obj_entity != other_obj_entity:
-                        contradictions.append({
-                            "claim_id": other.get("claim_id"),
-                            "object": other_obj,
-                            "this_object": obj
-                        })
-                elif obj.lower() != other_obj.lower():
-                    # Text comparison for unlinked entities
+            # Different objects = potential contradiction
+            if obj_entity and other_obj_entity:
+                if obj_entity != other_obj_entity:
                     contradictions.append({
                         "claim_id": other.get("claim_id"),
                         "object": other_obj,
                         "this_object": obj
                     })
+            elif obj.lower() != other_obj.lower():
+                # Text comparison for unlinked entities
+                contradictions.append({
+                    "claim_id": other.get("claim_id"),
+                    "object": other_obj,
+                    "this_object": obj
+                })
 
         if not contradictions:
             return None
@@ -440,6 +491,25 @@ class HallucinationAttributor:
             thresholds_used={}
         )
 
+    @staticmethod
+    def build_h5_index(
+        all_claims: List[Dict[str, Any]]
+    ) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+        """
+        Group a document's claims by (subject entity, normalized predicate).
+
+        Build once per document and pass to attribute_hallucinations for
+        every claim, instead of rescanning all claims for each claim.
+        """
+        groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for other in all_claims:
+            key = (
+                other.get("subject_entity", {}).get("entity_id", ""),
+                _normalize_predicate(other.get("predicate", "")),
+            )
+            groups.setdefault(key, []).append(other)
+        return groups
+
     def _check_h6_ungrounded_opinion(
         self,
         claim: Dict[str, Any]
@@ -457,8 +527,7 @@ class HallucinationAttributor:
         alignment = claim.get("alignment_score", 0.0)
 
         # Check for evaluative terms
-        evaluative_terms = self.THRESHOLDS["h6_evaluative_terms"]
-        found_terms = [t for t in evaluative_terms if t in claim_text]
+        found_terms = self._evaluative_scanner.found_in(claim_text)
 
         if not found_terms:
             return None
@@ -493,7 +562,8 @@ class HallucinationAttributor:
 def attribute_claim_hallucinations(
     claim: Dict[str, Any],
     all_claims: Optional[List[Dict[str, Any]]] = None,
-    attributor: Optional[HallucinationAttributor] = None
+    attributor: Optional[HallucinationAttributor] = None,
+    h5_index: Optional[Dict[Tuple[str, str], List[Dict[str, Any]]]] = None
 ) -> Dict[str, Any]:
     """
     Convenience function to attribute hallucinations to a claim.
@@ -504,9 +574,29 @@ def attribute_claim_hallucinations(
     if attributor is None:
         attributor = HallucinationAttributor()
 
-    attributions = attributor.attribute_hallucinations(claim, all_claims)
+    attributions = attributor.attribute_hallucinations(claim, all_claims, h5_index)
 
     # Convert to dicts and store
     claim["hallucination_attributions"] = [a.to_dict() for a in attributions]
 
     return claim
+
+
+def attribute_document_hallucinations(
+    claims: List[Dict[str, Any]],
+    attributor: Optional[HallucinationAttributor] = None
+) -> List[Dict[str, Any]]:
+    """
+    Attribute hallucinations to every claim in a document.
+
+    The H5 index is built once for the document and shared by all claims.
+    Modifies claims in-place and returns them.
+    """
+    if attributor is None:
+        attributor = HallucinationAttributor()
+
+    h5_index = HallucinationAttributor.build_h5_index(claims)
+    for claim in claims:
+        attribute_claim_hallucinations(claim, claims, attributor, h5_index)
+
+    return claims
@@ -18,7 +18,7 @@ from core.evidence_retriever import EvidenceRetriever
 from core.claim_verifier import ClaimVerifier
 from core.hallucination_detector import HallucinationDetector
 from core.risk_aggregator import RiskAggregator
-from core.entity_context import EntityContext
+from core.entity_context import EntityContext, RESOLVED_STATUSES
 
 class AuditPipeline:
     def __init__(self, config_path: str = None):
@@ -209,12 +209,14 @@ class AuditPipeline:
 
             # Register resolved entities to context for subsequent claims
             subj_ent = linked_claim.get("subject_entity", {})
-            if subj_ent.get("resolution_status") in ["RESOLVED", "RESOLVED_SOFT", "RESOLVED_COREF"]:
-                entity_context.register_entity(subj_ent, claim.get("sentence_id", 0))
-
             obj_ent = linked_claim.get("object_entity", {})
-            if obj_ent and obj_ent.get("resolution_status") in ["RESOLVED", "RESOLVED_SOFT", "RESOLVED_COREF"]:
-                entity_context.register_entity(obj_ent, claim.get("sentence_id", 0))
+            to_register = [
+                ent for ent in (subj_ent, obj_ent)
+                if ent and ent.get("resolution_status") in RESOLVED_STATUSES
+            ]
+            if to_register:
+                sentence_idx = claim.get("sentence_id", 0)
+                entity_context.register_entities(to_register, [sentence_idx] * len(to_register))
 
             linked_claims.append(linked_claim)
 
@@ -296,7 +298,7 @@ class AuditPipeline:
             # Stabilization Logic (Fix 3 & 5)
             verdict = claim.get("verification", {}).get("verdict")
             subj = claim.get("subject_entity", {})
-            is_resolved = subj.get("resolution_status") in ["RESOLVED", "RESOLVED_SOFT", "RESOLVED_COREF"]
+            is_resolved = subj.get("resolution_status") in RESOLVED_STATUSES
             
             canonical_predicates = ["founded", "founder", "launched", "released", "created", "born", "died", "established", "inception"]
             is_canonical = any(k in claim.get("predicate", "").lower() for k in canonical_predicates)
@@ -330,9 +332,8 @@ class AuditPipeline:
             obj = c.get("object_entity", {})
             
             # Key based on IDs if resolved, else text (v1.4: include RESOLVED_COREF)
-            valid_statuses = ["RESOLVED", "RESOLVED_SOFT", "RESOLVED_COREF"]
-            sid = subj.get("entity_id") if subj.get("resolution_status") in valid_statuses else c.get("subject", "").lower()
-            oid = obj.get("entity_id") if obj and obj.get("resolution_status") in valid_statuses else c.get("object", "").lower()
+            sid = subj.get("entity_id") if subj.get("resolution_status") in RESOLVED_STATUSES else c.get("subject", "").lower()
+            oid = obj.get("entity_id") if obj and obj.get("resolution_status") in RESOLVED_STATUSES else c.get("object", "").lower()
             pred = c.get("predicate", "").lower()
             
             key = (sid, pred, oid)
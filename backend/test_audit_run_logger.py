@@ -0,0 +1,73 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.audit_run_logger import AuditRunLogger
+
+
+def _result(score):
+    return {"overall_risk": "LOW", "hallucination_score": score, "summary": {"claims": 1}}
+
+
+class TestAuditRunLoggerBatching(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.log_path = Path(self._tmp.name) / "runs" / "audit_runs.jsonl"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _lines(self):
+        if not self.log_path.exists():
+            return []
+        return [json.loads(line) for line in self.log_path.read_text(encoding="utf-8").splitlines()]
+
+    def test_unbatched_writes_each_run(self):
+        logger = AuditRunLogger(self.log_path)
+        logger.log_run("Paris is in France.", "demo", _result(0.1))
+        self.assertEqual(len(self._lines()), 1)
+        logger.log_run("Zürich is in Switzerland.", None, _result(0.2))
+        records = self._lines()
+        self.assertEqual([r["input_text"] for r in records],
+                         ["Paris is in France.", "Zürich is in Switzerland."])
+        self.assertEqual([r["mode"] for r in records], ["demo", "research"])
+
+    def test_batch_buffers_until_full(self):
+        logger = AuditRunLogger(self.log_path, batch_size=3)
+        logger.log_run("a", "research", _result(0.1))
+        logger.log_run("b", "research", _result(0.2))
+        self.assertEqual(self._lines(), [])
+        logger.log_run("c", "research", _result(0.3))
+        self.assertEqual([r["input_text"] for r in self._lines()], ["a", "b", "c"])
+        self.assertEqual(logger._pending, [])
+
+    def test_flush_writes_partial_batch_in_order(self):
+        logger = AuditRunLogger(self.log_path, batch_size=10)
+        for i in range(4):
+            logger.log_run(f"text {i}", "research", _result(i / 10), {"case": i})
+        self.assertEqual(self._lines(), [])
+        logger.flush()
+        records = self._lines()
+        self.assertEqual([r["input_text"] for r in records], [f"text {i}" for i in range(4)])
+        self.assertEqual([r["case"] for r in records], [0, 1, 2, 3])
+        self.assertEqual([r["hallucination_score"] for r in records], [0.0, 0.1, 0.2, 0.3])
+
+    def test_flush_with_nothing_pending(self):
+        logger = AuditRunLogger(self.log_path, batch_size=5)
+        logger.flush()
+        self.assertFalse(self.log_path.exists())
+
+    def test_batch_size_below_one_is_unbatched(self):
+        logger = AuditRunLogger(self.log_path, batch_size=0)
+        self.assertEqual(logger.batch_size, 1)
+        logger.log_run("a", "research", _result(0.1))
+        self.assertEqual(len(self._lines()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.entity_context import EntityContext
+
+
+def _entity(entity_id, entity_type="ORG", status="RESOLVED", name=None):
+    return {
+        "entity_id": entity_id,
+        "canonical_name": name or entity_id,
+        "entity_type": entity_type,
+        "resolution_status": status,
+        "confidence": 0.9,
+        "sources": {"wikidata": entity_id},
+    }
+
+
+BATCH = [
+    _entity("Q312", name="Apple Inc."),
+    _entity("Q90", "LOC", name="Paris"),
+    _entity("Q2283", name="Microsoft", status="RESOLVED_SOFT"),
+    _entity("Q999", status="UNRESOLVED"),
+    _entity("", status="RESOLVED"),
+    _entity("Q312", name="Apple Inc."),
+    _entity("Q90", "LOC", name="Paris"),
+]
+INDICES = [0, 0, 1, 1, 2, 3, 2]
+
+
+def _state(context):
+    return (
+        context.entities_by_type,
+        context._type_stats,
+        context.mention_sequence,
+        context.entity_frequency,
+    )
+
+
+class TestRegisterEntities(unittest.TestCase):
+    def test_matches_register_entity_sequence(self):
+        batched = EntityContext()
+        batched.register_entities(BATCH, INDICES)
+
+        single = EntityContext()
+        for entity, idx in zip(BATCH, INDICES):
+            single.register_entity(entity, idx)
+
+        self.assertEqual(_state(batched), _state(single))
+
+    def test_skips_unresolved_and_missing_ids(self):
+        context = EntityContext()
+        context.register_entities(BATCH, INDICES)
+        ids = [m.entity_id for m in context.mention_sequence]
+        self.assertEqual(ids, ["Q312", "Q90", "Q2283", "Q312", "Q90"])
+        self.assertEqual(context.entity_frequency["Q312"], 2)
+        self.assertNotIn("Q999", context.entity_frequency)
+
+    def test_latest_mention_per_type(self):
+        context = EntityContext()
+        context.register_entities(BATCH, INDICES)
+        self.assertEqual(context._type_stats["ORG"]["Q312"].sentence_idx, 3)
+        self.assertEqual(context._type_stats["LOC"]["Q90"].sentence_idx, 2)
+
+    def test_version_bumps_only_when_registered(self):
+        context = EntityContext()
+        context.register_entities([_entity("Q999", status="UNRESOLVED")], [0])
+        self.assertEqual(context._version, 0)
+        context.register_entities([], [])
+        self.assertEqual(context._version, 0)
+        context.register_entities(BATCH[:2], INDICES[:2])
+        self.assertEqual(context._version, 1)
+
+    def test_resolution_sees_batched_entities(self):
+        batched = EntityContext()
+        batched.register_entities(BATCH, INDICES)
+        single = EntityContext()
+        for entity, idx in zip(BATCH, INDICES):
+            single.register_entity(entity, idx)
+        for text in ("the company", "the city", "it"):
+            self.assertEqual(batched.resolve_generic(text), single.resolve_generic(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
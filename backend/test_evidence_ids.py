@@ -0,0 +1,28 @@
+import os
+import sys
+import unittest
+import uuid
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.evidence_ids import evidence_uuid
+
+
+class TestEvidenceUuid(unittest.TestCase):
+    def test_matches_uuid5_oid(self):
+        names = [
+            "",
+            "wikidata:Q90:P17:Q142",
+            "wikipedia:Paris:0",
+            "Café de Flore",
+            "東京都",
+            "emoji 🚀 claim",
+            "x" * 1000,
+        ]
+        for name in names:
+            with self.subTest(name=name[:20]):
+                self.assertEqual(evidence_uuid(name), str(uuid.uuid5(uuid.NAMESPACE_OID, name)))
+
+
+if __name__ == "__main__":
+    unittest.main()
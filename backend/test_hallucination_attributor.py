@@ -0,0 +1,176 @@
+import copy
+import os
+import random
+import sys
+import types
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import hallucination_attributor
+from hallucination_attributor import (
+    HallucinationAttributor,
+    _MarkerScanner,
+    _normalize_predicate,
+    attribute_claim_hallucinations,
+    attribute_document_hallucinations,
+)
+
+
+class _FakeAutomaton:
+    """Mimics pyahocorasick.Automaton: iter() yields (end_index, value) per occurrence."""
+
+    def __init__(self):
+        self._words = {}
+        self._built = False
+
+    def add_word(self, key, value):
+        self._words[key] = value
+
+    def make_automaton(self):
+        self._built = True
+
+    def iter(self, text):
+        assert self._built
+        hits = []
+        for key, value in self._words.items():
+            start = text.find(key)
+            while start != -1:
+                hits.append((start + len(key) - 1, value))
+                start = text.find(key, start + 1)
+        return iter(sorted(hits, key=lambda hit: hit[0]))
+
+
+_FAKE_AHOCORASICK = types.SimpleNamespace(Automaton=_FakeAutomaton)
+
+TEXTS = [
+    "",
+    "apple was definitely founded in 1976",
+    "it is clearly the best and most innovative phone, without doubt",
+    "this is beyond question an amazing, groundbreaking, revolutionary product",
+    "the island has never had an established government",
+    "nothing to see here",
+    "obviously obviously proven twice",
+]
+
+
+def _claim(text, claim_id="c1", alignment=0.1):
+    return {
+        "claim_id": claim_id,
+        "claim_text": text,
+        "alignment_score": alignment,
+        "confidence_linguistic": {"absolutism": 0.2, "modal_strength": 0.9},
+        "verification": {"verdict": "UNCERTAIN"},
+    }
+
+
+class TestMarkerScannerParity(unittest.TestCase):
+    """The Aho-Corasick path must report exactly what the `in` fallback reports."""
+
+    MARKER_SETS = (
+        HallucinationAttributor.ASSERTIVE_MARKERS,
+        HallucinationAttributor.CERTAINTY_MARKERS,
+        HallucinationAttributor.THRESHOLDS["h6_evaluative_terms"],
+    )
+
+    def _scanners(self, markers):
+        with mock.patch.object(hallucination_attributor, "ahocorasick", None):
+            plain = _MarkerScanner(markers)
+        with mock.patch.object(hallucination_attributor, "ahocorasick", _FAKE_AHOCORASICK):
+            automaton = _MarkerScanner(markers)
+        self.assertIsNone(plain._automaton)
+        self.assertIsNotNone(automaton._automaton)
+        return plain, automaton
+
+    def test_scanner_results_match(self):
+        for markers in self.MARKER_SETS:
+            plain, automaton = self._scanners(markers)
+            for text in TEXTS:
+                with self.subTest(text=text):
+                    self.assertEqual(automaton.any_in(text), plain.any_in(text))
+                    self.assertEqual(automaton.found_in(text), plain.found_in(text))
+
+    def test_attributions_match(self):
+        with mock.patch.object(hallucination_attributor, "ahocorasick", None):
+            plain = HallucinationAttributor()
+        with mock.patch.object(hallucination_attributor, "ahocorasick", _FAKE_AHOCORASICK):
+            automaton = HallucinationAttributor()
+        for text in TEXTS:
+            with self.subTest(text=text):
+                claim = _claim(text)
+                self.assertEqual(
+                    [a.to_dict() for a in automaton.attribute_hallucinations(claim)],
+                    [a.to_dict() for a in plain.attribute_hallucinations(claim)],
+                )
+
+
+def _random_document(rng, n_claims):
+    subjects = ["Q312", "Q95", "", "Q90"]
+    predicates = ["was founded in", "established", "was born in", "died in", "is located in", "is a"]
+    objects = ["Paris", "paris", "London", "1976", "Cupertino"]
+    claims = []
+    for i in range(n_claims):
+        claim = _claim(rng.choice(["Apple was founded in 1976.", "It is great."]), f"c{i}", rng.random())
+        claim["subject_entity"] = {"entity_id": rng.choice(subjects)}
+        claim["predicate"] = rng.choice(predicates)
+        claim["object"] = rng.choice(objects)
+        if rng.random() < 0.5:
+            claim["object_entity"] = {"entity_id": rng.choice(["Q90", "Q84", ""])}
+        claims.append(claim)
+    return claims
+
+
+def _linear_scan_contradictions(claim, all_claims):
+    """Reference H5 rule: compare the claim against every other claim in the document."""
+    subject = claim.get("subject_entity", {}).get("entity_id", "")
+    if not subject:
+        return []
+    claim_pred = _normalize_predicate(claim.get("predicate", ""))
+    obj = claim.get("object", "")
+    obj_entity = claim.get("object_entity", {}).get("entity_id", "")
+    contradictions = []
+    for other in all_claims:
+        if other.get("claim_id") == claim.get("claim_id"):
+            continue
+        if (other.get("subject_entity", {}).get("entity_id", "") != subject
+                or _normalize_predicate(other.get("predicate", "")) != claim_pred):
+            continue
+        other_obj = other.get("object", "")
+        other_obj_entity = other.get("object_entity", {}).get("entity_id", "")
+        if obj_entity and other_obj_entity:
+            conflict = obj_entity != other_obj_entity
+        else:
+            conflict = obj.lower() != other_obj.lower()
+        if conflict:
+            contradictions.append({"claim_id": other.get("claim_id"), "object": other_obj, "this_object": obj})
+    return contradictions
+
+
+class TestDocumentAttribution(unittest.TestCase):
+    """One shared H5 index per document gives the same attributions as per-claim calls."""
+
+    def test_matches_per_claim_path_and_linear_scan(self):
+        rng = random.Random(7)
+        attributor = HallucinationAttributor()
+        for n_claims in [0, 1, 2, 5, 12, 30] * 5:
+            claims = _random_document(rng, n_claims)
+            per_claim = copy.deepcopy(claims)
+            for claim in per_claim:
+                attribute_claim_hallucinations(claim, per_claim, attributor)
+
+            documented = attribute_document_hallucinations(copy.deepcopy(claims), attributor)
+            self.assertEqual(
+                [c["hallucination_attributions"] for c in documented],
+                [c["hallucination_attributions"] for c in per_claim],
+            )
+
+            for claim in documented:
+                h5 = [a for a in claim["hallucination_attributions"] if a["type"] == "H5"]
+                expected = _linear_scan_contradictions(claim, claims)
+                found = h5[0]["evidence"][2]["value"] if h5 else []
+                self.assertEqual(found, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,23 +13,61 @@ import json
 import argparse
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Iterator, Optional
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from backend.pipeline.run_full_audit import AuditPipeline
 
+# Verdicts that make the verification / hallucination phases blocking
+_VERIFICATION_BLOCKING_VERDICTS = frozenset({"REFUTED", "INSUFFICIENT_EVIDENCE"})
+_HALLUCINATION_BLOCKING_VERDICTS = frozenset({"REFUTED", "UNCERTAIN"})
 
-@dataclass
+
+@dataclass(slots=True)
 class PhaseTrace:
-    """Trace for a single pipeline phase."""
+    """
+    Trace for a single pipeline phase.
+
+    Details are either passed eagerly as `_details` or deferred through
+    `_builder`, which is called once on first access to `details`. Equality
+    compares the resolved details, so laziness never affects it.
+    """
     phase: str
     status: str  # PASS, FAIL, WARN
-    details: dict = field(default_factory=dict)
+    _details: Optional[dict] = field(default=None, compare=False)
     blocking: bool = False  # Did this phase block SUPPORTED?
-
-
-@dataclass
+    _builder: Optional[Callable[[], dict]] = field(default=None, repr=False, compare=False)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            (self.phase, self.status, self.blocking, self.details)
+            == (other.phase, other.status, other.blocking, other.details)
+        )
+
+    @property
+    def details(self) -> dict:
+        if self._details is None:
+            self._details = self._builder() if self._builder else {}
+            self._builder = None
+        return self._details
+
+    @details.setter
+    def details(self, value: dict) -> None:
+        self._details = value
+        self._builder = None
+
+
+@dataclass(slots=True)
 class ClaimTrace:
     """Complete trace for a single claim through all phases."""
     claim_text: str
@@ -38,32 +76,87 @@ class ClaimTrace:
     confidence: float
     phases: list = field(default_factory=list)
     blocking_phase: Optional[str] = None
-    hallucinations: list = field(default_factory=list)
+    hallucinations: tuple = ()
 
     def to_dict(self):
+        # Explicit literal: shallow, and keeps the established JSON key order
+        phases = [
+            {
+                "phase": p.phase,
+                "status": p.status,
+                "blocking": p.blocking,
+                "details": p.details
+            }
+            for p in self.phases
+        ]
         return {
             "claim_text": self.claim_text,
             "claim_type": self.claim_type,
             "final_verdict": self.final_verdict,
             "confidence": self.confidence,
             "blocking_phase": self.blocking_phase,
-            "hallucinations": self.hallucinations,
-            "phases": [
-                {
-                    "phase": p.phase,
-                    "status": p.status,
-                    "blocking": p.blocking,
-                    "details": p.details
-                }
-                for p in self.phases
-            ]
+            "hallucinations": list(self.hallucinations),
+            "phases": phases
         }
 
 
-def trace_claim(claim: dict) -> ClaimTrace:
+def _alignment_rows(claim: dict) -> tuple:
+    """
+    Flatten a claim's wikidata/wikipedia evidence alignments.
+
+    Returns (evidence_ids, rows) where each row is
+    (subject_match, predicate_match, temporal_missing).
+    """
+    is_temporal = claim.get("claim_type", "UNKNOWN") == "TEMPORAL"
+    evidence = claim.get("evidence", {})
+    ev_ids = []
+    rows = []
+    for source in ("wikidata", "wikipedia"):
+        for ev in evidence.get(source, ()):
+            get = (ev.get("alignment") or {}).get
+            ev_ids.append(ev.get("evidence_id", "?"))
+            rows.append((
+                bool(get("subject_match", False)),
+                bool(get("predicate_match", False)),
+                is_temporal and get("temporal_match") is None,
+            ))
+    return ev_ids, rows
+
+
+def evidence_eligibility(claims: list) -> list:
+    """
+    Compute evidence-eligibility masks for a batch of claims at once.
+
+    All alignments are stacked into one boolean matrix so the eligibility
+    predicate runs as a single vectorized expression. Returns one
+    (evidence_ids, flags, eligible) tuple per claim, suitable for the
+    `eligibility` argument of trace_claim.
+    """
+    per_claim = [_alignment_rows(claim) for claim in claims]
+    offsets = np.cumsum([0] + [len(ev_ids) for ev_ids, _ in per_claim])
+    flags = np.array(
+        [row for _, rows in per_claim for row in rows], dtype=bool
+    ).reshape(-1, 3)
+    eligible = flags[:, 0] & flags[:, 1] & ~flags[:, 2]
+
+    return [
+        (ev_ids, flags[start:end], eligible[start:end])
+        for (ev_ids, _), start, end in zip(per_claim, offsets[:-1], offsets[1:])
+    ]
+
+
+def trace_claim(claim: dict, detailed: bool = True, eligibility: Optional[tuple] = None) -> ClaimTrace:
     """
     Trace a claim through all pipeline phases.
     Identifies where and why the claim was downgraded from potential SUPPORTED.
+
+    With detailed=False, phases after the blocking phase keep their status
+    and blocking flags but carry empty details, and the evidence-eligibility
+    scan is skipped. Intended for batch runs that only read blocking_phase.
+    In either mode details are built lazily, on first access.
+
+    `eligibility` is this claim's entry from evidence_eligibility(); when
+    omitted it is computed for the single claim.
     """
     claim_text = claim.get("claim_text", "")
     claim_type = claim.get("claim_type", "UNKNOWN")
@@ -76,14 +169,14 @@ def trace_claim(claim: dict) -> ClaimTrace:
         claim_type=claim_type,
         final_verdict=final_verdict,
         confidence=confidence,
-        hallucinations=[h.get("hallucination_type") for h in claim.get("hallucinations", [])]
+        hallucinations=tuple(h.get("hallucination_type") for h in claim.get("hallucinations") or ())
     )
 
     # Phase 1: Extraction
     extraction_trace = PhaseTrace(
         phase="1_extraction",
         status="PASS",  # If we have the claim, extraction succeeded
-        details={
+        _builder=lambda: {
             "subject": claim.get("subject"),
             "predicate": claim.get("predicate"),
             "object": claim.get("object"),
@@ -107,7 +200,7 @@ def trace_claim(claim: dict) -> ClaimTrace:
         phase="2_entity_linking",
         status=linking_status,
         blocking=linking_blocking,
-        details={
+        _builder=lambda: {
             "subject": {
                 "text": subject_entity.get("text"),
                 "entity_id": subject_entity.get("entity_id"),
@@ -142,7 +235,9 @@ def trace_claim(claim: dict) -> ClaimTrace:
         phase="3_evidence_retrieval",
         status="PASS" if has_evidence else "FAIL",
         blocking=not has_evidence and not linking_blocking,
-        details={
+    )
+    if detailed or not trace.blocking_phase:
+        evidence_trace._builder = lambda: {
             "sources": {
                 "wikidata": {
                     "status": evidence_status.get("wikidata", "ABSENT"),
@@ -160,36 +255,35 @@ def trace_claim(claim: dict) -> ClaimTrace:
                 }
             }
         }
-    )
     trace.phases.append(evidence_trace)
 
     if not has_evidence and not trace.blocking_phase:
         trace.blocking_phase = "3_evidence_retrieval"
 
     # Phase 4: Verification
-    used_evidence = verification.get("used_evidence_ids", [])
-    contradicted_by = verification.get("contradicted_by", [])
-    reasoning = verification.get("reasoning", "")
-
-    # Check evidence eligibility
-    eligible_evidence = []
-    ineligible_reasons = []
-
-    for source in ["wikidata", "wikipedia"]:
-        for ev in evidence.get(source, []):
-            alignment = ev.get("alignment", {})
-            ev_id = ev.get("evidence_id", "?")
-
-            subject_match = alignment.get("subject_match", False)
-            predicate_match = alignment.get("predicate_match", False)
-            object_match = alignment.get("object_match")
-            temporal_match = alignment.get("temporal_match")
-
-            if subject_match and predicate_match:
-                if claim_type == "TEMPORAL" and temporal_match is None:
-                    ineligible_reasons.append(f"{ev_id}: TEMPORAL claim but temporal_match=None")
-                else:
-                    eligible_evidence.append(ev_id)
+    verification_status = "PASS" if final_verdict == "SUPPORTED" else "FAIL"
+    verification_blocking = final_verdict != "SUPPORTED" and not trace.blocking_phase
+
+    verification_trace = PhaseTrace(
+        phase="4_verification",
+        status=verification_status,
+        blocking=verification_blocking and final_verdict in _VERIFICATION_BLOCKING_VERDICTS,
+    )
+
+    def build_verification_details() -> dict:
+        # Check evidence eligibility
+        ev_ids, flags, eligible = (
+            eligibility if eligibility is not None else evidence_eligibility([claim])[0]
+        )
+
+        eligible_evidence = []
+        ineligible_reasons = []
+
+        for ev_id, (subject_match, predicate_match, _), is_eligible in zip(ev_ids, flags, eligible):
+            if is_eligible:
+                eligible_evidence.append(ev_id)
+            elif subject_match and predicate_match:
+                ineligible_reasons.append(f"{ev_id}: TEMPORAL claim but temporal_match=None")
             else:
                 reasons = []
                 if not subject_match:
@@ -198,26 +292,21 @@ def trace_claim(claim: dict) -> ClaimTrace:
                     reasons.append("predicate_match=False")
                 ineligible_reasons.append(f"{ev_id}: {', '.join(reasons)}")
 
-    verification_status = "PASS" if final_verdict == "SUPPORTED" else "FAIL"
-    verification_blocking = final_verdict != "SUPPORTED" and not trace.blocking_phase
-
-    verification_trace = PhaseTrace(
-        phase="4_verification",
-        status=verification_status,
-        blocking=verification_blocking and final_verdict in ["REFUTED", "INSUFFICIENT_EVIDENCE"],
-        details={
+        return {
             "verdict": final_verdict,
             "confidence": confidence,
-            "used_evidence_ids": used_evidence,
-            "contradicted_by": contradicted_by,
-            "reasoning": reasoning,
+            "used_evidence_ids": verification.get("used_evidence_ids", []),
+            "contradicted_by": verification.get("contradicted_by", []),
+            "reasoning": verification.get("reasoning", ""),
             "nli_summary": verification.get("nli_summary", {}),
             "evidence_eligibility": {
                 "eligible": eligible_evidence,
                 "ineligible": ineligible_reasons
             }
         }
-    )
+
+    if detailed or not trace.blocking_phase:
+        verification_trace._builder = build_verification_details
     trace.phases.append(verification_trace)
 
     if verification_trace.blocking and not trace.blocking_phase:
@@ -225,13 +314,15 @@ def trace_claim(claim: dict) -> ClaimTrace:
 
     # Phase 5: Hallucination Detection
     hallucinations = claim.get("hallucinations", [])
-    critical_halluc = [h for h in hallucinations if h.get("severity") == "CRITICAL"]
-    non_critical_halluc = [h for h in hallucinations if h.get("severity") != "CRITICAL"]
+    critical_halluc = []
+    non_critical_halluc = []
+    for h in hallucinations:
+        (critical_halluc if h.get("severity") == "CRITICAL" else non_critical_halluc).append(h)
 
     halluc_status = "FAIL" if critical_halluc else ("WARN" if non_critical_halluc else "PASS")
     halluc_blocking = (
         (bool(critical_halluc) or bool(non_critical_halluc))
-        and final_verdict in ["REFUTED", "UNCERTAIN"]
+        and final_verdict in _HALLUCINATION_BLOCKING_VERDICTS
         and not trace.blocking_phase
     )
 
@@ -239,7 +330,9 @@ def trace_claim(claim: dict) -> ClaimTrace:
         phase="5_hallucination_detection",
         status=halluc_status,
         blocking=halluc_blocking,
-        details={
+    )
+    if detailed or not trace.blocking_phase:
+        halluc_trace._builder = lambda: {
             "critical": [
                 {
                     "type": h.get("hallucination_type"),
@@ -257,7 +350,6 @@ def trace_claim(claim: dict) -> ClaimTrace:
                 for h in non_critical_halluc
             ]
         }
-    )
     trace.phases.append(halluc_trace)
 
     if halluc_blocking:
@@ -266,16 +358,41 @@ def trace_claim(claim: dict) -> ClaimTrace:
     return trace
 
 
-def trace_text(text: str) -> list:
-    """Trace all claims extracted from input text."""
+def trace_text(text: str, detailed: bool = True) -> Iterator[ClaimTrace]:
+    """
+    Trace all claims extracted from input text, yielding one trace per claim.
+
+    The audit runs to completion first (verification is document-level);
+    only the traces are produced and consumed one at a time.
+    """
     pipeline = AuditPipeline()
-    result = pipeline.run(text)
+    claims = pipeline.run(text).get("claims", [])
+    for claim, eligibility in zip(claims, evidence_eligibility(claims)):
+        yield trace_claim(claim, detailed=detailed, eligibility=eligibility)
 
-    traces = []
-    for claim in result.get("claims", []):
-        traces.append(trace_claim(claim))
 
-    return traces
+def write_json_traces(traces, stream=None) -> None:
+    """
+    Write traces as an indented JSON array, one element at a time.
+
+    Uses the layout of json.dumps([t.to_dict() ...], indent=2,
+    ensure_ascii=False) without first collecting every trace into a list:
+    non-ASCII text is written as-is, not \\u-escaped. Elements are
+    serialized with orjson when it is installed; the json fallback is
+    configured to match it. Non-finite floats (e.g. a NaN confidence) are
+    the one difference: orjson writes them as null, json as NaN.
+    """
+    stream = stream or sys.stdout
+    first = True
+    for trace in traces:
+        if orjson is not None:
+            element = orjson.dumps(trace.to_dict(), option=orjson.OPT_INDENT_2).decode("utf-8")
+        else:
+            element = json.dumps(trace.to_dict(), indent=2, ensure_ascii=False)
+        element = element.replace("\n", "\n  ")
+        stream.write(("[\n  " if first else ",\n  ") + element)
+        first = False
+    stream.write("[]\n" if first else "\n]\n")
 
 
 def print_trace(trace: ClaimTrace, verbose: bool = False):
@@ -305,7 +422,7 @@ def print_trace(trace: ClaimTrace, verbose: bool = False):
     print(f"BLOCKING PHASE: {trace.blocking_phase or 'None (SUPPORTED)'}")
 
     if trace.hallucinations:
-        print(f"HALLUCINATIONS: {trace.hallucinations}")
+        print(f"HALLUCINATIONS: {list(trace.hallucinations)}")
 
     print()
 
@@ -321,8 +438,7 @@ def main():
     traces = trace_text(args.text)
 
     if args.json:
-        output = [t.to_dict() for t in traces]
-        print(json.dumps(output, indent=2))
+        write_json_traces(traces)
     else:
         for trace in traces:
             print_trace(trace, args.verbose)
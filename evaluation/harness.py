@@ -12,17 +12,50 @@ Usage:
 """
 
 import json
+import os
 import sys
 import argparse
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
-from typing import Optional
+from dataclasses import dataclass, field, fields, asdict
+from typing import Callable, Optional, Sequence, TYPE_CHECKING
 from enum import Enum
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit when numba is not installed: returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from backend.pipeline.run_full_audit import AuditPipeline
+# AuditPipeline pulls in the NLP models; it is imported where a pipeline is
+# built so --help and test collection stay fast
+if TYPE_CHECKING:
+    from backend.pipeline.run_full_audit import AuditPipeline
+
+# Object resolution statuses that count as resolved (None: no object entity)
+_OBJECT_RESOLVED_STATES = frozenset({"RESOLVED", "RESOLVED_SOFT", None})
+
+# Verdicts tracked in CaseResult.verdict_distribution
+_VERDICT_KEYS = ("SUPPORTED", "REFUTED", "UNCERTAIN", "INSUFFICIENT_EVIDENCE")
 
 
 class DowngradePhase(Enum):
@@ -35,7 +68,7 @@ class DowngradePhase(Enum):
     NONE = "none"
 
 
-@dataclass
+@dataclass(slots=True)
 class DowngradeReason:
     """Structured explanation of why a claim was not SUPPORTED."""
     phase: DowngradePhase
@@ -43,26 +76,26 @@ class DowngradeReason:
     evidence_status: dict = field(default_factory=dict)
     hallucinations_detected: list = field(default_factory=list)
     entity_resolution: dict = field(default_factory=dict)
+    phase_value: str = field(init=False, repr=False, compare=False)  # phase.value, cached
+
+    def __post_init__(self):
+        self.phase_value = self.phase.value
 
     def to_dict(self):
-        return {
-            "phase": self.phase.value,
-            "issue": self.issue,
-            "evidence_status": self.evidence_status,
-            "hallucinations_detected": self.hallucinations_detected,
-            "entity_resolution": self.entity_resolution
-        }
+        data = {name: getattr(self, name) for name in _DOWNGRADE_REASON_FIELDS}
+        data["phase"] = self.phase_value
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class CaseResult:
     """Result of evaluating a single golden case."""
     case_id: str
     passed: bool
     expected_verdict: Optional[str]
     actual_verdict: Optional[str]
-    expected_hallucinations: list
-    actual_hallucinations: list
+    expected_hallucinations: Sequence[str]
+    actual_hallucinations: Sequence[str]
     expected_risk: Optional[str]
     actual_risk: Optional[str]
     downgrade_reason: Optional[DowngradeReason]
@@ -72,21 +105,15 @@ class CaseResult:
     verdict_distribution: dict = field(default_factory=dict)
 
     def to_dict(self):
-        return {
-            "case_id": self.case_id,
-            "passed": self.passed,
-            "expected_verdict": self.expected_verdict,
-            "actual_verdict": self.actual_verdict,
-            "expected_hallucinations": self.expected_hallucinations,
-            "actual_hallucinations": self.actual_hallucinations,
-            "expected_risk": self.expected_risk,
-            "actual_risk": self.actual_risk,
-            "downgrade_reason": self.downgrade_reason.to_dict() if self.downgrade_reason else None,
-            "confidence": self.confidence,
-            "errors": self.errors,
-            "claim_count": self.claim_count,
-            "verdict_distribution": self.verdict_distribution
-        }
+        data = {name: getattr(self, name) for name in _CASE_RESULT_FIELDS}
+        if self.downgrade_reason:
+            data["downgrade_reason"] = self.downgrade_reason.to_dict()
+        return data
+
+
+# Field names in declaration order, resolved once for to_dict()
+_DOWNGRADE_REASON_FIELDS = tuple(f.name for f in fields(DowngradeReason) if f.init)
+_CASE_RESULT_FIELDS = tuple(f.name for f in fields(CaseResult))
 
 
 def analyze_downgrade(claim: dict) -> DowngradeReason:
@@ -94,14 +121,15 @@ def analyze_downgrade(claim: dict) -> DowngradeReason:
     Analyze why a claim received its verdict.
     Traces through pipeline phases to identify the downgrade point.
     """
-    verdict = claim.get("verification", {}).get("verdict", "UNKNOWN")
+    verification = claim.get("verification") or {}
+    verdict = verification.get("verdict", "UNKNOWN")
 
     # Check entity resolution
-    subject_entity = claim.get("subject_entity", {})
-    object_entity = claim.get("object_entity", {})
+    subject_entity = claim.get("subject_entity") or {}
+    object_entity = claim.get("object_entity") or {}
 
     subject_resolved = subject_entity.get("resolution_status") == "RESOLVED"
-    object_resolved = object_entity.get("resolution_status") in ["RESOLVED", "RESOLVED_SOFT", None]
+    object_resolved = object_entity.get("resolution_status") in _OBJECT_RESOLVED_STATES
 
     entity_resolution = {
         "subject": {
@@ -119,12 +147,12 @@ def analyze_downgrade(claim: dict) -> DowngradeReason:
     }
 
     # Check evidence status
-    evidence = claim.get("evidence", {})
-    evidence_status = claim.get("evidence_status", {})
+    evidence = claim.get("evidence") or {}
+    evidence_status = claim.get("evidence_status") or {}
 
-    has_wikidata = len(evidence.get("wikidata", [])) > 0
-    has_wikipedia = len(evidence.get("wikipedia", [])) > 0
-    has_primary = len(evidence.get("primary_document", [])) > 0
+    has_wikidata = bool(evidence.get("wikidata"))
+    has_wikipedia = bool(evidence.get("wikipedia"))
+    has_primary = bool(evidence.get("primary_document"))
 
     evidence_summary = {
         "wikidata": evidence_status.get("wikidata", "ABSENT"),
@@ -133,69 +161,56 @@ def analyze_downgrade(claim: dict) -> DowngradeReason:
         "has_any": has_wikidata or has_wikipedia or has_primary
     }
 
-    # Check hallucinations
-    hallucinations = claim.get("hallucinations", [])
-    halluc_types = [h.get("hallucination_type") for h in hallucinations]
-    critical_halluc = [h for h in hallucinations if h.get("severity") == "CRITICAL"]
-
-    # Determine downgrade phase and reason
-    if verdict == "SUPPORTED":
+    def make(phase: DowngradePhase, issue: str, **extra) -> DowngradeReason:
         return DowngradeReason(
-            phase=DowngradePhase.NONE,
-            issue="No downgrade - claim supported",
+            phase=phase,
+            issue=issue,
             evidence_status=evidence_summary,
-            entity_resolution=entity_resolution
+            entity_resolution=entity_resolution,
+            **extra
         )
 
+    # Determine downgrade phase and reason
+    if verdict == "SUPPORTED":
+        return make(DowngradePhase.NONE, "No downgrade - claim supported")
+
+    # Check hallucinations
+    hallucinations = claim.get("hallucinations") or ()
+    halluc_types = [h.get("hallucination_type") for h in hallucinations]
+    critical_halluc = [h for h in hallucinations if h.get("severity") == "CRITICAL"]
+
     # Check for critical hallucination (always REFUTED)
     if critical_halluc:
-        return DowngradeReason(
-            phase=DowngradePhase.HALLUCINATION_DETECTION,
-            issue=f"CRITICAL hallucination detected: {[h.get('hallucination_type') for h in critical_halluc]}",
-            evidence_status=evidence_summary,
-            hallucinations_detected=halluc_types,
-            entity_resolution=entity_resolution
+        return make(
+            DowngradePhase.HALLUCINATION_DETECTION,
+            f"CRITICAL hallucination detected: {[h.get('hallucination_type') for h in critical_halluc]}",
+            hallucinations_detected=halluc_types
         )
 
     # Check if verdict is REFUTED (evidence contradiction)
     if verdict == "REFUTED":
-        verification = claim.get("verification", {})
         contradicted_by = verification.get("contradicted_by", [])
-        return DowngradeReason(
-            phase=DowngradePhase.VERIFICATION,
-            issue=f"Evidence contradiction: {len(contradicted_by)} contradicting evidence(s)",
-            evidence_status=evidence_summary,
-            hallucinations_detected=halluc_types,
-            entity_resolution=entity_resolution
+        return make(
+            DowngradePhase.VERIFICATION,
+            f"Evidence contradiction: {len(contradicted_by)} contradicting evidence(s)",
+            hallucinations_detected=halluc_types
         )
 
     # Check for non-critical hallucination (blocks SUPPORTED -> UNCERTAIN)
     if hallucinations and verdict == "UNCERTAIN":
-        return DowngradeReason(
-            phase=DowngradePhase.HALLUCINATION_DETECTION,
-            issue=f"Non-critical hallucination blocks support: {halluc_types}",
-            evidence_status=evidence_summary,
-            hallucinations_detected=halluc_types,
-            entity_resolution=entity_resolution
+        return make(
+            DowngradePhase.HALLUCINATION_DETECTION,
+            f"Non-critical hallucination blocks support: {halluc_types}",
+            hallucinations_detected=halluc_types
         )
 
     # Check entity linking failure
     if not subject_resolved:
-        return DowngradeReason(
-            phase=DowngradePhase.ENTITY_LINKING,
-            issue=f"Subject entity not resolved: '{subject_entity.get('text')}'",
-            evidence_status=evidence_summary,
-            entity_resolution=entity_resolution
-        )
+        return make(DowngradePhase.ENTITY_LINKING, f"Subject entity not resolved: '{subject_entity.get('text')}'")
 
     # Check evidence retrieval failure
     if not evidence_summary["has_any"]:
-        return DowngradeReason(
-            phase=DowngradePhase.EVIDENCE_RETRIEVAL,
-            issue="No evidence retrieved from any source",
-            evidence_status=evidence_summary,
-            entity_resolution=entity_resolution
-        )
+        return make(DowngradePhase.EVIDENCE_RETRIEVAL, "No evidence retrieved from any source")
 
     # INSUFFICIENT_EVIDENCE with evidence present but not matching
     if verdict == "INSUFFICIENT_EVIDENCE":
@@ -204,72 +219,52 @@ def analyze_downgrade(claim: dict) -> DowngradeReason:
             for ev in evidence.get(source, []):
                 alignment = ev.get("alignment", {})
                 if not alignment.get("subject_match"):
-                    return DowngradeReason(
-                        phase=DowngradePhase.VERIFICATION,
-                        issue="Evidence exists but subject does not match",
-                        evidence_status=evidence_summary,
-                        entity_resolution=entity_resolution
-                    )
+                    return make(DowngradePhase.VERIFICATION, "Evidence exists but subject does not match")
                 if not alignment.get("predicate_match"):
-                    return DowngradeReason(
-                        phase=DowngradePhase.VERIFICATION,
-                        issue="Evidence exists but predicate does not match",
-                        evidence_status=evidence_summary,
-                        entity_resolution=entity_resolution
-                    )
+                    return make(DowngradePhase.VERIFICATION, "Evidence exists but predicate does not match")
 
-        return DowngradeReason(
-            phase=DowngradePhase.VERIFICATION,
-            issue="No eligible supporting evidence found",
-            evidence_status=evidence_summary,
-            entity_resolution=entity_resolution
-        )
+        return make(DowngradePhase.VERIFICATION, "No eligible supporting evidence found")
 
     # UNCERTAIN with sanity rule
     if verdict == "UNCERTAIN":
-        reasoning = claim.get("verification", {}).get("reasoning", "")
+        reasoning = verification.get("reasoning", "")
         if "sanity" in reasoning.lower():
-            return DowngradeReason(
-                phase=DowngradePhase.VERIFICATION,
-                issue="Sanity rule triggered: >3 claims with zero SUPPORTED",
-                evidence_status=evidence_summary,
-                entity_resolution=entity_resolution
-            )
+            return make(DowngradePhase.VERIFICATION, "Sanity rule triggered: >3 claims with zero SUPPORTED")
 
-        return DowngradeReason(
-            phase=DowngradePhase.VERIFICATION,
-            issue="Downgraded to UNCERTAIN (reason unclear)",
-            evidence_status=evidence_summary,
-            entity_resolution=entity_resolution
-        )
+        return make(DowngradePhase.VERIFICATION, "Downgraded to UNCERTAIN (reason unclear)")
 
-    return DowngradeReason(
-        phase=DowngradePhase.VERIFICATION,
-        issue=f"Unknown downgrade path for verdict: {verdict}",
-        evidence_status=evidence_summary,
-        entity_resolution=entity_resolution
-    )
+    return make(DowngradePhase.VERIFICATION, f"Unknown downgrade path for verdict: {verdict}")
 
 
-def evaluate_case(pipeline: AuditPipeline, case: dict) -> CaseResult:
-    """Evaluate a single golden test case against pipeline output."""
+def evaluate_case(runner: Callable[[str], dict], case: dict, early_exit: bool = False) -> CaseResult:
+    """
+    Evaluate a single golden test case against pipeline output.
+
+    `runner` maps input text to an audit result, e.g. AuditPipeline().run.
+    The result is only read, so runners may return shared cached dicts.
+    With early_exit=True validation stops at the first failing check, so
+    `errors` lists only that failure; reports keep the default of False.
+    """
     case_id = case["case_id"]
     input_text = case["input_text"]
     expected = case["expected"]
+    exp_verdict = expected.get("verdict")
+    exp_ht = expected.get("hallucination_types") or ()
+    exp_risk = expected.get("risk_level")
 
     errors = []
 
     try:
-        result = pipeline.run(input_text)
+        result = runner(input_text)
     except Exception as e:
         return CaseResult(
             case_id=case_id,
             passed=False,
-            expected_verdict=expected.get("verdict"),
+            expected_verdict=exp_verdict,
             actual_verdict=None,
-            expected_hallucinations=expected.get("hallucination_types", []),
-            actual_hallucinations=[],
-            expected_risk=expected.get("risk_level"),
+            expected_hallucinations=exp_ht,
+            actual_hallucinations=(),
+            expected_risk=exp_risk,
             actual_risk=None,
             downgrade_reason=None,
             confidence=None,
@@ -279,20 +274,19 @@ def evaluate_case(pipeline: AuditPipeline, case: dict) -> CaseResult:
     claims = result.get("claims", [])
     claim_count = len(claims)
 
-    # Calculate verdict distribution
-    verdict_dist = {"SUPPORTED": 0, "REFUTED": 0, "UNCERTAIN": 0, "INSUFFICIENT_EVIDENCE": 0}
+    # Calculate verdict distribution and collect hallucination types
+    # (deduplicated in first-seen order) in one pass over the claims
+    verdict_dist = dict.fromkeys(_VERDICT_KEYS, 0)
+    seen_halluc = {}
     for claim in claims:
         v = claim.get("verification", {}).get("verdict", "UNKNOWN")
         if v in verdict_dist:
             verdict_dist[v] += 1
-
-    # Collect all hallucinations
-    actual_hallucinations = []
-    for claim in claims:
-        for h in claim.get("hallucinations", []):
+        for h in claim.get("hallucinations", ()):
             ht = h.get("hallucination_type")
-            if ht and ht not in actual_hallucinations:
-                actual_hallucinations.append(ht)
+            if ht:
+                seen_halluc[ht] = None
+    actual_hallucinations = list(seen_halluc)
 
     actual_risk = result.get("overall_risk")
     actual_score = result.get("hallucination_score", 0)
@@ -308,25 +302,27 @@ def evaluate_case(pipeline: AuditPipeline, case: dict) -> CaseResult:
         confidence = None
         downgrade = None
 
-    # Validation checks
+    # Validation checks (with early_exit, stop after the first failure)
     passed = True
 
     # Check verdict
     if "verdict" in expected:
-        if actual_verdict != expected["verdict"]:
+        if actual_verdict != exp_verdict:
             passed = False
-            errors.append(f"Verdict mismatch: expected {expected['verdict']}, got {actual_verdict}")
+            errors.append(f"Verdict mismatch: expected {exp_verdict}, got {actual_verdict}")
 
     # Check verdict distribution for multi-claim cases
-    if "verdicts" in expected:
+    if (passed or not early_exit) and "verdicts" in expected:
         for v, count in expected["verdicts"].items():
             if verdict_dist.get(v, 0) != count:
                 passed = False
                 errors.append(f"Verdict count for {v}: expected {count}, got {verdict_dist.get(v, 0)}")
+                if early_exit:
+                    break
 
     # Check hallucination types
-    if "hallucination_types" in expected:
-        expected_ht = set(expected["hallucination_types"])
+    if (passed or not early_exit) and "hallucination_types" in expected:
+        expected_ht = set(exp_ht)
         actual_ht = set(actual_hallucinations)
 
         missing = expected_ht - actual_ht
@@ -340,41 +336,41 @@ def evaluate_case(pipeline: AuditPipeline, case: dict) -> CaseResult:
             errors.append(f"Extra hallucination types (warning): {extra}")
 
     # Check risk level
-    if "risk_level" in expected:
-        if actual_risk != expected["risk_level"]:
+    if (passed or not early_exit) and "risk_level" in expected:
+        if actual_risk != exp_risk:
             passed = False
-            errors.append(f"Risk level mismatch: expected {expected['risk_level']}, got {actual_risk}")
+            errors.append(f"Risk level mismatch: expected {exp_risk}, got {actual_risk}")
 
     # Check confidence bounds
-    if "min_confidence" in expected and confidence is not None:
+    if (passed or not early_exit) and "min_confidence" in expected and confidence is not None:
         if confidence < expected["min_confidence"]:
             passed = False
             errors.append(f"Confidence too low: expected >= {expected['min_confidence']}, got {confidence}")
 
     # Check hallucination score bounds
-    if "min_hallucination_score" in expected:
+    if (passed or not early_exit) and "min_hallucination_score" in expected:
         if actual_score < expected["min_hallucination_score"]:
             passed = False
             errors.append(f"Hallucination score too low: expected >= {expected['min_hallucination_score']}, got {actual_score}")
 
-    if "max_hallucination_score" in expected:
+    if (passed or not early_exit) and "max_hallucination_score" in expected:
         if actual_score > expected["max_hallucination_score"]:
             passed = False
             errors.append(f"Hallucination score too high: expected <= {expected['max_hallucination_score']}, got {actual_score}")
 
     # Check claim count
-    if "claims_count" in expected:
+    if (passed or not early_exit) and "claims_count" in expected:
         if claim_count != expected["claims_count"]:
             passed = False
             errors.append(f"Claim count mismatch: expected {expected['claims_count']}, got {claim_count}")
 
-    if "claims_count_min" in expected:
+    if (passed or not early_exit) and "claims_count_min" in expected:
         if claim_count < expected["claims_count_min"]:
             passed = False
             errors.append(f"Too few claims: expected >= {expected['claims_count_min']}, got {claim_count}")
 
     # Check verdict contains
-    if "verdict_contains" in expected:
+    if (passed or not early_exit) and "verdict_contains" in expected:
         if verdict_dist.get(expected["verdict_contains"], 0) == 0:
             passed = False
             errors.append(f"Expected at least one {expected['verdict_contains']} verdict")
@@ -382,11 +378,11 @@ def evaluate_case(pipeline: AuditPipeline, case: dict) -> CaseResult:
     return CaseResult(
         case_id=case_id,
         passed=passed,
-        expected_verdict=expected.get("verdict"),
+        expected_verdict=exp_verdict,
         actual_verdict=actual_verdict,
-        expected_hallucinations=expected.get("hallucination_types", []),
+        expected_hallucinations=exp_ht,
         actual_hallucinations=actual_hallucinations,
-        expected_risk=expected.get("risk_level"),
+        expected_risk=exp_risk,
         actual_risk=actual_risk,
         downgrade_reason=downgrade,
         confidence=confidence,
@@ -396,83 +392,251 @@ def evaluate_case(pipeline: AuditPipeline, case: dict) -> CaseResult:
     )
 
 
+def _encode_labels(expected_labels: list, actual_labels: list) -> tuple:
+    """
+    Map paired expected/actual labels to int32 code arrays for _accuracy_counts.
+
+    Equal labels share a code; an unset (falsy) expected label is coded -1.
+    """
+    codes = {}
+    expected = np.array(
+        [codes.setdefault(label, len(codes)) if label else -1 for label in expected_labels],
+        dtype=np.int32
+    )
+    actual = np.array(
+        [codes.setdefault(label, len(codes)) for label in actual_labels],
+        dtype=np.int32
+    )
+    return expected, actual
+
+
+@njit("Tuple((i8, i8, i8, i8, i8, i8))(i4[:], i4[:], i4[:], i4[:], b1[:])", cache=True)
+def _accuracy_counts(expected_verdicts, actual_verdicts, expected_risks, actual_risks, halluc_hits):
+    """
+    Count verdict/risk matches and detected hallucinations in one pass.
+
+    Returns (verdict_correct, verdict_total, risk_correct, risk_total,
+    halluc_detected, halluc_expected). Entries whose expected code is -1
+    are not counted.
+    """
+    verdict_correct = 0
+    verdict_total = 0
+    risk_correct = 0
+    risk_total = 0
+    for i in range(expected_verdicts.shape[0]):
+        if expected_verdicts[i] >= 0:
+            verdict_total += 1
+            if actual_verdicts[i] == expected_verdicts[i]:
+                verdict_correct += 1
+        if expected_risks[i] >= 0:
+            risk_total += 1
+            if actual_risks[i] == expected_risks[i]:
+                risk_correct += 1
+
+    halluc_detected = 0
+    for i in range(halluc_hits.shape[0]):
+        if halluc_hits[i]:
+            halluc_detected += 1
+
+    return verdict_correct, verdict_total, risk_correct, risk_total, halluc_detected, halluc_hits.shape[0]
+
+
+def _physical_core_count() -> int:
+    """
+    Physical CPU cores, falling back to logical cores when they cannot be told apart.
+
+    Each pool worker loads its own models and runs multi-threaded inference, so
+    sizing the pool by hyperthreads only oversubscribes the CPU.
+    """
+    if psutil is not None:
+        cores = psutil.cpu_count(logical=False)
+        if cores:
+            return cores
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            physical_id = None
+            core_ids = set()
+            for line in f:
+                key, _, value = line.partition(":")
+                key = key.strip()
+                if key == "physical id":
+                    physical_id = value.strip()
+                elif key == "core id":
+                    core_ids.add((physical_id, value.strip()))
+        if core_ids:
+            return len(core_ids)
+    except OSError:
+        pass
+    return os.cpu_count() or 1
+
+
+# Per-process pipeline used by _eval_worker; built on first use in each worker
+_WORKER_PIPELINE: Optional["AuditPipeline"] = None
+
+
+def _worker_pipeline() -> "AuditPipeline":
+    global _WORKER_PIPELINE
+    if _WORKER_PIPELINE is None:
+        from backend.pipeline.run_full_audit import AuditPipeline
+        _WORKER_PIPELINE = AuditPipeline()
+    return _WORKER_PIPELINE
+
+
+def _eval_worker(case: dict) -> CaseResult:
+    """Evaluate a case in a pool worker, reusing that worker's pipeline."""
+    return evaluate_case(_worker_pipeline().run, case)
+
+
+def _run_worker(text: str) -> tuple:
+    """
+    Run the pipeline in a pool worker, as a (result, error) pair.
+
+    A failure comes back as (None, message): exceptions are not returned
+    themselves, since one that cannot be pickled would break the whole map.
+    """
+    try:
+        return _worker_pipeline().run(text), None
+    except Exception as e:
+        return None, str(e)
+
+
 class EvaluationHarness:
     """Main harness for running golden test evaluations."""
 
-    def __init__(self, golden_path: Optional[Path] = None):
+    def __init__(self, golden_path: Optional[Path] = None, use_cache: bool = True, workers: Optional[int] = None):
         self.golden_path = golden_path or Path(__file__).parent / "golden_cases.json"
-        self.pipeline = AuditPipeline()
+        self._pipeline: Optional["AuditPipeline"] = None
+        self.use_cache = use_cache
+        # Pool size cap; None means one worker per physical core
+        self.workers = workers
+        # input_text -> pipeline result; failures are not cached
+        self._run_cache = {}
         self._load_cases()
 
+    @property
+    def pipeline(self) -> "AuditPipeline":
+        """In-process pipeline, built on first use (run_case and single-worker runs)."""
+        if self._pipeline is None:
+            from backend.pipeline.run_full_audit import AuditPipeline
+            self._pipeline = AuditPipeline()
+        return self._pipeline
+
     def _load_cases(self):
-        with open(self.golden_path) as f:
-            data = json.load(f)
+        with open(self.golden_path, "rb") as f:
+            data = orjson.loads(f.read()) if orjson is not None else json.load(f)
         self.metadata = data.get("metadata", {})
         self.cases = data.get("cases", [])
+        self._by_id = {case["case_id"]: case for case in self.cases}
+        self._by_category = {}
+        for case in self.cases:
+            self._by_category.setdefault(case.get("category"), []).append(case)
 
     def run_case(self, case_id: str) -> Optional[CaseResult]:
         """Run a single case by ID."""
-        for case in self.cases:
-            if case["case_id"] == case_id:
-                return evaluate_case(self.pipeline, case)
-        return None
+        case = self._by_id.get(case_id)
+        return evaluate_case(self._runner(), case) if case else None
 
     def run_category(self, category: str) -> list:
         """Run all cases in a category."""
-        results = []
-        for case in self.cases:
-            if case.get("category") == category:
-                results.append(evaluate_case(self.pipeline, case))
-        return results
+        return self._run_parallel(self._by_category.get(category, []))
 
     def run_all(self) -> list:
         """Run all golden cases."""
-        return [evaluate_case(self.pipeline, case) for case in self.cases]
+        return self._run_parallel(self.cases)
+
+    def _runner(self) -> Callable[[str], dict]:
+        return self._cached_run if self.use_cache else self.pipeline.run
+
+    def _cached_run(self, text: str) -> dict:
+        """
+        Run the pipeline once per distinct input text (it is deterministic).
+
+        Failures propagate and are not cached, so a transient error is not
+        replayed for every later case sharing the input.
+        """
+        if text not in self._run_cache:
+            self._run_cache[text] = self.pipeline.run(text)
+        return self._run_cache[text]
+
+    def _pool_size(self, n_tasks: int) -> int:
+        return max(1, min(n_tasks, self.workers or _physical_core_count()))
+
+    def _run_parallel(self, cases: list) -> list:
+        """
+        Evaluate independent cases across a process pool.
+
+        Each worker builds its own AuditPipeline once; the parent builds none
+        unless the pool is a single worker, in which case cases run in-process.
+        The pool is capped at the number of tasks and at `workers` (default:
+        physical cores). With caching enabled only distinct, uncached input
+        texts are evaluated. Results keep the order of `cases`.
+        """
+        if not cases:
+            return []
+        if not self.use_cache:
+            workers = self._pool_size(len(cases))
+            if workers == 1:
+                return [evaluate_case(self.pipeline.run, case) for case in cases]
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                return list(ex.map(_eval_worker, cases))
+
+        pending = list(dict.fromkeys(
+            case["input_text"] for case in cases if case["input_text"] not in self._run_cache
+        ))
+        # Worker failures for this run only: input_text -> error message
+        failures = {}
+        if pending:
+            # A single worker gains nothing from a pool; _cached_run fills in-process
+            workers = self._pool_size(len(pending))
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers) as ex:
+                    for text, (result, error) in zip(pending, ex.map(_run_worker, pending)):
+                        if error is None:
+                            self._run_cache[text] = result
+                        else:
+                            failures[text] = error
+
+        def runner(text: str) -> dict:
+            if text in failures:
+                raise RuntimeError(failures[text])
+            return self._cached_run(text)
+
+        return [evaluate_case(runner, case) for case in cases]
 
     def generate_report(self, results: list) -> dict:
         """Generate a detailed evaluation report."""
+        report = self.generate_summary(results)
+        report["detailed_results"] = [r.to_dict() for r in results]
+        return report
+
+    def generate_summary(self, results: list) -> dict:
+        """Generate the evaluation report without per-case detailed_results."""
         passed = sum(1 for r in results if r.passed)
         failed = len(results) - passed
 
         # Group failures by downgrade phase
-        failures_by_phase = {}
+        failures_by_phase = defaultdict(list)
         for r in results:
             if not r.passed and r.downgrade_reason:
-                phase = r.downgrade_reason.phase.value
-                if phase not in failures_by_phase:
-                    failures_by_phase[phase] = []
-                failures_by_phase[phase].append({
+                failures_by_phase[r.downgrade_reason.phase_value].append({
                     "case_id": r.case_id,
                     "errors": r.errors,
                     "issue": r.downgrade_reason.issue
                 })
 
-        # Verdict accuracy
-        verdict_correct = 0
-        verdict_total = 0
-        for r in results:
-            if r.expected_verdict:
-                verdict_total += 1
-                if r.actual_verdict == r.expected_verdict:
-                    verdict_correct += 1
-
-        # Hallucination detection recall
-        halluc_expected = 0
-        halluc_detected = 0
-        for r in results:
-            for ht in r.expected_hallucinations:
-                halluc_expected += 1
-                if ht in r.actual_hallucinations:
-                    halluc_detected += 1
-
-        # Risk level accuracy
-        risk_correct = 0
-        risk_total = 0
-        for r in results:
-            if r.expected_risk:
-                risk_total += 1
-                if r.actual_risk == r.expected_risk:
-                    risk_correct += 1
+        # Verdict accuracy, hallucination detection recall and risk level accuracy
+        (
+            verdict_correct, verdict_total,
+            risk_correct, risk_total,
+            halluc_detected, halluc_expected
+        ) = _accuracy_counts(
+            *_encode_labels([r.expected_verdict for r in results], [r.actual_verdict for r in results]),
+            *_encode_labels([r.expected_risk for r in results], [r.actual_risk for r in results]),
+            np.array(
+                [ht in r.actual_hallucinations for r in results for ht in r.expected_hallucinations],
+                dtype=np.bool_
+            )
+        )
 
         return {
             "summary": {
@@ -496,10 +660,40 @@ class EvaluationHarness:
                 "total": risk_total,
                 "accuracy": f"{100 * risk_correct / risk_total:.1f}%" if risk_total else "N/A"
             },
-            "failures_by_phase": failures_by_phase,
-            "detailed_results": [r.to_dict() for r in results]
+            "failures_by_phase": dict(failures_by_phase)
         }
 
+    def write_report(self, results: list, f, summary: Optional[dict] = None) -> None:
+        """
+        Write the detailed report to binary stream `f`, one result at a time.
+
+        The layout matches generate_report(): the summary sections first, then
+        "detailed_results", streamed without holding every result dict in memory.
+        """
+        if summary is None:
+            summary = self.generate_summary(results)
+        # Reopen the summary object: drop its closing brace, append the results
+        f.write((_dumps_report(summary)[:-2] + b",\n") if summary else b"{\n")
+        f.write(b'  "detailed_results": [')
+        first = True
+        for r in results:
+            f.write(b"\n    " if first else b",\n    ")
+            f.write(_dumps_report(r.to_dict()).replace(b"\n", b"\n    "))
+            first = False
+        f.write(b"]\n}" if first else b"\n  ]\n}")
+
+
+def _dumps_report(obj) -> bytes:
+    """
+    Serialize report data as indented UTF-8 JSON, keys in insertion order.
+
+    Non-ASCII text is written as-is on both paths, so the json fallback
+    produces the same bytes as orjson.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 def main():
     parser = argparse.ArgumentParser(description="Epistemic Audit Evaluation Harness")
@@ -508,11 +702,13 @@ def main():
     parser.add_argument("--report", action="store_true", help="Generate detailed JSON report")
     parser.add_argument("--output", type=str, help="Output file for report (default: stdout)")
     parser.add_argument("--golden", type=str, help="Path to golden cases JSON")
+    parser.add_argument("--no-cache", action="store_true", help="Re-run the pipeline for repeated input texts")
+    parser.add_argument("--workers", type=int, help="Worker processes for case runs (default: physical cores)")
 
     args = parser.parse_args()
 
     golden_path = Path(args.golden) if args.golden else None
-    harness = EvaluationHarness(golden_path)
+    harness = EvaluationHarness(golden_path, use_cache=not args.no_cache, workers=args.workers)
 
     if args.case:
         result = harness.run_case(args.case)
@@ -529,16 +725,18 @@ def main():
     else:
         results = harness.run_all()
 
-    report = harness.generate_report(results)
+    report = harness.generate_summary(results)
 
     if args.report or args.output:
-        output = json.dumps(report, indent=2)
         if args.output:
-            with open(args.output, "w") as f:
-                f.write(output)
+            with open(args.output, "wb") as f:
+                harness.write_report(results, f, report)
             print(f"Report written to {args.output}")
         else:
-            print(output)
+            sys.stdout.flush()
+            harness.write_report(results, sys.stdout.buffer, report)
+            sys.stdout.buffer.write(b"\n")
+            sys.stdout.buffer.flush()
     else:
         # Print summary
         print("\n=== Evaluation Results ===\n")
@@ -558,7 +756,7 @@ def main():
                     for err in r.errors:
                         print(f"       - {err}")
                     if r.downgrade_reason:
-                        print(f"       Phase: {r.downgrade_reason.phase.value}")
+                        print(f"       Phase: {r.downgrade_reason.phase_value}")
                         print(f"       Issue: {r.downgrade_reason.issue}")
                     print()
 
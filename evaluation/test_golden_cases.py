@@ -12,22 +12,34 @@ import json
 from pathlib import Path
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from backend.pipeline.run_full_audit import AuditPipeline
 from evaluation.harness import evaluate_case
 
 
 # Load golden cases
 GOLDEN_PATH = Path(__file__).parent / "golden_cases.json"
-with open(GOLDEN_PATH) as f:
-    GOLDEN_DATA = json.load(f)
+with open(GOLDEN_PATH, "rb") as f:
+    GOLDEN_DATA = orjson.loads(f.read()) if orjson is not None else json.load(f)
     GOLDEN_CASES = GOLDEN_DATA.get("cases", [])
+    CASES_BY_ID = {case["case_id"]: case for case in GOLDEN_CASES}
+
+# Category filters used by the grouped test classes, computed once
+CASES_BY_CATEGORY = {}
+for _case in GOLDEN_CASES:
+    CASES_BY_CATEGORY.setdefault(_case.get("category", ""), []).append(_case)
+HALLUCINATION_CASES = [c for c in GOLDEN_CASES if c.get("category", "").startswith("hallucination_")]
 
 
 # Create shared pipeline instance (expensive to initialize)
 @pytest.fixture(scope="module")
 def pipeline():
+    from backend.pipeline.run_full_audit import AuditPipeline
     return AuditPipeline()
 
 
@@ -36,12 +48,17 @@ def case_ids():
     return [case["case_id"] for case in GOLDEN_CASES]
 
 
+def _case_id(case: dict) -> str:
+    """pytest id for a case-parametrized test."""
+    return case["case_id"]
+
+
 def get_case_by_id(case_id: str) -> dict:
     """Retrieve a golden case by ID."""
-    for case in GOLDEN_CASES:
-        if case["case_id"] == case_id:
-            return case
-    raise ValueError(f"Case not found: {case_id}")
+    case = CASES_BY_ID.get(case_id)
+    if case is None:
+        raise ValueError(f"Case not found: {case_id}")
+    return case
 
 
 class TestGoldenCases:
@@ -55,7 +72,7 @@ class TestGoldenCases:
     def test_golden_case(self, case_id):
         """Run a single golden test case."""
         case = get_case_by_id(case_id)
-        result = evaluate_case(self.pipeline, case)
+        result = evaluate_case(self.pipeline.run, case, early_exit=True)
 
         # Build detailed failure message
         if not result.passed:
@@ -67,7 +84,7 @@ class TestGoldenCases:
                 msg_parts.append(f"Error: {error}")
 
             if result.downgrade_reason:
-                msg_parts.append(f"Blocking Phase: {result.downgrade_reason.phase.value}")
+                msg_parts.append(f"Blocking Phase: {result.downgrade_reason.phase_value}")
                 msg_parts.append(f"Issue: {result.downgrade_reason.issue}")
 
             pytest.fail("\n".join(msg_parts))
@@ -80,36 +97,29 @@ class TestVerdictCategories:
     def setup(self, pipeline):
         self.pipeline = pipeline
 
-    def get_cases_by_category(self, category: str) -> list:
-        return [c for c in GOLDEN_CASES if c.get("category") == category]
-
-    def test_supported_verdicts(self):
+    @pytest.mark.parametrize("case", CASES_BY_CATEGORY.get("verdict_supported", []), ids=_case_id)
+    def test_supported_verdicts(self, case):
         """All SUPPORTED test cases should pass."""
-        cases = self.get_cases_by_category("verdict_supported")
-        for case in cases:
-            result = evaluate_case(self.pipeline, case)
-            assert result.passed, f"{case['case_id']}: {result.errors}"
+        result = evaluate_case(self.pipeline.run, case)
+        assert result.passed, f"{case['case_id']}: {result.errors}"
 
-    def test_refuted_verdicts(self):
+    @pytest.mark.parametrize("case", CASES_BY_CATEGORY.get("verdict_refuted", []), ids=_case_id)
+    def test_refuted_verdicts(self, case):
         """All REFUTED test cases should pass."""
-        cases = self.get_cases_by_category("verdict_refuted")
-        for case in cases:
-            result = evaluate_case(self.pipeline, case)
-            assert result.passed, f"{case['case_id']}: {result.errors}"
+        result = evaluate_case(self.pipeline.run, case)
+        assert result.passed, f"{case['case_id']}: {result.errors}"
 
-    def test_insufficient_verdicts(self):
+    @pytest.mark.parametrize("case", CASES_BY_CATEGORY.get("verdict_insufficient", []), ids=_case_id)
+    def test_insufficient_verdicts(self, case):
         """All INSUFFICIENT_EVIDENCE test cases should pass."""
-        cases = self.get_cases_by_category("verdict_insufficient")
-        for case in cases:
-            result = evaluate_case(self.pipeline, case)
-            assert result.passed, f"{case['case_id']}: {result.errors}"
+        result = evaluate_case(self.pipeline.run, case)
+        assert result.passed, f"{case['case_id']}: {result.errors}"
 
-    def test_uncertain_verdicts(self):
+    @pytest.mark.parametrize("case", CASES_BY_CATEGORY.get("verdict_uncertain", []), ids=_case_id)
+    def test_uncertain_verdicts(self, case):
         """All UNCERTAIN test cases should pass."""
-        cases = self.get_cases_by_category("verdict_uncertain")
-        for case in cases:
-            result = evaluate_case(self.pipeline, case)
-            assert result.passed, f"{case['case_id']}: {result.errors}"
+        result = evaluate_case(self.pipeline.run, case)
+        assert result.passed, f"{case['case_id']}: {result.errors}"
 
 
 class TestHallucinationDetection:
@@ -119,20 +129,16 @@ class TestHallucinationDetection:
     def setup(self, pipeline):
         self.pipeline = pipeline
 
-    def get_hallucination_cases(self) -> list:
-        return [c for c in GOLDEN_CASES if c.get("category", "").startswith("hallucination_")]
-
-    def test_all_hallucination_types_detected(self):
+    @pytest.mark.parametrize("case", HALLUCINATION_CASES, ids=_case_id)
+    def test_all_hallucination_types_detected(self, case):
         """Verify all expected hallucination types are detected."""
-        cases = self.get_hallucination_cases()
-        for case in cases:
-            result = evaluate_case(self.pipeline, case)
-            expected_types = case["expected"].get("hallucination_types", [])
-            for ht in expected_types:
-                assert ht in result.actual_hallucinations, (
-                    f"{case['case_id']}: Expected {ht} not detected. "
-                    f"Got: {result.actual_hallucinations}"
-                )
+        result = evaluate_case(self.pipeline.run, case)
+        expected_types = case["expected"].get("hallucination_types", [])
+        for ht in expected_types:
+            assert ht in result.actual_hallucinations, (
+                f"{case['case_id']}: Expected {ht} not detected. "
+                f"Got: {result.actual_hallucinations}"
+            )
 
 
 class TestDowngradeChains:
@@ -142,26 +148,22 @@ class TestDowngradeChains:
     def setup(self, pipeline):
         self.pipeline = pipeline
 
-    def get_downgrade_cases(self) -> list:
-        return [c for c in GOLDEN_CASES if c.get("category") == "downgrade_chain"]
-
-    def test_downgrade_reasons_captured(self):
+    @pytest.mark.parametrize("case", CASES_BY_CATEGORY.get("downgrade_chain", []), ids=_case_id)
+    def test_downgrade_reasons_captured(self, case):
         """Verify downgrade reasons are properly captured."""
-        cases = self.get_downgrade_cases()
-        for case in cases:
-            result = evaluate_case(self.pipeline, case)
-            assert result.downgrade_reason is not None, (
-                f"{case['case_id']}: No downgrade reason captured"
+        result = evaluate_case(self.pipeline.run, case)
+        assert result.downgrade_reason is not None, (
+            f"{case['case_id']}: No downgrade reason captured"
+        )
+
+        # Check expected phase if specified
+        expected_reason = case["expected"].get("downgrade_reason", {})
+        if "phase" in expected_reason:
+            assert result.downgrade_reason.phase_value == expected_reason["phase"], (
+                f"{case['case_id']}: Expected phase {expected_reason['phase']}, "
+                f"got {result.downgrade_reason.phase_value}"
             )
 
-            # Check expected phase if specified
-            expected_reason = case["expected"].get("downgrade_reason", {})
-            if "phase" in expected_reason:
-                assert result.downgrade_reason.phase.value == expected_reason["phase"], (
-                    f"{case['case_id']}: Expected phase {expected_reason['phase']}, "
-                    f"got {result.downgrade_reason.phase.value}"
-                )
-
 
 class TestRiskCalculation:
     """Tests for risk score and level calculation."""
@@ -170,20 +172,16 @@ class TestRiskCalculation:
     def setup(self, pipeline):
         self.pipeline = pipeline
 
-    def get_risk_cases(self) -> list:
-        return [c for c in GOLDEN_CASES if c.get("category") == "risk_calculation"]
-
-    def test_risk_levels(self):
+    @pytest.mark.parametrize("case", CASES_BY_CATEGORY.get("risk_calculation", []), ids=_case_id)
+    def test_risk_levels(self, case):
         """Verify risk levels are correctly calculated."""
-        cases = self.get_risk_cases()
-        for case in cases:
-            result = evaluate_case(self.pipeline, case)
-            expected_risk = case["expected"].get("risk_level")
-            if expected_risk:
-                assert result.actual_risk == expected_risk, (
-                    f"{case['case_id']}: Expected risk {expected_risk}, "
-                    f"got {result.actual_risk}"
-                )
+        result = evaluate_case(self.pipeline.run, case)
+        expected_risk = case["expected"].get("risk_level")
+        if expected_risk:
+            assert result.actual_risk == expected_risk, (
+                f"{case['case_id']}: Expected risk {expected_risk}, "
+                f"got {result.actual_risk}"
+            )
 
 
 class TestEdgeCases:
@@ -193,15 +191,11 @@ class TestEdgeCases:
     def setup(self, pipeline):
         self.pipeline = pipeline
 
-    def get_edge_cases(self) -> list:
-        return [c for c in GOLDEN_CASES if c.get("category") == "edge_case"]
-
-    def test_edge_cases(self):
+    @pytest.mark.parametrize("case", CASES_BY_CATEGORY.get("edge_case", []), ids=_case_id)
+    def test_edge_cases(self, case):
         """Verify edge cases are handled correctly."""
-        cases = self.get_edge_cases()
-        for case in cases:
-            result = evaluate_case(self.pipeline, case)
-            assert result.passed, f"{case['case_id']}: {result.errors}"
+        result = evaluate_case(self.pipeline.run, case)
+        assert result.passed, f"{case['case_id']}: {result.errors}"
 
 
 class TestDeterminism:
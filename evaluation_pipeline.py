@@ -1,7 +1,13 @@
 import json
 import argparse
-from typing import List, Dict, Any
-from sklearn.metrics import confusion_matrix, precision_recall_fscore_support
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class EvaluationPipeline:
     """
@@ -11,16 +17,17 @@ class EvaluationPipeline:
     
     def __init__(self):
         self.LABELS = ["SUPPORTED", "REFUTED", "UNCERTAIN", "INSUFFICIENT_EVIDENCE"]
+        self.label_to_idx = {label: i for i, label in enumerate(self.LABELS)}
 
     def evaluate_file(self, gold_file_path: str, predictions_file_path: str) -> Dict[str, Any]:
         """
-        Loads gold labels and predictions (aligned by index or ID) and computes metrics.
+        Streams gold labels and predictions (aligned by index) and computes metrics.
         Assumes strictly aligned JSONL or JSON lists.
         """
-        gold_data = self._load_data(gold_file_path)
-        pred_data = self._load_data(predictions_file_path)
-        
-        return self.evaluate_predictions(pred_data, gold_data)
+        gold_verdicts = self._iter_verdicts(gold_file_path)
+        pred_verdicts = self._iter_verdicts(predictions_file_path)
+
+        return self._compute_metrics(zip(gold_verdicts, pred_verdicts))
 
     def evaluate_predictions(self, predictions: List[Dict[str, Any]], gold: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -28,30 +35,53 @@ class EvaluationPipeline:
         Uses simplistic alignment (matching index or claim text exact match).
         For strict eval, we assume claims are 1:1 aligned or use Claim ID if available.
         """
-        y_true = []
-        y_pred = []
-        
-        limit = min(len(predictions), len(gold))
-        for i in range(limit):
-            p = predictions[i]
-            g = gold[i]
-            
-            # Extract Verdicts
-            p_v = p.get("verification", {}).get("verdict", "INSUFFICIENT_EVIDENCE")
-            g_v = g.get("verification", {}).get("verdict", "INSUFFICIENT_EVIDENCE")
-            
-            y_true.append(g_v)
-            y_pred.append(p_v)
-            
-        # Metrics
-        precision, recall, f1, _ = precision_recall_fscore_support(y_true, y_pred, average='macro', zero_division=0)
-        cm = confusion_matrix(y_true, y_pred, labels=self.LABELS)
+        verdict_pairs = (
+            (self._verdict(g), self._verdict(p))
+            for p, g in zip(predictions, gold)
+        )
+        return self._compute_metrics(verdict_pairs)
+
+    def _compute_metrics(self, verdict_pairs: Iterable[Tuple[str, str]]) -> Dict[str, Any]:
+        n_labels = len(self.LABELS)
+        # LABELS keep codes 0..3; any other verdict gets its own code on first sight
+        label_to_idx = dict(self.label_to_idx)
+
+        # Counted as the pairs stream in, so no per-record array is ever held
+        pair_counts: Counter = Counter()
+        for g_v, p_v in verdict_pairs:
+            g_code = label_to_idx.setdefault(g_v, len(label_to_idx))
+            p_code = label_to_idx.setdefault(p_v, len(label_to_idx))
+            pair_counts[(g_code, p_code)] += 1
+
+        n_codes = len(label_to_idx)
+        counts = np.zeros((n_codes, n_codes), dtype=np.int64)
+        for (g_code, p_code), count in pair_counts.items():
+            counts[g_code, p_code] = count
+
+        # Macro P/R/F1 over the labels seen in gold or predictions (zero_division=0)
+        tp = np.diag(counts).astype(np.float64)
+        predicted = counts.sum(axis=0)
+        actual = counts.sum(axis=1)
+        present = (predicted + actual) > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            precision = np.nan_to_num(tp / predicted)
+            recall = np.nan_to_num(tp / actual)
+            f1 = np.nan_to_num(2 * precision * recall / (precision + recall))
+
+        if present.any():
+            precision_macro = precision[present].mean()
+            recall_macro = recall[present].mean()
+            f1_macro = f1[present].mean()
+        else:
+            precision_macro = recall_macro = f1_macro = 0.0
+
+        cm = counts[:n_labels, :n_labels]
         
         return {
             "metrics": {
-                "precision_macro": float(precision),
-                "recall_macro": float(recall),
-                "f1_macro": float(f1)
+                "precision_macro": float(precision_macro),
+                "recall_macro": float(recall_macro),
+                "f1_macro": float(f1_macro)
             },
             "confusion_matrix": {
                 "labels": self.LABELS,
@@ -59,11 +89,34 @@ class EvaluationPipeline:
             }
         }
 
-    def _load_data(self, path: str) -> List[Dict[str, Any]]:
-        with open(path, 'r') as f:
-            if path.endswith(".jsonl"):
-                return [json.loads(line) for line in f]
-            return json.load(f)
+    @staticmethod
+    def _verdict(record: Dict[str, Any]) -> str:
+        return record.get("verification", {}).get("verdict", "INSUFFICIENT_EVIDENCE")
+
+    def _iter_verdicts(self, path: str) -> Iterator[str]:
+        """
+        Yields one verdict per record without holding the parsed records in memory.
+        A file whose first non-whitespace character is '[' is read as a JSON list;
+        anything else is read line by line as JSONL.
+        """
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(path, 'rb') as f:
+            first = b""
+            while True:
+                ch = f.read(1)
+                if not ch or not ch.isspace():
+                    first = ch
+                    break
+            f.seek(0)
+
+            if first == b"[":
+                for record in loads(f.read()):
+                    yield self._verdict(record)
+                return
+
+            for line in f:
+                if line.strip():
+                    yield self._verdict(loads(line))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
+import atexit
+import bisect
+import itertools
 import json
 import os
 import random
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 ROOT = Path(__file__).resolve().parents[2]
 BACKEND_DIR = ROOT / "backend"
@@ -56,6 +65,13 @@ DOMAIN_FILLER = {
     ],
 }
 
+# Filler pool per domain (domain-specific first, then generic), built once;
+# domains without their own filler fall back to the generic pool.
+_FILLERS_BY_DOMAIN: Dict[str, Tuple[str, ...]] = {
+    domain: tuple(fillers) + tuple(GENERIC_FILLER) for domain, fillers in DOMAIN_FILLER.items()
+}
+_GENERIC_FILLERS: Tuple[str, ...] = tuple(GENERIC_FILLER)
+
 
 def parse_domain_weights(raw: str) -> Dict[str, float]:
     if not raw:
@@ -84,17 +100,6 @@ def parse_domain_weights(raw: str) -> Dict[str, float]:
     return {k: v / total for k, v in parsed.items()}
 
 
-def choose_weighted(rng: random.Random, weights: Dict[str, float]) -> str:
-    items = sorted(weights.items(), key=lambda item: item[0])
-    roll = rng.random()
-    acc = 0.0
-    for key, weight in items:
-        acc += weight
-        if roll <= acc:
-            return key
-    return items[-1][0]
-
-
 def build_core_paragraphs(domain: str, rng: random.Random) -> List[str]:
     if domain == "tech":
         company = rng.choice(["Microsoft", "Intel", "NVIDIA", "Adobe", "Cisco"])
@@ -184,19 +189,27 @@ def build_core_paragraphs(domain: str, rng: random.Random) -> List[str]:
 
 def target_length(base_paragraphs: List[str], target_chars: int, domain: str, rng: random.Random) -> str:
     target_chars = min(MAX_CHARS, max(250, int(target_chars)))
-    fillers = list(DOMAIN_FILLER.get(domain, [])) + list(GENERIC_FILLER)
+    fillers = _FILLERS_BY_DOMAIN.get(domain, _GENERIC_FILLERS)
     working = list(base_paragraphs)
 
-    text = "\n\n".join(working)
-    while len(text) < target_chars:
-        working.append(rng.choice(fillers))
-        text = "\n\n".join(working)
+    # Track the joined length instead of re-joining after every append; fillers
+    # are still drawn one at a time so the seeded sample stream is unchanged.
+    text_len = len("\n\n".join(working))
+    while text_len < target_chars:
+        filler = rng.choice(fillers)
+        text_len += len(filler) + (2 if working else 0)
+        working.append(filler)
         if len(working) > 200:
             break
 
-    while len(text) > target_chars and len(working) > len(base_paragraphs):
-        working.pop()
-        text = "\n\n".join(working)
+    # Drop trailing fillers until the text fits, but never the core paragraphs.
+    # The first k paragraphs join to cum[k-1] - 2 chars, so the longest prefix
+    # that fits is found by bisection instead of re-joining after every pop.
+    if text_len > target_chars and len(working) > len(base_paragraphs):
+        cum = list(itertools.accumulate(len(p) + 2 for p in working))
+        keep = max(len(base_paragraphs), bisect.bisect_right(cum, target_chars + 2))
+        del working[keep:]
+    text = "\n\n".join(working)
 
     if len(text) > target_chars:
         candidate = text[:target_chars]
@@ -222,7 +235,7 @@ def load_custom_testcases(path: Path) -> List[Dict[str, str]]:
         if not line:
             continue
         try:
-            obj = json.loads(line)
+            obj = orjson.loads(line) if orjson is not None else json.loads(line)
         except json.JSONDecodeError:
             print(f"[WARN] Skipping malformed custom testcase line {line_no}")
             continue
@@ -241,107 +254,120 @@ def load_custom_testcases(path: Path) -> List[Dict[str, str]]:
     return output
 
 
+class _Timer:
+    """Wall-clock milliseconds spent inside the with-block, recorded even if it raises."""
+
+    def __init__(self) -> None:
+        self.ms = 0
+        self._started = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        self.ms = int((time.perf_counter() - self._started) * 1000)
+        return False
+
+
+_WORKER_PIPELINE = None
+
+
+def _run_pipeline(pipeline, text: str, mode: str) -> Tuple[Dict[str, Any], Optional[str], int]:
+    """Run one audit; pipeline failures come back as a 500 result plus error tag."""
+    timer = _Timer()
+    try:
+        with timer:
+            result = pipeline.run(text, mode=mode)
+        return result, None, timer.ms
+    except Exception as exc:
+        return {"status_code": 500, "detail": str(exc)}, "pipeline_exception", timer.ms
+
+
+def _init_worker() -> None:
+    global _WORKER_PIPELINE
+    _WORKER_PIPELINE = AuditPipeline()
+
+
+def _run_one(task: Tuple[str, str]) -> Tuple[Dict[str, Any], Optional[str], int]:
+    text, mode = task
+    return _run_pipeline(_WORKER_PIPELINE, text, mode)
+
+
 def main() -> None:
     runs = int(os.getenv("EPI_SYNTH_RUNS", "500"))
     seed = int(os.getenv("EPI_SYNTH_SEED", "42"))
     mode_default = normalize_mode(os.getenv("EPI_SYNTH_MODE", "demo"))
     weights = parse_domain_weights(os.getenv("EPI_DOMAIN_WEIGHTS", ""))
+    workers = max(1, int(os.getenv("EPI_SYNTH_WORKERS", "1")))
     custom_path = ROOT / "paper" / "data" / "custom_testcases.jsonl"
     log_path = ROOT / "paper" / "data" / "audit_runs.jsonl"
+    log_batch = int(os.getenv("EPI_LOG_BATCH", "25"))
     os.environ.setdefault("DEBUG_TIMINGS", "1")
 
     rng = random.Random(seed)
-    logger = AuditRunLogger(log_path=log_path)
-    pipeline = AuditPipeline()
+    logger = AuditRunLogger(log_path=log_path, batch_size=log_batch)
+    # Buffered records still reach the dataset if the sweep is interrupted
+    atexit.register(logger.flush)
 
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    synthetic_success = 0
-    synthetic_failed = 0
     print(f"[INFO] Writing audit runs to: {log_path}")
-    print(f"[INFO] Synthetic runs={runs}, seed={seed}, mode={mode_default}")
+    print(f"[INFO] Synthetic runs={runs}, seed={seed}, mode={mode_default}, workers={workers}")
     print(f"[INFO] Domain weights={weights}")
 
+    # Cumulative weights in sorted-key order; random.choices bisects these
+    # with a single rng.random() draw per pick.
+    domain_keys = sorted(weights)
+    domain_cum = list(itertools.accumulate(weights[k] for k in domain_keys))
+
+    # All samples are drawn up front from the one seeded RNG, so the dataset is
+    # the same whatever the worker count; results are logged in task order.
+    tasks: List[Tuple[str, str, Dict[str, Any]]] = []
     for idx in range(runs):
-        domain = choose_weighted(rng, weights)
+        domain = rng.choices(domain_keys, cum_weights=domain_cum)[0]
         target_chars = rng.choice(TARGET_BUCKETS)
         text = build_synthetic_sample(domain, target_chars, rng)
-        mode = mode_default
-        started = time.perf_counter()
-        try:
-            result = pipeline.run(text, mode=mode)
-            elapsed_ms = int((time.perf_counter() - started) * 1000)
-            logger.log_run(
-                input_text=text,
-                mode=mode,
-                result=result,
-                extra_metadata={
-                    "run_source": "synthetic",
-                    "domain": domain,
-                    "target_chars": target_chars,
-                    "synthetic_index": idx,
-                    "request_wall_ms": elapsed_ms,
-                },
-            )
-            synthetic_success += 1
-        except Exception as exc:
-            elapsed_ms = int((time.perf_counter() - started) * 1000)
-            logger.log_run(
-                input_text=text,
-                mode=mode,
-                result={"status_code": 500, "detail": str(exc)},
-                extra_metadata={
-                    "run_source": "synthetic",
-                    "domain": domain,
-                    "target_chars": target_chars,
-                    "synthetic_index": idx,
-                    "request_wall_ms": elapsed_ms,
-                    "error": "pipeline_exception",
-                },
-            )
-            synthetic_failed += 1
+        tasks.append((text, mode_default, {
+            "run_source": "synthetic",
+            "domain": domain,
+            "target_chars": target_chars,
+            "synthetic_index": idx,
+        }))
 
     custom_cases = load_custom_testcases(custom_path)
-    custom_success = 0
-    custom_failed = 0
     if custom_cases:
         print(f"[INFO] Running {len(custom_cases)} custom testcases from {custom_path}")
     for case in custom_cases:
-        text = case["text"][:MAX_CHARS]
-        mode = normalize_mode(case.get("mode") or mode_default)
-        domain = (case.get("domain") or "custom").strip().lower() or "custom"
-        started = time.perf_counter()
-        try:
-            result = pipeline.run(text, mode=mode)
-            elapsed_ms = int((time.perf_counter() - started) * 1000)
-            logger.log_run(
-                input_text=text,
-                mode=mode,
-                result=result,
-                extra_metadata={
-                    "run_source": "custom_testcase",
-                    "domain": domain,
-                    "custom_id": case.get("id"),
-                    "request_wall_ms": elapsed_ms,
-                },
-            )
-            custom_success += 1
-        except Exception as exc:
-            elapsed_ms = int((time.perf_counter() - started) * 1000)
-            logger.log_run(
-                input_text=text,
-                mode=mode,
-                result={"status_code": 500, "detail": str(exc)},
-                extra_metadata={
-                    "run_source": "custom_testcase",
-                    "domain": domain,
-                    "custom_id": case.get("id"),
-                    "request_wall_ms": elapsed_ms,
-                    "error": "pipeline_exception",
-                },
-            )
-            custom_failed += 1
-
+        tasks.append((case["text"][:MAX_CHARS], normalize_mode(case.get("mode") or mode_default), {
+            "run_source": "custom_testcase",
+            "domain": (case.get("domain") or "custom").strip().lower() or "custom",
+            "custom_id": case.get("id"),
+        }))
+
+    counts = {"synthetic": [0, 0], "custom_testcase": [0, 0]}
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) if workers > 1 else None
+    try:
+        if executor is not None:
+            outcomes = executor.map(_run_one, [(text, mode) for text, mode, _ in tasks])
+        else:
+            pipeline = AuditPipeline()
+            outcomes = (_run_pipeline(pipeline, text, mode) for text, mode, _ in tasks)
+
+        for (text, mode, metadata), (result, error, wall_ms) in zip(tasks, outcomes):
+            extra_metadata = dict(metadata, request_wall_ms=wall_ms)
+            if error:
+                extra_metadata["error"] = error
+            logger.log_run(input_text=text, mode=mode, result=result, extra_metadata=extra_metadata)
+            counts[metadata["run_source"]][1 if error else 0] += 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    logger.flush()
+
+    synthetic_success, synthetic_failed = counts["synthetic"]
+    custom_success, custom_failed = counts["custom_testcase"]
     print("[DONE] Synthetic generation complete.")
     print(f"[DONE] synthetic_success={synthetic_success} synthetic_failed={synthetic_failed}")
     print(f"[DONE] custom_success={custom_success} custom_failed={custom_failed}")
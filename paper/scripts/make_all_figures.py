@@ -1,12 +1,20 @@
 #!/usr/bin/env python3
+import hashlib
 import json
 import math
-import statistics
+import os
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import matplotlib
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
@@ -14,6 +22,9 @@ import matplotlib.pyplot as plt
 ROOT = Path(__file__).resolve().parents[2]
 DATASET_PATH = ROOT / "paper" / "data" / "audit_runs.jsonl"
 FIGURES_DIR = ROOT / "figures"
+CACHE_SIG_NAME = ".cache_sig"
+# Plain bar charts read fine at a lower raster resolution; the PDFs stay vector
+BAR_CHART_DPI = 150
 VERDICTS = [
     "SUPPORTED",
     "PARTIALLY_SUPPORTED",
@@ -22,26 +33,40 @@ VERDICTS = [
     "INSUFFICIENT_EVIDENCE",
 ]
 EVIDENCE_SOURCES = ["wikidata", "wikipedia", "primary_document", "grokipedia"]
+RISK_TIERS = ["LOW", "MEDIUM", "HIGH"]
+RISK_TIER_CUTOFFS = [0.33, 0.66]
 
 
 def is_number(value: Any) -> bool:
     return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(float(value))
 
 
+def parse_json_line(line: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity tokens and oversized ints; json accepts them
+            pass
+    return json.loads(line)
+
+
 def load_jsonl(path: Path) -> List[Dict[str, Any]]:
     if not path.exists():
         return []
     records: List[Dict[str, Any]] = []
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        try:
-            obj = json.loads(line)
-            if isinstance(obj, dict):
-                records.append(obj)
-        except json.JSONDecodeError:
-            continue
+    # Stream raw lines straight to the parser rather than holding the whole file
+    with path.open("rb") as f:
+        for raw in f:
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                obj = parse_json_line(line)
+                if isinstance(obj, dict):
+                    records.append(obj)
+            except json.JSONDecodeError:
+                continue
     return records
 
 
@@ -55,43 +80,43 @@ def get_claims(record: Dict[str, Any]) -> List[Dict[str, Any]]:
     return [claim for claim in claims if isinstance(claim, dict)]
 
 
-def verdict_for_claim(claim: Dict[str, Any]) -> str:
-    verification = claim.get("verification", {})
-    if not isinstance(verification, dict):
-        return "UNCERTAIN"
-    verdict = str(verification.get("verdict", "UNCERTAIN")).strip().upper()
-    if verdict == "SUPPORTED_WEAK":
-        return "SUPPORTED"
-    return verdict
+def extract_claim_fields(claim: Dict[str, Any]) -> Tuple[str, int, bool, str]:
+    """Flatten one claim to (verdict, evidence source bitmask, contradicted, entity name).
 
+    Bit k of the mask is set when EVIDENCE_SOURCES[k] has evidence items. Each
+    nested object is looked up and type-checked once per claim.
+    """
+    verification = claim.get("verification", {})
+    contradicted = False
+    if isinstance(verification, dict):
+        verdict = str(verification.get("verdict", "UNCERTAIN")).strip().upper()
+        if verdict == "SUPPORTED_WEAK":
+            verdict = "SUPPORTED"
+        contradicted_by = verification.get("contradicted_by")
+        contradicted = isinstance(contradicted_by, list) and len(contradicted_by) > 0
+    else:
+        verdict = "UNCERTAIN"
+    contradicted = contradicted or verdict == "REFUTED"
 
-def claim_has_source(claim: Dict[str, Any], source: str) -> bool:
+    evidence_mask = 0
     evidence = claim.get("evidence", {})
-    if not isinstance(evidence, dict):
-        return False
-    items = evidence.get(source)
-    return isinstance(items, list) and len(items) > 0
+    if isinstance(evidence, dict):
+        for bit, source in enumerate(EVIDENCE_SOURCES):
+            items = evidence.get(source)
+            if isinstance(items, list) and len(items) > 0:
+                evidence_mask |= 1 << bit
 
+    entity = ""
+    subject_entity = claim.get("subject_entity", {})
+    if isinstance(subject_entity, dict):
+        entity = str(subject_entity.get("canonical_name", "")).strip() or str(claim.get("subject", "")).strip()
 
-def claim_has_any_evidence(claim: Dict[str, Any]) -> bool:
-    return any(claim_has_source(claim, source) for source in EVIDENCE_SOURCES)
+    return verdict, evidence_mask, contradicted, entity
 
 
-def claim_has_contradiction(claim: Dict[str, Any]) -> bool:
-    verification = claim.get("verification", {})
-    if isinstance(verification, dict):
-        contradicted = verification.get("contradicted_by")
-        if isinstance(contradicted, list) and len(contradicted) > 0:
-            return True
-    return verdict_for_claim(claim) == "REFUTED"
-
-
-def risk_tier(score: float) -> str:
-    if score < 0.33:
-        return "LOW"
-    if score < 0.66:
-        return "MEDIUM"
-    return "HIGH"
+def risk_tier_indices(scores: List[float]) -> np.ndarray:
+    """Index into RISK_TIERS per score; a score equal to a cutoff moves up a tier."""
+    return np.searchsorted(RISK_TIER_CUTOFFS, np.asarray(scores, dtype=float), side="right")
 
 
 def mean(values: Iterable[float]) -> float:
@@ -101,23 +126,30 @@ def mean(values: Iterable[float]) -> float:
     return sum(values_list) / len(values_list)
 
 
-def binned_mean(xs: List[float], ys: List[float], edges: List[float]) -> Tuple[List[float], List[float]]:
-    centers: List[float] = []
-    means: List[float] = []
-    for idx in range(len(edges) - 1):
-        left = edges[idx]
-        right = edges[idx + 1]
-        bucket: List[float] = []
-        for x, y in zip(xs, ys):
-            if idx == len(edges) - 2:
-                in_bucket = left <= x <= right
-            else:
-                in_bucket = left <= x < right
-            if in_bucket:
-                bucket.append(y)
-        centers.append((left + right) / 2.0)
-        means.append(mean(bucket) if bucket else 0.0)
-    return centers, means
+def bin_indices(xs: List[float], edges: List[float]) -> np.ndarray:
+    """Bin index per x, computed once and shared by every binned_mean over the same xs.
+
+    Bins are [left, right) except the last, which also takes its right edge;
+    values outside the edges (or NaN) get len(edges) - 1, an overflow slot that
+    binned_mean drops.
+    """
+    edges_arr = np.asarray(edges, dtype=float)
+    xs_arr = np.asarray(xs, dtype=float)
+    n_bins = len(edges_arr) - 1
+    idx = np.digitize(xs_arr, edges_arr) - 1
+    idx[xs_arr == edges_arr[-1]] = n_bins - 1
+    idx[idx < 0] = n_bins
+    return idx
+
+
+def binned_mean(bin_idx: np.ndarray, ys: List[float], edges: List[float]) -> Tuple[List[float], List[float]]:
+    edges_arr = np.asarray(edges, dtype=float)
+    n_bins = len(edges_arr) - 1
+    sums = np.bincount(bin_idx, weights=np.asarray(ys, dtype=float), minlength=n_bins + 1)[:n_bins]
+    counts = np.bincount(bin_idx, minlength=n_bins + 1)[:n_bins]
+    means = np.divide(sums, counts, out=np.zeros(n_bins), where=counts > 0)
+    centers = (edges_arr[:-1] + edges_arr[1:]) / 2.0
+    return centers.tolist(), means.tolist()
 
 
 def setup_axes(ax: plt.Axes, xlabel: str, ylabel: str) -> None:
@@ -129,103 +161,113 @@ def setup_axes(ax: plt.Axes, xlabel: str, ylabel: str) -> None:
     ax.spines["right"].set_visible(False)
 
 
-def save_figure(fig: plt.Figure, stem: str, generated: List[str]) -> None:
+def reset_axes(ax: plt.Axes) -> None:
+    """Blank a reused axes so the next figure renders as if on a fresh one.
+
+    clear() leaves hidden spines hidden and the previous tight_layout margins in
+    place, so both are restored explicitly.
+    """
+    ax.clear()
+    for spine in ax.spines.values():
+        spine.set_visible(True)
+    margins = ("left", "right", "bottom", "top")
+    ax.figure.subplots_adjust(**{side: matplotlib.rcParams[f"figure.subplot.{side}"] for side in margins})
+
+
+def save_figure(
+    fig: plt.Figure, stem: str, generated: List[str], dpi: int = 300, emit_pdf: bool = True
+) -> None:
     FIGURES_DIR.mkdir(parents=True, exist_ok=True)
     png_path = FIGURES_DIR / f"{stem}.png"
-    pdf_path = FIGURES_DIR / f"{stem}.pdf"
     fig.tight_layout()
-    fig.savefig(png_path, dpi=300, bbox_inches="tight", facecolor="white", transparent=False)
-    fig.savefig(pdf_path, bbox_inches="tight", facecolor="white", transparent=False)
-    plt.close(fig)
+    fig.savefig(png_path, dpi=dpi, bbox_inches="tight", facecolor="white", transparent=False)
     generated.append(png_path.name)
-    generated.append(pdf_path.name)
+    if emit_pdf:
+        pdf_path = FIGURES_DIR / f"{stem}.pdf"
+        fig.savefig(pdf_path, bbox_inches="tight", facecolor="white", transparent=False)
+        generated.append(pdf_path.name)
+
+
+def figures_signature(dataset_path: Path) -> str:
+    """Fingerprint of the dataset and this script, from mtime and size only."""
+    parts = []
+    for path in (dataset_path, Path(__file__).resolve()):
+        if path.exists():
+            stat = path.stat()
+            parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        else:
+            parts.append("missing")
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def load_cached_figures(signature: str) -> Optional[List[str]]:
+    """Files from the last run if it rendered this exact signature and they all still exist."""
+    try:
+        lines = (FIGURES_DIR / CACHE_SIG_NAME).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+    if len(lines) < 2 or lines[0] != signature:
+        return None
+    filenames = lines[1:]
+    if not all((FIGURES_DIR / name).exists() for name in filenames):
+        return None
+    return filenames
+
+
+def write_figures_cache(signature: str, generated: List[str]) -> None:
+    lines = [signature, *sorted(generated)]
+    (FIGURES_DIR / CACHE_SIG_NAME).write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def print_generated(generated: List[str]) -> None:
+    print(f"DATASET: {DATASET_PATH}")
+    print(f"FIGURES_DIR: {FIGURES_DIR}")
+    print("GENERATED_FILES:")
+    for filename in sorted(generated):
+        print(filename)
 
 
 def aggregate(records: List[Dict[str, Any]]) -> Dict[str, Any]:
     scores: List[float] = []
     modes: List[str] = []
-    supported_rates: List[float] = []
-    refuted_rates: List[float] = []
-    bad_rates: List[float] = []
     claims_per_doc: List[int] = []
     domains: List[str] = []
-    run_bad_rates_by_domain: List[Tuple[str, float]] = []
+    domain_runs: List[Tuple[str, int]] = []
     timings: List[Dict[str, float]] = []
     request_wall_ms: List[float] = []
-    verdict_counter: Counter = Counter()
-    source_claim_counter: Counter = Counter()
-    entity_counter: Counter = Counter()
-    total_claims = 0
-    claims_with_any_evidence = 0
-    claims_with_contradiction = 0
-
-    for idx, record in enumerate(records):
+    entities: List[str] = []
+
+    # Claims are kept as parallel per-field columns and reduced with numpy once
+    # every record has been read. Verdicts outside VERDICTS get codes as seen.
+    verdict_codes: Dict[str, int] = {verdict: code for code, verdict in enumerate(VERDICTS)}
+    claim_verdicts: List[int] = []
+    claim_evidence: List[int] = []
+    claim_contradicted: List[bool] = []
+    claim_runs: List[int] = []
+
+    for run_idx, record in enumerate(records):
         mode = str(record.get("mode", "research")).strip().lower()
         if mode not in {"demo", "research"}:
             mode = "research"
         modes.append(mode)
 
+        # is_number is inlined at the per-record sites below
         score_value = record.get("hallucination_score")
-        score = float(score_value) if is_number(score_value) else None
-        if score is not None:
-            score = max(0.0, min(1.0, score))
-            scores.append(score)
+        if isinstance(score_value, (int, float)) and not isinstance(score_value, bool) and math.isfinite(score_value):
+            scores.append(max(0.0, min(1.0, float(score_value))))
         else:
             scores.append(0.0)
 
         claims = get_claims(record)
-        n_claims = len(claims)
-        claims_per_doc.append(n_claims)
-        total_claims += n_claims
-
-        local_counter: Counter = Counter()
-        local_supported = 0
-        local_refuted = 0
-        local_uncertain = 0
-        local_insufficient = 0
-
+        claims_per_doc.append(len(claims))
         for claim in claims:
-            verdict = verdict_for_claim(claim)
-            local_counter[verdict] += 1
-            verdict_counter[verdict] += 1
-
-            if verdict == "SUPPORTED":
-                local_supported += 1
-            elif verdict == "REFUTED":
-                local_refuted += 1
-            elif verdict == "UNCERTAIN":
-                local_uncertain += 1
-            elif verdict == "INSUFFICIENT_EVIDENCE":
-                local_insufficient += 1
-
-            for source in EVIDENCE_SOURCES:
-                if claim_has_source(claim, source):
-                    source_claim_counter[source] += 1
-
-            if claim_has_any_evidence(claim):
-                claims_with_any_evidence += 1
-            if claim_has_contradiction(claim):
-                claims_with_contradiction += 1
-
-            subject_entity = claim.get("subject_entity", {})
-            if isinstance(subject_entity, dict):
-                canonical = str(subject_entity.get("canonical_name", "")).strip()
-                if canonical:
-                    entity_counter[canonical] += 1
-                else:
-                    subj_text = str(claim.get("subject", "")).strip()
-                    if subj_text:
-                        entity_counter[subj_text] += 1
-
-        if n_claims > 0:
-            supported_rates.append(local_supported / n_claims)
-            refuted_rates.append(local_refuted / n_claims)
-            bad_rate = (local_refuted + local_uncertain + local_insufficient) / n_claims
-            bad_rates.append(bad_rate)
-        else:
-            supported_rates.append(0.0)
-            refuted_rates.append(0.0)
-            bad_rates.append(0.0)
+            verdict, evidence_mask, contradicted, entity = extract_claim_fields(claim)
+            claim_verdicts.append(verdict_codes.setdefault(verdict, len(verdict_codes)))
+            claim_evidence.append(evidence_mask)
+            claim_contradicted.append(contradicted)
+            claim_runs.append(run_idx)
+            if entity:
+                entities.append(entity)
 
         raw_domain = record.get("domain")
         if not raw_domain:
@@ -235,18 +277,45 @@ def aggregate(records: List[Dict[str, Any]]) -> Dict[str, Any]:
         domain = str(raw_domain).strip().lower() if raw_domain else ""
         if domain:
             domains.append(domain)
-            run_bad_rates_by_domain.append((domain, bad_rates[-1]))
+            domain_runs.append((domain, run_idx))
 
         timing_obj = record.get("timings_ms")
         if isinstance(timing_obj, dict):
-            numeric_timing = {k: float(v) for k, v in timing_obj.items() if is_number(v)}
+            numeric_timing = {
+                k: float(v)
+                for k, v in timing_obj.items()
+                if isinstance(v, (int, float)) and not isinstance(v, bool) and math.isfinite(v)
+            }
             if numeric_timing:
                 timings.append(numeric_timing)
 
         wall_ms = record.get("request_wall_ms")
-        if is_number(wall_ms):
+        if isinstance(wall_ms, (int, float)) and not isinstance(wall_ms, bool) and math.isfinite(wall_ms):
             request_wall_ms.append(float(wall_ms))
 
+    n_runs = len(records)
+    n_codes = len(verdict_codes)
+    verdicts_arr = np.asarray(claim_verdicts, dtype=np.int64)
+    runs_arr = np.asarray(claim_runs, dtype=np.int64)
+    evidence_arr = np.asarray(claim_evidence, dtype=np.int64)
+
+    # (run, verdict) claim counts from one bincount over the flattened pair index
+    run_verdicts = np.bincount(runs_arr * n_codes + verdicts_arr, minlength=n_runs * n_codes).reshape(n_runs, n_codes)
+    supported, refuted, uncertain, insufficient = (
+        run_verdicts[:, verdict_codes[verdict]]
+        for verdict in ("SUPPORTED", "REFUTED", "UNCERTAIN", "INSUFFICIENT_EVIDENCE")
+    )
+    # Runs without claims have all-zero counts, so dividing by 1 yields a 0.0 rate
+    n_claims = np.maximum(np.asarray(claims_per_doc, dtype=np.int64), 1)
+    supported_rates = (supported / n_claims).tolist()
+    refuted_rates = (refuted / n_claims).tolist()
+    bad_rates = ((refuted + uncertain + insufficient) / n_claims).tolist()
+
+    verdict_totals = run_verdicts.sum(axis=0).tolist()
+    verdict_counter = Counter({verdict: verdict_totals[code] for verdict, code in verdict_codes.items() if verdict_totals[code]})
+    source_totals = ((evidence_arr[:, None] >> np.arange(len(EVIDENCE_SOURCES))) & 1).sum(axis=0).tolist()
+    source_claim_counter = Counter({source: total for source, total in zip(EVIDENCE_SOURCES, source_totals) if total})
+
     return {
         "scores": scores,
         "modes": modes,
@@ -255,83 +324,88 @@ def aggregate(records: List[Dict[str, Any]]) -> Dict[str, Any]:
         "bad_rates": bad_rates,
         "claims_per_doc": claims_per_doc,
         "domains": domains,
-        "run_bad_rates_by_domain": run_bad_rates_by_domain,
+        "run_bad_rates_by_domain": [(domain, bad_rates[run_idx]) for domain, run_idx in domain_runs],
         "timings": timings,
         "request_wall_ms": request_wall_ms,
         "verdict_counter": verdict_counter,
         "source_claim_counter": source_claim_counter,
-        "entity_counter": entity_counter,
-        "total_claims": total_claims,
-        "claims_with_any_evidence": claims_with_any_evidence,
-        "claims_with_contradiction": claims_with_contradiction,
+        "entity_counter": Counter(entities),
+        "total_claims": len(claim_verdicts),
+        "claims_with_any_evidence": int(np.count_nonzero(evidence_arr)),
+        "claims_with_contradiction": int(np.count_nonzero(claim_contradicted)),
     }
 
 
-def main() -> None:
-    plt.rcParams["font.family"] = "DejaVu Sans"
-    records = load_jsonl(DATASET_PATH)
-    data = aggregate(records)
-    generated: List[str] = []
+SCORE_BIN_EDGES = [i / 10 for i in range(11)]
+
+
+def prepare_plot_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the score binnings several figures share, so each is computed once."""
+    scores_arr = np.asarray(data["scores"], dtype=float)
+    # Fixed [0, 1] histogram for figures 2 and 14
+    score_counts, score_edges = np.histogram(scores_arr, bins=10, range=(0.0, 1.0))
+    tier_idx = risk_tier_indices(data["scores"])
+    return dict(
+        data,
+        scores_arr=scores_arr,
+        score_counts=score_counts,
+        score_edges=score_edges,
+        score_bins=bin_indices(data["scores"], SCORE_BIN_EDGES),
+        tier_idx=tier_idx,
+        tier_counts=np.bincount(tier_idx, minlength=len(RISK_TIERS)),
+    )
 
-    # 1) Claim verdict distribution
-    fig, ax = plt.subplots(figsize=(8, 5), facecolor="white")
+
+def plot_claim_verdict_distribution(ax: plt.Axes, data: Dict[str, Any]) -> None:
     verdict_counts = [data["verdict_counter"].get(v, 0) for v in VERDICTS]
     bars = ax.bar(VERDICTS, verdict_counts, edgecolor="black", linewidth=0.8)
     for bar, value in zip(bars, verdict_counts):
         ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.1, str(value), ha="center", va="bottom", fontsize=9)
     setup_axes(ax, "Claim Verdict", "Count")
-    save_figure(fig, "fig01_claim_verdict_distribution", generated)
 
-    # 2) Risk score distribution
-    fig, ax = plt.subplots(figsize=(8, 5), facecolor="white")
-    ax.hist(data["scores"], bins=10, edgecolor="black", linewidth=0.8)
+
+def plot_risk_score_distribution(ax: plt.Axes, data: Dict[str, Any]) -> None:
+    score_edges = data["score_edges"]
+    ax.bar(score_edges[:-1], data["score_counts"], width=np.diff(score_edges), align="edge", edgecolor="black", linewidth=0.8)
     ax.set_xlim(0, 1)
     setup_axes(ax, "Epistemic Risk Score", "Frequency")
-    save_figure(fig, "fig02_risk_score_distribution", generated)
-
-    # 3) Risk tier distribution
-    fig, ax = plt.subplots(figsize=(8, 5), facecolor="white")
-    tier_counts = Counter(risk_tier(score) for score in data["scores"])
-    tiers = ["LOW", "MEDIUM", "HIGH"]
-    values = [tier_counts.get(tier, 0) for tier in tiers]
-    bars = ax.bar(tiers, values, edgecolor="black", linewidth=0.8)
+
+
+def plot_risk_tier_distribution(ax: plt.Axes, data: Dict[str, Any]) -> None:
+    values = data["tier_counts"].tolist()
+    bars = ax.bar(RISK_TIERS, values, edgecolor="black", linewidth=0.8)
     for bar, value in zip(bars, values):
         ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.1, str(value), ha="center", va="bottom", fontsize=9)
     setup_axes(ax, "Risk Tier", "Number of Runs")
-    save_figure(fig, "fig03_risk_tier_distribution", generated)
 
-    # 4) Score vs supported rate
-    fig, ax = plt.subplots(figsize=(8, 5), facecolor="white")
-    edges = [i / 10 for i in range(11)]
-    centers, means = binned_mean(data["scores"], data["supported_rates"], edges)
+
+def plot_score_vs_supported_rate(ax: plt.Axes, data: Dict[str, Any]) -> None:
+    centers, means = binned_mean(data["score_bins"], data["supported_rates"], SCORE_BIN_EDGES)
     ax.plot(centers, means, marker="o", linewidth=1.6)
     ax.set_xlim(0, 1)
     ax.set_ylim(0, 1)
     setup_axes(ax, "Hallucination Score (Bin Center)", "Supported Claim Rate")
-    save_figure(fig, "fig04_score_vs_supported_rate", generated)
 
-    # 5) Score vs refuted rate
-    fig, ax = plt.subplots(figsize=(8, 5), facecolor="white")
-    centers, means = binned_mean(data["scores"], data["refuted_rates"], edges)
+
+def plot_score_vs_refuted_rate(ax: plt.Axes, data: Dict[str, Any]) -> None:
+    centers, means = binned_mean(data["score_bins"], data["refuted_rates"], SCORE_BIN_EDGES)
     ax.plot(centers, means, marker="o", linewidth=1.6)
     ax.set_xlim(0, 1)
     ax.set_ylim(0, 1)
     setup_axes(ax, "Hallucination Score (Bin Center)", "Refuted Claim Rate")
-    save_figure(fig, "fig05_score_vs_refuted_rate", generated)
 
-    # 6) Calibration-style bad outcome rate
-    fig, ax = plt.subplots(figsize=(8, 5), facecolor="white")
-    centers, means = binned_mean(data["scores"], data["bad_rates"], edges)
+
+def plot_calibration_bad_outcome_rate(ax: plt.Axes, data: Dict[str, Any]) -> None:
+    centers, means = binned_mean(data["score_bins"], data["bad_rates"], SCORE_BIN_EDGES)
     ax.plot(centers, means, marker="o", linewidth=1.6, label="Observed Bad Outcome Rate")
     ax.plot([0, 1], [0, 1], linestyle="--", linewidth=1.0, label="Ideal y=x")
     ax.set_xlim(0, 1)
     ax.set_ylim(0, 1)
     setup_axes(ax, "Model Score", "Bad Outcome Rate (Refuted+Uncertain+Insufficient)")
     ax.legend(fontsize=9)
-    save_figure(fig, "fig06_calibration_bad_outcome_rate", generated)
 
-    # 7) Evidence source usage rates
-    fig, ax = plt.subplots(figsize=(8, 5), facecolor="white")
+
+def plot_evidence_source_usage_rates(ax: plt.Axes, data: Dict[str, Any]) -> None:
     total_claims = max(1, data["total_claims"])
     source_rates = [
         (data["source_claim_counter"].get(source, 0) / total_claims) * 100.0 for source in EVIDENCE_SOURCES
@@ -340,30 +414,28 @@ def main() -> None:
     for bar, value in zip(bars, source_rates):
         ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.2, f"{value:.1f}%", ha="center", va="bottom", fontsize=9)
     setup_axes(ax, "Evidence Source", "Claims Using Source (%)")
-    save_figure(fig, "fig07_evidence_source_usage_rates", generated)
-
-    # 8) Risk tier vs supported rate
-    fig, ax = plt.subplots(figsize=(8, 5), facecolor="white")
-    tier_to_rates: Dict[str, List[float]] = defaultdict(list)
-    for score, rate in zip(data["scores"], data["supported_rates"]):
-        tier_to_rates[risk_tier(score)].append(rate)
-    tier_supported = [mean(tier_to_rates[tier]) for tier in ["LOW", "MEDIUM", "HIGH"]]
-    bars = ax.bar(["LOW", "MEDIUM", "HIGH"], tier_supported, edgecolor="black", linewidth=0.8)
+
+
+def plot_risk_tier_vs_supported_rate(ax: plt.Axes, data: Dict[str, Any]) -> None:
+    tier_counts = data["tier_counts"]
+    tier_rate_sums = np.bincount(data["tier_idx"], weights=data["supported_rates"], minlength=len(RISK_TIERS))
+    tier_supported = np.divide(
+        tier_rate_sums, tier_counts, out=np.zeros(len(RISK_TIERS)), where=tier_counts > 0
+    ).tolist()
+    bars = ax.bar(RISK_TIERS, tier_supported, edgecolor="black", linewidth=0.8)
     for bar, value in zip(bars, tier_supported):
         ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.01, f"{value:.2f}", ha="center", va="bottom", fontsize=9)
     ax.set_ylim(0, 1)
     setup_axes(ax, "Risk Tier", "Average Supported Claim Rate")
-    save_figure(fig, "fig08_risk_tier_vs_supported_rate", generated)
 
-    # 9) Distribution of claims per document
-    fig, ax = plt.subplots(figsize=(8, 5), facecolor="white")
+
+def plot_claims_per_document_distribution(ax: plt.Axes, data: Dict[str, Any]) -> None:
     bins = min(12, max(4, len(set(data["claims_per_doc"])) or 4))
     ax.hist(data["claims_per_doc"], bins=bins, edgecolor="black", linewidth=0.8)
     setup_axes(ax, "Claims per Run", "Frequency")
-    save_figure(fig, "fig09_claims_per_document_distribution", generated)
 
-    # 10) Coverage with any evidence
-    fig, ax = plt.subplots(figsize=(8, 5), facecolor="white")
+
+def plot_claim_evidence_coverage(ax: plt.Axes, data: Dict[str, Any]) -> None:
     covered = data["claims_with_any_evidence"]
     uncovered = max(0, data["total_claims"] - covered)
     coverage_values = [covered, uncovered]
@@ -372,20 +444,18 @@ def main() -> None:
     for bar, value in zip(bars, coverage_values):
         ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.1, str(value), ha="center", va="bottom", fontsize=9)
     setup_axes(ax, "Coverage Category", "Claim Count")
-    save_figure(fig, "fig10_claim_evidence_coverage", generated)
 
-    # 11) Claims with contradictions
-    fig, ax = plt.subplots(figsize=(8, 5), facecolor="white")
+
+def plot_claim_contradiction_rate(ax: plt.Axes, data: Dict[str, Any]) -> None:
     contradicted = data["claims_with_contradiction"]
     not_contradicted = max(0, data["total_claims"] - contradicted)
     bars = ax.bar(["Contradicted", "Not Contradicted"], [contradicted, not_contradicted], edgecolor="black", linewidth=0.8)
     for bar, value in zip(bars, [contradicted, not_contradicted]):
         ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.1, str(value), ha="center", va="bottom", fontsize=9)
     setup_axes(ax, "Contradiction Status", "Claim Count")
-    save_figure(fig, "fig11_claim_contradiction_rate", generated)
 
-    # 12) Insufficient/uncertain rate split
-    fig, ax = plt.subplots(figsize=(8, 5), facecolor="white")
+
+def plot_insufficient_uncertain_split(ax: plt.Axes, data: Dict[str, Any]) -> None:
     group_labels: List[str] = []
     group_values: List[float] = []
     by_domain: Dict[str, List[float]] = defaultdict(list)
@@ -414,10 +484,9 @@ def main() -> None:
         ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.01, f"{value:.2f}", ha="center", va="bottom", fontsize=9)
     ax.set_ylim(0, 1)
     setup_axes(ax, xlabel, "Insufficient/Uncertain Rate")
-    save_figure(fig, "fig12_insufficient_uncertain_split", generated)
 
-    # 13) Runtime timings breakdown or latency proxy
-    fig, ax = plt.subplots(figsize=(8, 5), facecolor="white")
+
+def plot_runtime_breakdown_or_latency_proxy(ax: plt.Axes, data: Dict[str, Any]) -> None:
     if data["timings"]:
         phases = ["extract", "link", "retrieve", "verify", "aggregate", "total"]
         phase_means = []
@@ -428,54 +497,131 @@ def main() -> None:
         for bar, value in zip(bars, phase_means):
             ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.5, f"{value:.1f}", ha="center", va="bottom", fontsize=9)
         setup_axes(ax, "Pipeline Phase", "Average Runtime (ms)")
+        return
+
+    latencies = np.asarray(data["request_wall_ms"], dtype=float)
+    if latencies.size:
+        # "lower" keeps the nearest-rank-below p90 of the former sorted()[int(0.9 * (n - 1))]
+        metrics = {
+            "mean": float(latencies.mean()),
+            "p50": float(np.median(latencies)),
+            "p90": float(np.percentile(latencies, 90, method="lower")),
+        }
     else:
-        latencies = data["request_wall_ms"]
-        if latencies:
-            metrics = {
-                "mean": mean(latencies),
-                "p50": statistics.median(latencies),
-                "p90": sorted(latencies)[int(0.9 * (len(latencies) - 1))],
-            }
-        else:
-            metrics = {"mean": 0.0, "p50": 0.0, "p90": 0.0}
-        bars = ax.bar(list(metrics.keys()), list(metrics.values()), edgecolor="black", linewidth=0.8)
-        for bar, value in zip(bars, metrics.values()):
-            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.5, f"{value:.1f}", ha="center", va="bottom", fontsize=9)
-        setup_axes(ax, "Latency Proxy Metric", "Latency (ms)")
-    save_figure(fig, "fig13_runtime_breakdown_or_latency_proxy", generated)
-
-    # 14) Mode comparison if both modes exist, otherwise top entities
-    fig, ax = plt.subplots(figsize=(8, 5), facecolor="white")
-    scores_by_mode: Dict[str, List[float]] = defaultdict(list)
-    for mode, score in zip(data["modes"], data["scores"]):
-        scores_by_mode[mode].append(score)
-
-    if scores_by_mode.get("demo") and scores_by_mode.get("research"):
-        ax.hist(scores_by_mode["demo"], bins=10, alpha=0.6, edgecolor="black", linewidth=0.8, label="demo")
-        ax.hist(scores_by_mode["research"], bins=10, alpha=0.6, edgecolor="black", linewidth=0.8, label="research")
+        metrics = {"mean": 0.0, "p50": 0.0, "p90": 0.0}
+    bars = ax.bar(list(metrics.keys()), list(metrics.values()), edgecolor="black", linewidth=0.8)
+    for bar, value in zip(bars, metrics.values()):
+        ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.5, f"{value:.1f}", ha="center", va="bottom", fontsize=9)
+    setup_axes(ax, "Latency Proxy Metric", "Latency (ms)")
+
+
+def plot_mode_comparison_or_top_entities(ax: plt.Axes, data: Dict[str, Any]) -> None:
+    is_demo = np.asarray(data["modes"], dtype=str) == "demo"
+    n_demo = int(np.count_nonzero(is_demo))
+
+    if 0 < n_demo < len(is_demo):
+        score_edges = data["score_edges"]
+        # aggregate() maps every run to demo or research, so research is the remainder
+        demo_counts, _ = np.histogram(data["scores_arr"][is_demo], bins=score_edges)
+        mode_counts = {"demo": demo_counts, "research": data["score_counts"] - demo_counts}
+        for mode, counts in mode_counts.items():
+            ax.bar(
+                score_edges[:-1],
+                counts,
+                width=np.diff(score_edges),
+                align="edge",
+                alpha=0.6,
+                edgecolor="black",
+                linewidth=0.8,
+                label=mode,
+            )
         ax.set_xlim(0, 1)
         setup_axes(ax, "Hallucination Score", "Frequency")
         ax.legend(fontsize=9)
+        return
+
+    top_entities = data["entity_counter"].most_common(10)
+    if not top_entities:
+        top_entities = [("No entities", 0)]
+    labels = [item[0] for item in top_entities]
+    values = [item[1] for item in top_entities]
+    bars = ax.bar(labels, values, edgecolor="black", linewidth=0.8)
+    for tick in ax.get_xticklabels():
+        tick.set_rotation(35)
+        tick.set_ha("right")
+    for bar, value in zip(bars, values):
+        ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.1, str(value), ha="center", va="bottom", fontsize=8)
+    setup_axes(ax, "Entity", "Frequency")
+
+
+# (file stem, PNG dpi, plot function) for every summary figure
+FIGURES: List[Tuple[str, int, Callable[[plt.Axes, Dict[str, Any]], None]]] = [
+    ("fig01_claim_verdict_distribution", BAR_CHART_DPI, plot_claim_verdict_distribution),
+    ("fig02_risk_score_distribution", 300, plot_risk_score_distribution),
+    ("fig03_risk_tier_distribution", BAR_CHART_DPI, plot_risk_tier_distribution),
+    ("fig04_score_vs_supported_rate", 300, plot_score_vs_supported_rate),
+    ("fig05_score_vs_refuted_rate", 300, plot_score_vs_refuted_rate),
+    ("fig06_calibration_bad_outcome_rate", 300, plot_calibration_bad_outcome_rate),
+    ("fig07_evidence_source_usage_rates", BAR_CHART_DPI, plot_evidence_source_usage_rates),
+    ("fig08_risk_tier_vs_supported_rate", BAR_CHART_DPI, plot_risk_tier_vs_supported_rate),
+    ("fig09_claims_per_document_distribution", 300, plot_claims_per_document_distribution),
+    ("fig10_claim_evidence_coverage", BAR_CHART_DPI, plot_claim_evidence_coverage),
+    ("fig11_claim_contradiction_rate", BAR_CHART_DPI, plot_claim_contradiction_rate),
+    ("fig12_insufficient_uncertain_split", BAR_CHART_DPI, plot_insufficient_uncertain_split),
+    ("fig13_runtime_breakdown_or_latency_proxy", BAR_CHART_DPI, plot_runtime_breakdown_or_latency_proxy),
+    ("fig14_mode_comparison_or_top_entities", 300, plot_mode_comparison_or_top_entities),
+]
+
+_RENDER_FIG: Optional[plt.Figure] = None
+_RENDER_AX: Optional[plt.Axes] = None
+_RENDER_DATA: Dict[str, Any] = {}
+
+
+def _init_renderer(data: Dict[str, Any]) -> None:
+    """Per-process setup: the plot data plus one figure that every render reuses."""
+    global _RENDER_FIG, _RENDER_AX, _RENDER_DATA
+    plt.rcParams["font.family"] = "DejaVu Sans"
+    _RENDER_FIG, _RENDER_AX = plt.subplots(figsize=(8, 5), facecolor="white")
+    _RENDER_DATA = data
+
+
+def render_figure(index: int) -> List[str]:
+    stem, dpi, plot = FIGURES[index]
+    reset_axes(_RENDER_AX)
+    plot(_RENDER_AX, _RENDER_DATA)
+    generated: List[str] = []
+    save_figure(_RENDER_FIG, stem, generated, dpi=dpi)
+    return generated
+
+
+def main() -> None:
+    # Re-rendering every figure is the slow part; skip it when neither the
+    # dataset nor this script changed since the last run (EPI_FIGURES_FORCE=1 overrides)
+    signature = figures_signature(DATASET_PATH)
+    if os.getenv("EPI_FIGURES_FORCE", "0") != "1":
+        cached = load_cached_figures(signature)
+        if cached is not None:
+            print("CACHE: dataset unchanged, keeping existing figures")
+            print_generated(cached)
+            return
+
+    records = load_jsonl(DATASET_PATH)
+    data = prepare_plot_data(aggregate(records))
+    workers = max(1, int(os.getenv("EPI_FIGURE_WORKERS", str(min(8, os.cpu_count() or 1)))))
+
+    # Figures only depend on the aggregated data, so they render independently;
+    # each worker receives the data once and reuses its own figure
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_renderer, initargs=(data,)) as executor:
+            rendered = list(executor.map(render_figure, range(len(FIGURES))))
     else:
-        top_entities = data["entity_counter"].most_common(10)
-        if not top_entities:
-            top_entities = [("No entities", 0)]
-        labels = [item[0] for item in top_entities]
-        values = [item[1] for item in top_entities]
-        bars = ax.bar(labels, values, edgecolor="black", linewidth=0.8)
-        for tick in ax.get_xticklabels():
-            tick.set_rotation(35)
-            tick.set_ha("right")
-        for bar, value in zip(bars, values):
-            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.1, str(value), ha="center", va="bottom", fontsize=8)
-        setup_axes(ax, "Entity", "Frequency")
-    save_figure(fig, "fig14_mode_comparison_or_top_entities", generated)
+        _init_renderer(data)
+        rendered = [render_figure(index) for index in range(len(FIGURES))]
+        plt.close(_RENDER_FIG)
+    generated = [filename for files in rendered for filename in files]
 
-    print(f"DATASET: {DATASET_PATH}")
-    print(f"FIGURES_DIR: {FIGURES_DIR}")
-    print("GENERATED_FILES:")
-    for filename in sorted(generated):
-        print(filename)
+    write_figures_cache(signature, generated)
+    print_generated(generated)
 
 
 if __name__ == "__main__":
@@ -4,13 +4,17 @@
 from __future__ import annotations
 
 import json
-import math
 from pathlib import Path
 from typing import Any
 
 import matplotlib.pyplot as plt
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 ROOT = Path(__file__).resolve().parents[2]
 DATA_PATH = ROOT / "paper" / "data" / "audit_runs.jsonl"
@@ -66,16 +70,26 @@ def extract_claim_verdict(claim: dict[str, Any]) -> str | None:
     return None
 
 
+def parse_json_line(line: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity tokens and oversized ints; json accepts them
+            pass
+    return json.loads(line)
+
+
 def parse_runs_from_jsonl(path: Path) -> list[tuple[float, float, int, int]]:
     parsed: list[tuple[float, float, int, int]] = []
 
-    with path.open("r", encoding="utf-8") as f:
-        for line_num, line in enumerate(f, start=1):
+    with path.open("rb") as f:
+        for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
-                obj = json.loads(line)
+                obj = parse_json_line(line)
             except json.JSONDecodeError:
                 continue
             if not isinstance(obj, dict):
@@ -126,23 +140,23 @@ def generate_synthetic_runs(n: int = 250, seed: int = 7) -> list[tuple[float, fl
     return runs
 
 
-def wilson_interval(successes: int, total: int, z: float = 1.96) -> tuple[float, float]:
-    if total <= 0:
-        return (0.0, 0.0)
+def wilson_interval(
+    successes: np.ndarray, total: np.ndarray, z: float = 1.96
+) -> tuple[np.ndarray, np.ndarray]:
+    """Elementwise Wilson score interval; entries with no trials get (0, 0)."""
+    successes = np.asarray(successes, dtype=float)
+    total = np.asarray(total, dtype=float)
+    has_trials = total > 0
+    total = np.where(has_trials, total, 1.0)
 
     phat = successes / total
     z2 = z * z
     denom = 1.0 + z2 / total
     center = (phat + z2 / (2.0 * total)) / denom
-    margin = (z / denom) * math.sqrt((phat * (1.0 - phat) / total) + (z2 / (4.0 * total * total)))
-    return (clamp01(center - margin), clamp01(center + margin))
-
-
-def bin_index(score: float, n_bins: int) -> int:
-    if score >= 1.0:
-        return n_bins - 1
-    idx = int(score * n_bins)
-    return max(0, min(n_bins - 1, idx))
+    margin = (z / denom) * np.sqrt((phat * (1.0 - phat) / total) + (z2 / (4.0 * total * total)))
+    lo = np.where(has_trials, np.clip(center - margin, 0.0, 1.0), 0.0)
+    hi = np.where(has_trials, np.clip(center + margin, 0.0, 1.0), 0.0)
+    return lo, hi
 
 
 def build_plot_data(
@@ -151,40 +165,27 @@ def build_plot_data(
     bin_edges = np.linspace(0.0, 1.0, n_bins + 1)
     centers = (bin_edges[:-1] + bin_edges[1:]) / 2.0
 
-    run_rate_lists: list[list[float]] = [[] for _ in range(n_bins)]
-    pooled_supported = [0 for _ in range(n_bins)]
-    pooled_total = [0 for _ in range(n_bins)]
-    run_counts = [0 for _ in range(n_bins)]
-
-    total_supported_all = 0
-    total_claims_all = 0
+    scores, run_rates, supported, total = np.asarray(runs, dtype=float).reshape(-1, 4).T
+    # int() truncation per score, with 1.0 (and anything past it) in the last bin
+    idx = np.clip((scores * n_bins).astype(np.int64), 0, n_bins - 1)
 
-    for score, run_rate, supported, total in runs:
-        i = bin_index(score, n_bins)
-        run_rate_lists[i].append(run_rate)
-        pooled_supported[i] += supported
-        pooled_total[i] += total
-        run_counts[i] += 1
-
-        total_supported_all += supported
-        total_claims_all += total
+    run_counts = np.bincount(idx, minlength=n_bins)
+    rate_sums = np.bincount(idx, weights=run_rates, minlength=n_bins)
+    pooled_supported = np.bincount(idx, weights=supported, minlength=n_bins)
+    pooled_total = np.bincount(idx, weights=total, minlength=n_bins)
 
     mean_rates = np.full(n_bins, np.nan, dtype=float)
-    yerr_low = np.zeros(n_bins, dtype=float)
-    yerr_high = np.zeros(n_bins, dtype=float)
-
-    for i in range(n_bins):
-        if run_rate_lists[i]:
-            mean_rate = float(np.mean(run_rate_lists[i]))
-            mean_rates[i] = clamp01(mean_rate)
+    occupied = run_counts > 0
+    mean_rates[occupied] = np.clip(rate_sums[occupied] / run_counts[occupied], 0.0, 1.0)
 
-            lo, hi = wilson_interval(pooled_supported[i], pooled_total[i])
-            yerr_low[i] = max(0.0, mean_rates[i] - lo)
-            yerr_high[i] = max(0.0, hi - mean_rates[i])
+    lo, hi = wilson_interval(pooled_supported, pooled_total)
+    yerr_low = np.where(occupied, np.maximum(0.0, mean_rates - lo), 0.0)
+    yerr_high = np.where(occupied, np.maximum(0.0, hi - mean_rates), 0.0)
 
-    overall_rate = (total_supported_all / total_claims_all) if total_claims_all > 0 else 0.0
+    total_claims_all = total.sum()
+    overall_rate = (supported.sum() / total_claims_all) if total_claims_all > 0 else 0.0
 
-    return centers, mean_rates, yerr_low, yerr_high, clamp01(overall_rate), run_counts
+    return centers, mean_rates, yerr_low, yerr_high, clamp01(float(overall_rate)), run_counts.tolist()
 
 
 def main() -> int:
@@ -0,0 +1,106 @@
+"""
+Tests for the downgrade tracer's batched evidence-eligibility scan.
+
+evidence_eligibility must agree, evidence by evidence, with the per-item rule:
+eligible iff subject and predicate match and a TEMPORAL claim has a temporal match.
+"""
+
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+
+from evaluation.downgrade_tracer import PhaseTrace, evidence_eligibility, trace_claim
+
+
+def _evidence(ev_id, subject=True, predicate=True, temporal="absent"):
+    alignment = {"subject_match": subject, "predicate_match": predicate}
+    if temporal != "absent":
+        alignment["temporal_match"] = temporal
+    return {"evidence_id": ev_id, "alignment": alignment}
+
+
+def _claim(claim_type="FACTUAL", wikidata=(), wikipedia=(), verdict="UNCERTAIN"):
+    return {
+        "claim_text": "Apple was founded in 1976.",
+        "claim_type": claim_type,
+        "subject_entity": {"resolution_status": "RESOLVED", "entity_id": "Q312"},
+        "evidence": {"wikidata": list(wikidata), "wikipedia": list(wikipedia)},
+        "verification": {"verdict": verdict, "confidence": 0.5},
+    }
+
+
+def _expected(claim):
+    is_temporal = claim["claim_type"] == "TEMPORAL"
+    ids, eligible = [], []
+    for source in ("wikidata", "wikipedia"):
+        for ev in claim["evidence"].get(source, ()):
+            a = ev.get("alignment") or {}
+            ids.append(ev.get("evidence_id", "?"))
+            eligible.append(
+                bool(a.get("subject_match")) and bool(a.get("predicate_match"))
+                and not (is_temporal and a.get("temporal_match") is None)
+            )
+    return ids, eligible
+
+
+CLAIMS = [
+    _claim(wikidata=[_evidence("wd1"), _evidence("wd2", subject=False)],
+           wikipedia=[_evidence("wp1", predicate=False)]),
+    _claim(),
+    _claim("TEMPORAL", wikidata=[_evidence("wd3", temporal=None), _evidence("wd4", temporal=True),
+                                 _evidence("wd5")]),
+    _claim(wikipedia=[{"alignment": None}, {"evidence_id": "wp2"}]),
+    _claim("TEMPORAL", wikipedia=[_evidence("wp3", temporal=False)]),
+]
+
+
+class TestEvidenceEligibility:
+    """Batched eligibility matches the per-evidence rule and per-claim calls."""
+
+    def test_matches_per_evidence_rule(self):
+        batch = evidence_eligibility(CLAIMS)
+        assert len(batch) == len(CLAIMS)
+        for claim, (ev_ids, flags, eligible) in zip(CLAIMS, batch):
+            exp_ids, exp_eligible = _expected(claim)
+            assert ev_ids == exp_ids
+            assert len(flags) == len(ev_ids)
+            assert [bool(e) for e in eligible] == exp_eligible
+
+    def test_batch_matches_single_claim_calls(self):
+        for claim, (ev_ids, flags, eligible) in zip(CLAIMS, evidence_eligibility(CLAIMS)):
+            s_ids, s_flags, s_eligible = evidence_eligibility([claim])[0]
+            assert ev_ids == s_ids
+            assert flags.tolist() == s_flags.tolist()
+            assert eligible.tolist() == s_eligible.tolist()
+
+    def test_empty_inputs(self):
+        assert evidence_eligibility([]) == []
+        ev_ids, flags, eligible = evidence_eligibility([_claim()])[0]
+        assert ev_ids == [] and len(flags) == 0 and len(eligible) == 0
+
+    def test_trace_claim_same_with_precomputed_eligibility(self):
+        for claim, eligibility in zip(CLAIMS, evidence_eligibility(CLAIMS)):
+            assert (trace_claim(claim, eligibility=eligibility).to_dict()
+                    == trace_claim(claim).to_dict())
+
+
+class TestPhaseTraceEquality:
+    """Lazy details take no part in equality or repr until resolved."""
+
+    def test_identical_traces_equal_before_details_read(self):
+        for claim in CLAIMS:
+            assert trace_claim(claim) == trace_claim(claim)
+            assert trace_claim(claim, detailed=False) == trace_claim(claim, detailed=False)
+
+    def test_lazy_equals_eager(self):
+        lazy = PhaseTrace("1_extraction", "PASS", _builder=lambda: {"subject": "Apple"})
+        eager = PhaseTrace("1_extraction", "PASS", {"subject": "Apple"})
+        assert lazy == eager
+        assert lazy != PhaseTrace("1_extraction", "PASS", {"subject": "Google"})
+
+    def test_repr_omits_builder(self):
+        trace = trace_claim(CLAIMS[0])
+        assert "lambda" not in repr(trace)
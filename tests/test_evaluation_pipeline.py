@@ -0,0 +1,58 @@
+"""
+Tests for EvaluationPipeline metrics.
+
+Verdicts outside the four reported labels must each count as their own class
+in the macro averages, as sklearn's precision_recall_fscore_support does.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from evaluation_pipeline import EvaluationPipeline
+
+
+def _record(verdict):
+    return {"verification": {"verdict": verdict}}
+
+
+def _evaluate(gold, pred):
+    return EvaluationPipeline().evaluate_predictions([_record(v) for v in pred], [_record(v) for v in gold])
+
+
+class TestEvaluationPipelineMetrics:
+    def test_distinct_unknown_verdicts_are_not_a_match(self):
+        """Gold UNKNOWN vs predicted PARTIALLY_SUPPORTED is a miss, not a shared 'other' hit."""
+        result = _evaluate(["SUPPORTED", "UNKNOWN"], ["SUPPORTED", "PARTIALLY_SUPPORTED"])
+
+        metrics = result["metrics"]
+        assert metrics["precision_macro"] == pytest.approx(1 / 3)
+        assert metrics["recall_macro"] == pytest.approx(1 / 3)
+        assert metrics["f1_macro"] == pytest.approx(1 / 3)
+
+    def test_matching_unknown_verdicts_count_as_true_positive(self):
+        result = _evaluate(["PARTIALLY_SUPPORTED", "REFUTED"], ["PARTIALLY_SUPPORTED", "REFUTED"])
+
+        assert result["metrics"]["f1_macro"] == pytest.approx(1.0)
+
+    def test_confusion_matrix_covers_only_reported_labels(self):
+        result = _evaluate(
+            ["SUPPORTED", "REFUTED", "UNKNOWN", "UNCERTAIN"],
+            ["SUPPORTED", "UNCERTAIN", "SUPPORTED", "PARTIALLY_SUPPORTED"],
+        )
+
+        assert result["confusion_matrix"]["labels"] == ["SUPPORTED", "REFUTED", "UNCERTAIN", "INSUFFICIENT_EVIDENCE"]
+        assert result["confusion_matrix"]["matrix"] == [
+            [1, 0, 0, 0],
+            [0, 0, 1, 0],
+            [0, 0, 0, 0],
+            [0, 0, 0, 0],
+        ]
+
+    def test_empty_input_scores_zero(self):
+        result = _evaluate([], [])
+
+        assert result["metrics"] == {"precision_macro": 0.0, "recall_macro": 0.0, "f1_macro": 0.0}
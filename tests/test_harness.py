@@ -0,0 +1,236 @@
+"""
+Tests for the evaluation harness.
+
+Runners are plain functions returning canned audit results, so no models are
+loaded; EvaluationHarness only builds its AuditPipeline on first use.
+"""
+
+import io
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from evaluation import harness
+from evaluation.harness import EvaluationHarness, _dumps_report, evaluate_case
+
+
+def _claim(verdict, confidence=0.9, hallucinations=()):
+    return {
+        "claim_text": "Paris is the capital of France.",
+        "claim_type": "FACTUAL",
+        "verification": {"verdict": verdict, "confidence": confidence},
+        "hallucinations": [{"hallucination_type": h} for h in hallucinations],
+    }
+
+
+RESULTS = {
+    "Paris is the capital of France.": {
+        "claims": [_claim("SUPPORTED")],
+        "overall_risk": "LOW",
+        "hallucination_score": 0.0,
+    },
+    "Zürich is the capital of Switzerland.": {
+        "claims": [_claim("REFUTED", 0.2, ("H1", "H5")), _claim("UNCERTAIN", 0.4)],
+        "overall_risk": "HIGH",
+        "hallucination_score": 0.8,
+    },
+}
+
+
+def _runner(text):
+    if text not in RESULTS:
+        raise RuntimeError(f"no canned result for {text!r}")
+    return RESULTS[text]
+
+
+CASES = [
+    {
+        "case_id": "SUPPORT_01",
+        "category": "verdict_supported",
+        "input_text": "Paris is the capital of France.",
+        "expected": {"verdict": "SUPPORTED", "risk_level": "LOW"},
+    },
+    {
+        "case_id": "REFUTE_01",
+        "category": "verdict_refuted",
+        "input_text": "Zürich is the capital of Switzerland.",
+        "expected": {
+            "verdict": "SUPPORTED",
+            "hallucination_types": ["H1", "H2"],
+            "risk_level": "LOW",
+            "claims_count": 1,
+        },
+    },
+    {
+        "case_id": "ERROR_01",
+        "category": "errors",
+        "input_text": "Unknown input – “quoted”.",
+        "expected": {"verdict": "SUPPORTED"},
+    },
+]
+
+
+@pytest.fixture
+def golden_harness(tmp_path):
+    path = tmp_path / "golden_cases.json"
+    path.write_text(json.dumps({"metadata": {}, "cases": CASES}), encoding="utf-8")
+    h = EvaluationHarness(path, workers=1)
+    assert h._pipeline is None
+    return h
+
+
+class TestWriteReport:
+    """write_report must stream exactly the bytes of the in-memory report."""
+
+    def _check(self, h, results):
+        buf = io.BytesIO()
+        h.write_report(results, buf)
+        report = h.generate_report(results)
+        assert buf.getvalue() == _dumps_report(report)
+        # Summary sections lead, detailed_results closes the report
+        assert list(json.loads(buf.getvalue())) == list(report)
+        assert list(report)[0] == "summary"
+        assert list(report)[-1] == "detailed_results"
+
+    def test_matches_generate_report(self, golden_harness):
+        results = [evaluate_case(_runner, case) for case in CASES]
+        self._check(golden_harness, results)
+
+    def test_single_result(self, golden_harness):
+        self._check(golden_harness, [evaluate_case(_runner, CASES[0])])
+
+    def test_empty_results(self, golden_harness):
+        self._check(golden_harness, [])
+
+    def test_keys_keep_insertion_order(self, golden_harness):
+        result = evaluate_case(_runner, CASES[1])
+        assert list(json.loads(_dumps_report(result.to_dict()))) == list(result.to_dict())
+
+    def test_json_fallback_matches_orjson(self, golden_harness, monkeypatch):
+        results = [evaluate_case(_runner, case) for case in CASES]
+        expected = _dumps_report(golden_harness.generate_report(results))
+        monkeypatch.setattr(harness, "orjson", None)
+        assert _dumps_report(golden_harness.generate_report(results)) == expected
+        self._check(golden_harness, results)
+
+
+class TestEarlyExit:
+    """early_exit stops at the first failing check without changing pass/fail."""
+
+    def test_failing_case_reports_first_error_only(self):
+        full = evaluate_case(_runner, CASES[1])
+        short = evaluate_case(_runner, CASES[1], early_exit=True)
+        assert not full.passed and not short.passed
+        assert len(full.errors) > 1
+        assert short.errors == full.errors[:1]
+
+    def test_passing_case_unchanged(self):
+        assert evaluate_case(_runner, CASES[0], early_exit=True) == evaluate_case(_runner, CASES[0])
+
+    def test_pipeline_exception(self):
+        result = evaluate_case(_runner, CASES[2], early_exit=True)
+        assert not result.passed
+        assert result.errors[0].startswith("Pipeline exception:")
+
+
+class TestHarnessRuns:
+    """Single-worker runs stay in-process and reuse cached pipeline results."""
+
+    def test_cached_run_in_process(self, golden_harness):
+        calls = []
+
+        class _Pipeline:
+            def run(self, text):
+                calls.append(text)
+                return _runner(text)
+
+        golden_harness._pipeline = _Pipeline()
+        results = golden_harness.run_all()
+        assert [r.case_id for r in results] == [c["case_id"] for c in CASES]
+        assert [r.passed for r in results] == [True, False, False]
+        assert golden_harness.run_case("SUPPORT_01").passed
+        assert len(calls) == len(CASES)
+
+    def test_pool_size_capped_by_tasks(self, tmp_path):
+        path = tmp_path / "golden_cases.json"
+        path.write_text(json.dumps({"cases": []}), encoding="utf-8")
+        h = EvaluationHarness(path, workers=8)
+        assert h._pool_size(3) == 3
+        assert h._pool_size(20) == 8
+        assert h._pool_size(0) == 1
+
+
+class _UnpicklableError(Exception):
+    def __init__(self):
+        super().__init__("socket closed")
+        self.handle = lambda: None
+
+
+class _InlineExecutor:
+    """Stand-in for ProcessPoolExecutor that maps in the calling process."""
+
+    def __init__(self, max_workers=None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def map(self, fn, items):
+        return map(fn, items)
+
+
+class TestRunFailures:
+    """Pipeline failures cross the pool as plain records and are never cached."""
+
+    def test_run_worker_returns_error_record(self, monkeypatch):
+        class _Failing:
+            def run(self, text):
+                raise _UnpicklableError()
+
+        monkeypatch.setattr(harness, "_WORKER_PIPELINE", _Failing())
+        assert harness._run_worker("text") == (None, "socket closed")
+        monkeypatch.setattr(harness, "_WORKER_PIPELINE", type("_Ok", (), {"run": lambda self, t: {"claims": []}})())
+        assert harness._run_worker("text") == ({"claims": []}, None)
+
+    def test_cached_run_retries_failures(self, golden_harness):
+        outcomes = [RuntimeError("timeout"), RESULTS[CASES[0]["input_text"]]]
+
+        class _Flaky:
+            def run(self, text):
+                outcome = outcomes.pop(0)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+
+        golden_harness._pipeline = _Flaky()
+        text = CASES[0]["input_text"]
+        with pytest.raises(RuntimeError):
+            golden_harness._cached_run(text)
+        assert text not in golden_harness._run_cache
+        assert golden_harness._cached_run(text) is RESULTS[text]
+        assert golden_harness._cached_run(text) is RESULTS[text]
+
+    def test_pool_failure_fails_only_its_cases(self, golden_harness, monkeypatch):
+        monkeypatch.setattr(harness, "ProcessPoolExecutor", _InlineExecutor)
+
+        class _Pipeline:
+            def run(self, text):
+                if text == CASES[1]["input_text"]:
+                    raise _UnpicklableError()
+                return _runner(text)
+
+        monkeypatch.setattr(harness, "_WORKER_PIPELINE", _Pipeline())
+        golden_harness.workers = 4
+        results = golden_harness.run_all()
+        assert [r.passed for r in results] == [True, False, False]
+        assert results[1].errors == ["Pipeline exception: socket closed"]
+        assert CASES[1]["input_text"] not in golden_harness._run_cache
+        assert CASES[0]["input_text"] in golden_harness._run_cache
+        assert golden_harness._pipeline is None